@@ -5,10 +5,213 @@ Yoğunluk 0.0-1.0 arasında olup, orijinal ile filtrelenmiş görüntü
 arasında doğrusal enterpolasyon (blending) yapılır.
 """
 
+import functools
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import cv2
 import numpy as np
 
 
+# ─── Sabit Dönüşüm Matrisleri ve Çekirdekler ──────────────────────────
+# Her çağrıda yeniden oluşturulmamaları için modül yüklenirken bir kez hazırlanır.
+
+# Sepya dönüşüm matrisi (BGR formatında)
+_SEPIA_MATRIX = np.array([
+    [0.272, 0.534, 0.131],
+    [0.349, 0.686, 0.168],
+    [0.393, 0.769, 0.189]
+], dtype=np.float32)
+
+# Vintage filtresinin hafif sepya tonu (BGR formatında)
+_VINTAGE_MATRIX = np.array([
+    [0.30, 0.52, 0.15],
+    [0.35, 0.67, 0.17],
+    [0.38, 0.74, 0.19]
+], dtype=np.float32)
+
+# Kabartma çekirdeği (kernel)
+_EMBOSS_KERNEL = np.array([[-2, -1, 0],
+                           [-1,  1, 1],
+                           [ 0,  1, 2]], dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=32)
+def _channel_shift_lut(b_shift: float, g_shift: float, r_shift: float) -> np.ndarray:
+    """
+    Kanal bazlı sabit kaydırma için 3 kanallı arama tablosu (LUT) üretir.
+    Sonuç (256, 1, 3) boyutlu uint8 dizidir; cv2.LUT ile tek geçişte uygulanır.
+    Önbellekte paylaşıldığı için salt-okunur olarak işaretlenir.
+    """
+    base = np.arange(256, dtype=np.float32)
+    lut = np.empty((256, 1, 3), dtype=np.uint8)
+    lut[:, 0, 0] = np.clip(base + b_shift, 0, 255).astype(np.uint8)
+    lut[:, 0, 1] = np.clip(base + g_shift, 0, 255).astype(np.uint8)
+    lut[:, 0, 2] = np.clip(base + r_shift, 0, 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+@functools.lru_cache(maxsize=16)
+def _posterize_lut(levels: int) -> np.ndarray:
+    """
+    Belirtilen seviye sayısı için posterize arama tablosunu (LUT) üretir.
+    Hesap uint16 üzerinde yapılır; böylece üst kovada taşma olmaz.
+    """
+    step = 256 // levels
+    lut = (np.arange(256, dtype=np.uint16) // step) * step + step // 2
+    lut = np.clip(lut, 0, 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+# Vinyet gücü bu adımla kuantize edilir; slider sürüklenirken önbellek isabeti sağlar
+_MASK_STRENGTH_STEP = 0.02
+
+# Vinyet maskesi kullanan filtreler (maske önbelleğini atlamak için cache alır)
+_MASK_FILTERS = frozenset(("vintage", "vignette", "dramatic"))
+
+
+def _radial_mask(h: int, w: int, strength: float, blur: bool = False) -> np.ndarray:
+    """
+    Merkezden kenarlara doğru kararan tek kanallı radyal vinyet maskesi
+    üretir. Dizi salt-okunurdur (önbellekte paylaşılabilir).
+    blur=True ise maske, görüntü boyutuna oranlı Gaussian ile yumuşatılır.
+    """
+    center_x, center_y = w // 2, h // 2
+    # Mesafe haritası baştan sona float32 (int64 ızgara yerine)
+    dx = np.arange(w, dtype=np.float32) - center_x
+    dy = np.arange(h, dtype=np.float32) - center_y
+    dist = cv2.sqrt(dy[:, None] ** 2 + dx[None, :] ** 2)
+    max_dist = np.float32(np.sqrt(center_x ** 2 + center_y ** 2))
+
+    # Merkez = 1, kenarlar = 1 - strength
+    mask = 1 - (dist / max_dist) * np.float32(strength)
+    np.clip(mask, 0, 1, out=mask)
+    if blur:
+        mask = cv2.GaussianBlur(mask, (0, 0), max(w, h) * 0.05)
+    mask.flags.writeable = False
+    return mask
+
+
+# Önizleme boyutunda tek kanallı maske ~8 MB; sürüklenen slider ve filtre
+# değişimi için birkaç kayıt yeterli
+_cached_radial_mask = functools.lru_cache(maxsize=4)(_radial_mask)
+
+
+def _get_radial_mask(h: int, w: int, strength: float, blur: bool = False,
+                     cache: bool = True) -> np.ndarray:
+    """
+    Vinyet gücünü kuantize ederek maskeyi döndürür. cache=False ile
+    (tam çözünürlüklü işlemlerde) maske önbelleğe alınmadan üretilir.
+    """
+    bucket = round(round(strength / _MASK_STRENGTH_STEP) * _MASK_STRENGTH_STEP, 4)
+    if not cache:
+        return _radial_mask(h, w, bucket, blur)
+    return _cached_radial_mask(h, w, bucket, blur)
+
+
+# Vinyet maskesini renk adımıyla eşzamanlı hazırlayan arka plan iş parçacığı.
+# OpenCV/NumPy çağrıları GIL'i bıraktığı için iki iş gerçekten örtüşür.
+_MASK_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pf-mask")
+
+
+def _submit_radial_mask(h: int, w: int, strength: float, blur: bool = False,
+                        cache: bool = True) -> Future:
+    """Radyal maskeyi arka planda hazırlamaya başlar."""
+    return _MASK_EXECUTOR.submit(_get_radial_mask, h, w, strength, blur, cache)
+
+
+# Bu yoğunluğun altında edge_detect, Canny yerine Sobel büyüklüğü kullanır
+_SOBEL_EDGE_MAX_INTENSITY = 0.25
+
+# Bu çekirdek boyutunun üzerinde Gaussian, ardışık kutu filtreleriyle yaklaşıklanır
+_FAST_GAUSSIAN_MIN_KSIZE = 15
+
+
+@functools.lru_cache(maxsize=64)
+def _box_sizes_for_gauss(sigma: float, passes: int = 3) -> tuple[int, ...]:
+    """
+    Verilen sigma'lı Gaussian'ı yaklaşıklayan ardışık kutu filtre boyutlarını
+    hesaplar (Ivan Kutskir "Fastest Gaussian blur" yöntemi).
+    Döndürülen boyutların hepsi tek sayıdır.
+    """
+    w_ideal = np.sqrt(12 * sigma * sigma / passes + 1)
+    wl = int(np.floor(w_ideal))
+    if wl % 2 == 0:
+        wl -= 1
+    wu = wl + 2
+    m_ideal = (12 * sigma * sigma - passes * wl * wl - 4 * passes * wl - 3 * passes) / (-4 * wl - 4)
+    m = int(round(m_ideal))
+    return tuple(wl if i < m else wu for i in range(passes))
+
+
+class _BufferPool:
+    """
+    Ara sonuçlar için (boyut, dtype, yuva) başına yeniden kullanılan tamponlar.
+    Etkileşimli düzenlemede görüntü boyutu sabit kaldığından her slider
+    adımında büyük dizilerin ayrılıp serbest bırakılması önlenir.
+    Tamponlar iş parçacığı başınadır (önizleme işçisi ve ana iş parçacığı
+    aynı anda filtre çalıştırabilir). Yalnızca filtre içindeki geçici
+    değerler için kullanılmalı; döndürülen sonuç asla havuzdan gelmemelidir.
+    """
+
+    # Farklı boyutlar birikirse (önizleme + tam çözünürlük) havuz sıfırlanır
+    _MAX_BUFFERS = 16
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def get(self, shape: tuple, dtype=np.uint8, slot: int = 0) -> np.ndarray:
+        """İstenen boyutta (içeriği tanımsız) bir geçici tampon döndürür."""
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None:
+            buffers = self._local.buffers = {}
+        key = (tuple(shape), np.dtype(dtype), slot)
+        buf = buffers.get(key)
+        if buf is None:
+            if len(buffers) >= self._MAX_BUFFERS:
+                buffers.clear()
+            buf = buffers[key] = np.empty(shape, dtype=dtype)
+        return buf
+
+
+_POOL = _BufferPool()
+
+
+def _apply_mask(image: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    uint8 görüntüyü tek kanallı float32 maske ile kanal kanal çarpar ve
+    uint8'e doyurur. Maske 3 kanala kopyalanmaz; ara float32 dizi oluşmaz.
+    """
+    return cv2.merge([cv2.multiply(channel, mask, dtype=cv2.CV_8U)
+                      for channel in cv2.split(image)])
+
+
+# Slider sürüklenirken aynı girdi/yoğunluk için sonucu yeniden hesaplamamak
+# amacıyla tutulan son filtre sonuçlarının sayısı
+_RESULT_CACHE_SIZE = 8
+
+
+def _scale_saturation(image: np.ndarray, factor: float) -> np.ndarray:
+    """
+    HSV gidiş-dönüşü olmadan doygunluğu factor ile ölçekler.
+    HSV'de S'yi ölçeklemek (ton ve V sabitken) her kanalı en parlak kanala
+    (V = max(b, g, r)) göre ölçeklemeye eşdeğerdir:
+        c' = factor * c + (1 - factor) * V
+    Tüm adımlar uint8 üzerinde doygun (saturating) çalışır; float32 HSV
+    tamponu gerekmez. factor > 1 iken alt sınırdaki kırpılma, HSV'deki
+    S = 255 kırpılmasına yakın sonuç verir.
+    """
+    b, g, r = cv2.split(image)
+    value = cv2.max(b, g, dst=b)
+    value = cv2.max(value, r, dst=value)
+    value_bgr = cv2.merge((value, value, value), _POOL.get(image.shape, slot=1))
+    return cv2.addWeighted(image, factor, value_bgr, 1 - factor, 0)
+
+
 class FilterEngine:
     """
     Statik filtre metotları içeren ana filtre motoru.
@@ -16,6 +219,14 @@ class FilterEngine:
     Intensity = 0.0 → Orijinal, Intensity = 1.0 → Tam filtre etkisi.
     """
 
+    # (veri adresi, boyut, filtre, yoğunluk) → (girdiye zayıf referans, sonuç)
+    _result_cache: OrderedDict = OrderedDict()
+    # Önizleme worker'ı, arka plan kaydetme ve UI thread'i (clear_cache)
+    # önbelleğe aynı anda erişebilir
+    _result_lock = threading.Lock()
+    # Filtre adı → metot tablosu (sınıf tanımının sonunda doldurulur)
+    _FILTER_MAP: dict = {}
+
     @staticmethod
     def _blend(original: np.ndarray, filtered: np.ndarray, intensity: float) -> np.ndarray:
         """
@@ -28,6 +239,20 @@ class FilterEngine:
             return filtered
         return cv2.addWeighted(original, 1.0 - intensity, filtered, intensity, 0)
 
+    @staticmethod
+    def _blend_gray(original: np.ndarray, gray: np.ndarray, intensity: float) -> np.ndarray:
+        """
+        Tek kanallı filtre sonucunu renkli orijinalle karıştırır.
+        Gri sonuç, dönüşüm tablosu kullanan cvtColor yerine yalnızca en
+        sonda ve tek bir cv2.merge ile 3 kanala genişletilir.
+        """
+        if intensity <= 0.0:
+            return original.copy()
+        gray_bgr = cv2.merge((gray, gray, gray))
+        if intensity >= 1.0:
+            return gray_bgr
+        return cv2.addWeighted(original, 1.0 - intensity, gray_bgr, intensity, 0)
+
     @staticmethod
     def gaussian_blur(image: np.ndarray, intensity: float) -> np.ndarray:
         """
@@ -39,7 +264,19 @@ class FilterEngine:
         # Çekirdek boyutunu yoğunluğa göre ayarla (1-51 arası, tek sayı olmalı)
         ksize = int(intensity * 50) | 1  # Bitwise OR ile tek sayı garantisi
         ksize = max(1, min(ksize, 51))
-        blurred = cv2.GaussianBlur(image, (ksize, ksize), 0)
+        if ksize > _FAST_GAUSSIAN_MIN_KSIZE:
+            # Büyük çekirdeklerde 3 ardışık kutu filtresi (O(k²) yerine sabit maliyet)
+            # OpenCV'nin ksize'dan türettiği sigma ile aynı formül kullanılır
+            sigma = 0.3 * ((ksize - 1) * 0.5 - 1) + 0.8
+            boxes = _box_sizes_for_gauss(sigma)
+            blurred = image
+            # Ara geçişler havuzdaki iki tampon arasında gidip gelir
+            for i, box in enumerate(boxes[:-1]):
+                blurred = cv2.blur(blurred, (box, box),
+                                   dst=_POOL.get(image.shape, slot=i % 2))
+            blurred = cv2.blur(blurred, (boxes[-1], boxes[-1]))
+        else:
+            blurred = cv2.GaussianBlur(image, (ksize, ksize), 0)
         return FilterEngine._blend(image, blurred, intensity)
 
     @staticmethod
@@ -77,7 +314,7 @@ class FilterEngine:
         if intensity <= 0:
             return image.copy()
         # Gaussian bulanıklık ile orijinal arasındaki farkı kullanarak keskinleştir
-        gaussian = cv2.GaussianBlur(image, (0, 0), 3)
+        gaussian = cv2.GaussianBlur(image, (0, 0), 3, dst=_POOL.get(image.shape))
         sharpened = cv2.addWeighted(image, 1.5, gaussian, -0.5, 0)
         return FilterEngine._blend(image, sharpened, intensity)
 
@@ -92,9 +329,9 @@ class FilterEngine:
         # Sigma ve güç değerlerini yoğunluğa göre ayarla
         sigma = 1.0 + intensity * 4.0
         amount = 0.5 + intensity * 2.0
-        gaussian = cv2.GaussianBlur(image, (0, 0), sigma)
+        gaussian = cv2.GaussianBlur(image, (0, 0), sigma, dst=_POOL.get(image.shape))
+        # addWeighted uint8 sonucu zaten doyurur (ek clip/cast gerekmez)
         sharpened = cv2.addWeighted(image, 1.0 + amount, gaussian, -amount, 0)
-        sharpened = np.clip(sharpened, 0, 255).astype(np.uint8)
         return FilterEngine._blend(image, sharpened, intensity)
 
     @staticmethod
@@ -109,10 +346,17 @@ class FilterEngine:
         # Eşik değerlerini dinamik olarak hesapla
         threshold1 = int(50 * (1 - intensity * 0.5))
         threshold2 = int(150 * (1 - intensity * 0.5))
-        edges = cv2.Canny(gray, threshold1, threshold2)
-        # Tek kanallı kenar haritasını 3 kanala dönüştür
-        edges_bgr = cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR)
-        return FilterEngine._blend(image, edges_bgr, intensity)
+        if intensity < _SOBEL_EDGE_MAX_INTENSITY:
+            # Düşük yoğunlukta kenar haritası sonuca az katkı verir; histerezisli
+            # Canny yerine eşiklenmiş Sobel büyüklüğü (L1) yeterlidir.
+            gx = cv2.convertScaleAbs(cv2.Sobel(gray, cv2.CV_16S, 1, 0))
+            gy = cv2.convertScaleAbs(cv2.Sobel(gray, cv2.CV_16S, 0, 1))
+            magnitude = cv2.add(gx, gy, dst=gx)
+            _, edges = cv2.threshold(magnitude, threshold2, 255, cv2.THRESH_BINARY)
+        else:
+            edges = cv2.Canny(gray, threshold1, threshold2)
+        # Tek kanallı kenar haritası yalnızca karıştırma anında genişletilir
+        return FilterEngine._blend_gray(image, edges, intensity)
 
     @staticmethod
     def emboss(image: np.ndarray, intensity: float) -> np.ndarray:
@@ -122,12 +366,9 @@ class FilterEngine:
         """
         if intensity <= 0:
             return image.copy()
-        # Kabartma çekirdeği (kernel)
-        kernel = np.array([[-2, -1, 0],
-                           [-1,  1, 1],
-                           [ 0,  1, 2]], dtype=np.float32)
-        embossed = cv2.filter2D(image, -1, kernel) + 128
-        embossed = np.clip(embossed, 0, 255).astype(np.uint8)
+        # +128 ofseti filter2D içinde (delta) uygulanır ve uint8'e doyurulur;
+        # ayrı bir numpy toplaması taşma (wraparound) yapıyordu.
+        embossed = cv2.filter2D(image, -1, _EMBOSS_KERNEL, delta=128)
         return FilterEngine._blend(image, embossed, intensity)
 
     @staticmethod
@@ -138,18 +379,12 @@ class FilterEngine:
         """
         if intensity <= 0:
             return image.copy()
-        # Sepya dönüşüm matrisi (BGR formatında)
-        sepia_matrix = np.array([
-            [0.272, 0.534, 0.131],
-            [0.349, 0.686, 0.168],
-            [0.393, 0.769, 0.189]
-        ], dtype=np.float32)
-        sepia_img = cv2.transform(image, sepia_matrix)
+        sepia_img = cv2.transform(image, _SEPIA_MATRIX)
         sepia_img = np.clip(sepia_img, 0, 255).astype(np.uint8)
         return FilterEngine._blend(image, sepia_img, intensity)
 
     @staticmethod
-    def vintage(image: np.ndarray, intensity: float) -> np.ndarray:
+    def vintage(image: np.ndarray, intensity: float, cache: bool = True) -> np.ndarray:
         """
         Vintage Filtre: Eski fotoğraf görünümü.
         Sepya tonu + vinyet + hafif solma efekti birleştirilir.
@@ -158,33 +393,24 @@ class FilterEngine:
             return image.copy()
 
         h, w = image.shape[:2]
+        # Maske, renk adımları sürerken arka planda hazırlanır
+        mask_future = _submit_radial_mask(h, w, 0.4, cache=cache)
 
         # Adım 1: Hafif sepya tonu ekle
-        sepia_matrix = np.array([
-            [0.30, 0.52, 0.15],
-            [0.35, 0.67, 0.17],
-            [0.38, 0.74, 0.19]
-        ], dtype=np.float32)
-        vintage_img = cv2.transform(image, sepia_matrix)
-        vintage_img = np.clip(vintage_img, 0, 255).astype(np.uint8)
+        # (cv2.transform uint8 sonucu zaten doyurur)
+        vintage_img = cv2.transform(image, _VINTAGE_MATRIX, dst=_POOL.get(image.shape))
 
         # Adım 2: Kontrastı azalt (solmuş görünüm)
-        vintage_img = cv2.convertScaleAbs(vintage_img, alpha=0.9, beta=15)
+        vintage_img = cv2.convertScaleAbs(vintage_img, alpha=0.9, beta=15, dst=vintage_img)
 
         # Adım 3: Hafif vinyet ekle
-        center_x, center_y = w // 2, h // 2
-        Y, X = np.ogrid[:h, :w]
-        dist = np.sqrt((X - center_x) ** 2 + (Y - center_y) ** 2)
-        max_dist = np.sqrt(center_x ** 2 + center_y ** 2)
-        vignette_mask = 1 - (dist / max_dist) * 0.4
-        vignette_mask = np.clip(vignette_mask, 0, 1)
-        vignette_mask = np.dstack([vignette_mask] * 3).astype(np.float32)
-        vintage_img = (vintage_img.astype(np.float32) * vignette_mask).astype(np.uint8)
+        vignette_mask = mask_future.result()
+        vintage_img = _apply_mask(vintage_img, vignette_mask)
 
         return FilterEngine._blend(image, vintage_img, intensity)
 
     @staticmethod
-    def vignette(image: np.ndarray, intensity: float) -> np.ndarray:
+    def vignette(image: np.ndarray, intensity: float, cache: bool = True) -> np.ndarray:
         """
         Vinyet Efekti: Köşeleri karartarak merkeze odaklanma sağlar.
         Gaussian tabanlı yumuşak geçiş kullanılır.
@@ -193,22 +419,12 @@ class FilterEngine:
             return image.copy()
 
         h, w = image.shape[:2]
-        # Merkez koordinatları
-        center_x, center_y = w // 2, h // 2
-
-        # Mesafe haritası oluştur
-        Y, X = np.ogrid[:h, :w]
-        dist = np.sqrt((X - center_x) ** 2 + (Y - center_y) ** 2)
-        max_dist = np.sqrt(center_x ** 2 + center_y ** 2)
 
-        # Vinyet maskesi (merkez = 1, kenarlar = 0)
+        # Yumuşatılmış vinyet maskesi (merkez = 1, kenarlar = 0)
         vignette_strength = 0.3 + intensity * 0.7
-        mask = 1 - (dist / max_dist) * vignette_strength
-        mask = np.clip(mask, 0, 1)
-        mask = cv2.GaussianBlur(mask, (0, 0), max(w, h) * 0.05)
-        mask = np.dstack([mask] * 3).astype(np.float32)
+        mask = _get_radial_mask(h, w, vignette_strength, blur=True, cache=cache)
 
-        vignetted = (image.astype(np.float32) * mask).astype(np.uint8)
+        vignetted = _apply_mask(image, mask)
         return FilterEngine._blend(image, vignetted, intensity)
 
     @staticmethod
@@ -222,18 +438,16 @@ class FilterEngine:
 
         # Detay katmanını çıkar (orijinal - bulanık = detay)
         sigma = 15
-        blurred = cv2.GaussianBlur(image, (0, 0), sigma)
-        detail = cv2.subtract(image, blurred)
+        blurred = cv2.GaussianBlur(image, (0, 0), sigma, dst=_POOL.get(image.shape, slot=0))
+        detail = cv2.subtract(image, blurred, dst=_POOL.get(image.shape, slot=1))
 
         # Detay katmanını güçlendir ve geri ekle
         boost = 1.0 + intensity * 2.0
-        detail_boosted = cv2.convertScaleAbs(detail, alpha=boost, beta=0)
+        detail_boosted = cv2.convertScaleAbs(detail, alpha=boost, beta=0, dst=detail)
         hdr = cv2.add(image, detail_boosted)
 
         # Doygunluğu hafifçe artır
-        hsv = cv2.cvtColor(hdr, cv2.COLOR_BGR2HSV).astype(np.float32)
-        hsv[:, :, 1] = np.clip(hsv[:, :, 1] * (1 + intensity * 0.3), 0, 255)
-        hdr = cv2.cvtColor(hsv.astype(np.uint8), cv2.COLOR_HSV2BGR)
+        hdr = _scale_saturation(hdr, 1 + intensity * 0.3)
 
         return FilterEngine._blend(image, hdr, intensity)
 
@@ -246,18 +460,20 @@ class FilterEngine:
         if intensity <= 0:
             return image.copy()
 
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        inv = 255 - gray
+        h, w = image.shape[:2]
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=_POOL.get((h, w), slot=0))
+        inv = cv2.bitwise_not(gray, dst=_POOL.get((h, w), slot=1))
 
         # Bulanıklaştırma miktarını yoğunluğa göre ayarla
+        # (ters çevrilmiş tampon yeniden kullanılır, yeni dizi ayrılmaz)
         sigma = 10 + intensity * 40
-        blurred_inv = cv2.GaussianBlur(inv, (0, 0), sigma)
+        blurred_inv = cv2.GaussianBlur(inv, (0, 0), sigma, dst=inv)
+        denom = cv2.bitwise_not(blurred_inv, dst=blurred_inv)
 
         # Bölme ile eskiz elde et (dodge blend)
-        sketch = cv2.divide(gray, 255 - blurred_inv, scale=256)
-        sketch_bgr = cv2.cvtColor(sketch, cv2.COLOR_GRAY2BGR)
+        sketch = cv2.divide(gray, denom, scale=256)
 
-        return FilterEngine._blend(image, sketch_bgr, intensity)
+        return FilterEngine._blend_gray(image, sketch, intensity)
 
     @staticmethod
     def oil_painting(image: np.ndarray, intensity: float) -> np.ndarray:
@@ -274,10 +490,18 @@ class FilterEngine:
         sigma_space = 30 + intensity * 120
 
         # Birden fazla geçiş ile daha güçlü efekt
-        oil = image.copy()
         passes = max(1, int(intensity * 3))
-        for _ in range(passes):
-            oil = cv2.bilateralFilter(oil, d, sigma_color, sigma_space)
+        h, w = image.shape[:2]
+        if min(h, w) >= 4:
+            # Yarı çözünürlükte işle: piksel sayısı 4×, komşuluk 2× küçülür
+            oil = cv2.pyrDown(image)
+            for _ in range(passes):
+                oil = cv2.bilateralFilter(oil, d // 2, sigma_color, sigma_space)
+            oil = cv2.pyrUp(oil, dstsize=(w, h))
+        else:
+            oil = image
+            for _ in range(passes):
+                oil = cv2.bilateralFilter(oil, d, sigma_color, sigma_space)
 
         return FilterEngine._blend(image, oil, intensity)
 
@@ -313,9 +537,7 @@ class FilterEngine:
 
         # Renk seviyesi sayısı (2-16 arası, ters orantılı)
         levels = max(2, int(16 - intensity * 14))
-        step = 256 // levels
-        posterized = (image // step) * step + step // 2
-        posterized = np.clip(posterized, 0, 255).astype(np.uint8)
+        posterized = cv2.LUT(image, _posterize_lut(levels))
 
         return FilterEngine._blend(image, posterized, intensity)
 
@@ -328,14 +550,12 @@ class FilterEngine:
         if intensity <= 0:
             return image.copy()
 
-        warm = image.astype(np.float32)
-        # BGR formatında: B kanalını azalt, R kanalını artır
-        strength = intensity * 30
-        warm[:, :, 0] = np.clip(warm[:, :, 0] - strength, 0, 255)      # Mavi azalt
-        warm[:, :, 1] = np.clip(warm[:, :, 1] + strength * 0.3, 0, 255)  # Yeşil hafif artır
-        warm[:, :, 2] = np.clip(warm[:, :, 2] + strength, 0, 255)      # Kırmızı artır
+        # BGR formatında: B kanalını azalt, G'yi hafif, R'yi tam artır
+        strength = round(intensity, 3) * 30
+        lut = _channel_shift_lut(-strength, strength * 0.3, strength)
+        warm = cv2.LUT(image, lut)
 
-        return FilterEngine._blend(image, warm.astype(np.uint8), intensity)
+        return FilterEngine._blend(image, warm, intensity)
 
     @staticmethod
     def cool_filter(image: np.ndarray, intensity: float) -> np.ndarray:
@@ -346,15 +566,15 @@ class FilterEngine:
         if intensity <= 0:
             return image.copy()
 
-        cool = image.astype(np.float32)
-        strength = intensity * 30
-        cool[:, :, 0] = np.clip(cool[:, :, 0] + strength, 0, 255)      # Mavi artır
-        cool[:, :, 2] = np.clip(cool[:, :, 2] - strength, 0, 255)      # Kırmızı azalt
+        # Mavi artır, kırmızı azalt (yeşil değişmez)
+        strength = round(intensity, 3) * 30
+        lut = _channel_shift_lut(strength, 0.0, -strength)
+        cool = cv2.LUT(image, lut)
 
-        return FilterEngine._blend(image, cool.astype(np.uint8), intensity)
+        return FilterEngine._blend(image, cool, intensity)
 
     @staticmethod
-    def dramatic(image: np.ndarray, intensity: float) -> np.ndarray:
+    def dramatic(image: np.ndarray, intensity: float, cache: bool = True) -> np.ndarray:
         """
         Dramatik Efekt: Yüksek kontrast + desatürasyon + vinyet.
         Sinematik bir görünüm oluşturur.
@@ -362,57 +582,95 @@ class FilterEngine:
         if intensity <= 0:
             return image.copy()
 
+        # Maske, renk adımları sürerken arka planda hazırlanır
+        h, w = image.shape[:2]
+        mask_future = _submit_radial_mask(h, w, 0.5 * intensity, cache=cache)
+
         # Adım 1: Kontrastı artır
-        dramatic = cv2.convertScaleAbs(image, alpha=1.0 + intensity * 0.5, beta=-10 * intensity)
+        dramatic = cv2.convertScaleAbs(image, alpha=1.0 + intensity * 0.5, beta=-10 * intensity,
+                                       dst=_POOL.get(image.shape, slot=0))
 
         # Adım 2: Doygunluğu kısmen azalt
-        hsv = cv2.cvtColor(dramatic, cv2.COLOR_BGR2HSV).astype(np.float32)
-        hsv[:, :, 1] = hsv[:, :, 1] * (1 - intensity * 0.4)
-        dramatic = cv2.cvtColor(hsv.astype(np.uint8), cv2.COLOR_HSV2BGR)
+        dramatic = _scale_saturation(dramatic, 1 - intensity * 0.4)
 
         # Adım 3: Vinyet ekle
-        h, w = dramatic.shape[:2]
-        Y, X = np.ogrid[:h, :w]
-        center_x, center_y = w // 2, h // 2
-        dist = np.sqrt((X - center_x) ** 2 + (Y - center_y) ** 2)
-        max_dist = np.sqrt(center_x ** 2 + center_y ** 2)
-        mask = 1 - (dist / max_dist) * 0.5 * intensity
-        mask = np.clip(mask, 0, 1)
-        mask = np.dstack([mask] * 3).astype(np.float32)
-        dramatic = (dramatic.astype(np.float32) * mask).astype(np.uint8)
+        mask = mask_future.result()
+        dramatic = _apply_mask(dramatic, mask)
 
         return FilterEngine._blend(image, dramatic, intensity)
 
     @classmethod
-    def apply_filter(cls, image: np.ndarray, filter_name: str, intensity: float) -> np.ndarray:
+    def apply_filter(cls, image: np.ndarray, filter_name: str, intensity: float,
+                     cache: bool = True) -> np.ndarray:
         """
         Filtre adına göre ilgili metodu çağırır.
         Bu, dışarıdan tek bir giriş noktası sağlayan fabrika metodudur.
+        cache=False ile sonuç ve vinyet maskesi önbellekleri atlanır (tam
+        çözünürlüklü işlemlerde büyük diziler önbellekte tutulmasın diye).
         """
-        # Filtre adı → metot eşleştirmesi
-        filter_map = {
-            "gaussian_blur": cls.gaussian_blur,
-            "box_blur":      cls.box_blur,
-            "median_blur":   cls.median_blur,
-            "sharpen":       cls.sharpen,
-            "unsharp_mask":  cls.unsharp_mask,
-            "edge_detect":   cls.edge_detect,
-            "emboss":        cls.emboss,
-            "sepia":         cls.sepia,
-            "vintage":       cls.vintage,
-            "vignette":      cls.vignette,
-            "hdr_effect":    cls.hdr_effect,
-            "pencil_sketch": cls.pencil_sketch,
-            "oil_painting":  cls.oil_painting,
-            "pixelate":      cls.pixelate,
-            "posterize":     cls.posterize,
-            "warm_filter":   cls.warm_filter,
-            "cool_filter":   cls.cool_filter,
-            "dramatic":      cls.dramatic,
-        }
-
-        method = filter_map.get(filter_name)
+        method = cls._FILTER_MAP.get(filter_name)
         if method is None:
             return image.copy()
+        if not cache and filter_name in _MASK_FILTERS:
+            method = functools.partial(method, cache=False)
+
+        # Yoğunluğu 0.01 adımlara indir; slider değerleri zaten bu çözünürlükte
+        intensity = round(intensity, 2)
+
+        # Yalnızca salt-okunur girdiler önbelleğe alınır: içerikleri
+        # değişemeyeceği için aynı nesne = aynı sonuç garantisi vardır.
+        if not cache or image.flags.writeable:
+            return method(image, intensity)
+
+        key = (image.ctypes.data, image.shape, filter_name, intensity)
+        results = cls._result_cache
+        with cls._result_lock:
+            cached = results.get(key)
+            if cached is not None and cached[0]() is image:
+                results.move_to_end(key)
+                return cached[1]
+
+        # Filtre kilit dışında çalışır; yalnızca sözlük erişimi korunur
+        result = method(image, intensity)
+        if result is image:
+            return result
+        result.flags.writeable = False
+
+        # Girdisi artık yaşamayan kayıtları at, sonra en eskiyi sınırla
+        with cls._result_lock:
+            for stale in [k for k, (ref, _) in results.items() if ref() is None]:
+                del results[stale]
+            results[key] = (weakref.ref(image), result)
+            while len(results) > _RESULT_CACHE_SIZE:
+                results.popitem(last=False)
+        return result
 
-        return method(image, intensity)
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Filtre sonuç önbelleğini boşaltır (yeni görüntü durumu için)."""
+        with cls._result_lock:
+            cls._result_cache.clear()
+
+
+# Filtre adı → metot eşleştirmesi; her çağrıda yeniden kurulmaması için
+# sınıf tanımından sonra bir kez oluşturulur.
+FilterEngine._FILTER_MAP = {
+    "gaussian_blur": FilterEngine.gaussian_blur,
+    "box_blur":      FilterEngine.box_blur,
+    "median_blur":   FilterEngine.median_blur,
+    "sharpen":       FilterEngine.sharpen,
+    "unsharp_mask":  FilterEngine.unsharp_mask,
+    "edge_detect":   FilterEngine.edge_detect,
+    "emboss":        FilterEngine.emboss,
+    "sepia":         FilterEngine.sepia,
+    "vintage":       FilterEngine.vintage,
+    "vignette":      FilterEngine.vignette,
+    "hdr_effect":    FilterEngine.hdr_effect,
+    "pencil_sketch": FilterEngine.pencil_sketch,
+    "oil_painting":  FilterEngine.oil_painting,
+    "pixelate":      FilterEngine.pixelate,
+    "posterize":     FilterEngine.posterize,
+    "warm_filter":   FilterEngine.warm_filter,
+    "cool_filter":   FilterEngine.cool_filter,
+    "dramatic":      FilterEngine.dramatic,
+}
@@ -4,24 +4,70 @@ Görüntü durumlarını bir yığın (stack) yapısında tutar.
 Bellek verimliliği için maksimum durum sayısı sınırlandırılmıştır.
 """
 
+from collections import deque
+
+import cv2
 import numpy as np
-from typing import Optional
+from typing import Optional, Union
 
 from app.utils.constants import MAX_HISTORY_STATES
 
+# Bu boyutun üzerindeki durumlar yığında PNG (seviye 1) olarak sıkıştırılır
+_COMPRESS_ABOVE_BYTES = 8 * 1024 * 1024
+# En üstteki bu kadar durum, anında geri alma için sıkıştırılmadan tutulur
+_UNCOMPRESSED_TOP = 2
+
+# Yığın öğesi: ham dizi veya ("png", kodlanmış tampon)
+_Entry = Union[np.ndarray, tuple]
+
+
+def _compress(entry: _Entry) -> _Entry:
+    """Büyük bir durumu kayıpsız PNG tamponuna dönüştürür."""
+    if isinstance(entry, tuple) or entry.nbytes <= _COMPRESS_ABOVE_BYTES:
+        return entry
+    ok, buf = cv2.imencode(".png", entry, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+    if not ok:
+        return entry
+    return ("png", buf)
+
+
+def _decompress(entry: _Entry) -> Optional[np.ndarray]:
+    """
+    Sıkıştırılmış bir durumu salt-okunur diziye geri açar.
+    Tampon çözülemezse None döndürür.
+    """
+    if not isinstance(entry, tuple):
+        return entry
+    image = cv2.imdecode(entry[1], cv2.IMREAD_UNCHANGED)
+    if image is None:
+        return None
+    image.flags.writeable = False
+    return image
+
 
 class HistoryManager:
     """
     Geri alma/yeniden yapma yığınlarını yöneten sınıf.
-    Her durum, görüntünün tam bir kopyasını içerir.
     FIFO mantığıyla en eski durumlar otomatik silinir.
+
+    Kopyalamadan paylaşım (copy-on-write) sözleşmesi:
+        Filtre/dönüşüm motorları girdilerini yerinde değiştirmez; bu yüzden
+        durumlar kopyalanmadan referans olarak saklanır ve salt-okunur
+        (writeable=False) işaretlenir. undo/redo/get_current_state aynı
+        salt-okunur diziyi döndürür. Yerinde değişiklik yapacak tüketiciler
+        get_current_state_mutable() ile bağımsız bir kopya almalıdır.
+
+    Büyük görüntülerde bellek baskısını azaltmak için en üstteki iki durum
+    ve redo yığınının en üstü dışındakiler PNG olarak sıkıştırılır ve
+    gerektiğinde açılır.
     """
 
     def __init__(self, max_states: int = MAX_HISTORY_STATES):
-        # Geri alma yığını (en son durum en sonda)
-        self._undo_stack: list[np.ndarray] = []
+        # Geri alma yığını (en son durum en sonda).
+        # maxlen dolunca en eski durum O(1) ile otomatik düşer.
+        self._undo_stack: deque[_Entry] = deque(maxlen=max_states)
         # Yeniden yapma yığını
-        self._redo_stack: list[np.ndarray] = []
+        self._redo_stack: list[_Entry] = []
         # Maksimum tutulacak durum sayısı
         self._max_states = max_states
 
@@ -34,16 +80,20 @@ class HistoryManager:
         if image is None:
             return
 
-        # Görüntünün bağımsız kopyasını al
-        self._undo_stack.append(image.copy())
-
-        # Maksimum durum sayısını aşarsa en eskisini sil
-        if len(self._undo_stack) > self._max_states:
-            self._undo_stack.pop(0)
+        # Kopyalamak yerine salt-okunur anlık görüntü olarak sakla
+        image.flags.writeable = False
+        self._undo_stack.append(image)
+        self._compress_cold_state()
 
         # Yeni işlem yapıldığında redo geçersiz olur
         self._redo_stack.clear()
 
+    def _compress_cold_state(self) -> None:
+        """Üstteki sıcak durumların altına düşen durumu sıkıştırır."""
+        if len(self._undo_stack) > _UNCOMPRESSED_TOP:
+            idx = -1 - _UNCOMPRESSED_TOP
+            self._undo_stack[idx] = _compress(self._undo_stack[idx])
+
     def undo(self) -> Optional[np.ndarray]:
         """
         Son işlemi geri alır.
@@ -54,12 +104,20 @@ class HistoryManager:
             # En az 2 durum gerekli (mevcut + bir önceki)
             return None
 
-        # Mevcut durumu redo yığınına taşı
-        current = self._undo_stack.pop()
-        self._redo_stack.append(current)
+        # Bir önceki durumu aç; açılamazsa yığınlara dokunulmaz
+        previous = _decompress(self._undo_stack[-2])
+        if previous is None:
+            return None
 
-        # Bir önceki durumu döndür (yığında bırak)
-        return self._undo_stack[-1].copy()
+        # Mevcut durumu redo yığınına taşı; anında yinelemeye yalnızca en
+        # üstteki gerekir, altına düşen önceki kayıt sıkıştırılır
+        if self._redo_stack:
+            self._redo_stack[-1] = _compress(self._redo_stack[-1])
+        self._redo_stack.append(self._undo_stack.pop())
+
+        # Açılan durumu yığında açık halde bırak ve döndür
+        self._undo_stack[-1] = previous
+        return previous
 
     def redo(self) -> Optional[np.ndarray]:
         """
@@ -69,10 +127,15 @@ class HistoryManager:
         if not self._redo_stack:
             return None
 
-        # Redo yığınından al ve undo yığınına ekle
-        state = self._redo_stack.pop()
+        # Redo yığınından al ve undo yığınına ekle; açılamazsa yığınlara
+        # dokunulmaz
+        state = _decompress(self._redo_stack[-1])
+        if state is None:
+            return None
+        self._redo_stack.pop()
         self._undo_stack.append(state)
-        return state.copy()
+        self._compress_cold_state()
+        return state
 
     def can_undo(self) -> bool:
         """Geri alma yapılabilir mi kontrolü."""
@@ -98,7 +161,13 @@ class HistoryManager:
         self._redo_stack.clear()
 
     def get_current_state(self) -> Optional[np.ndarray]:
-        """Mevcut (en son) durumun kopyasını döndürür."""
+        """Mevcut (en son) durumu salt-okunur olarak döndürür."""
+        if not self._undo_stack:
+            return None
+        return self._undo_stack[-1]
+
+    def get_current_state_mutable(self) -> Optional[np.ndarray]:
+        """Mevcut durumun yazılabilir, bağımsız bir kopyasını döndürür."""
         if not self._undo_stack:
             return None
         return self._undo_stack[-1].copy()
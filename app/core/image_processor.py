@@ -4,16 +4,173 @@ Ana Görüntü İşleme Motoru - Tüm düzenleme pipeline'ını yöneten merkezi
 Tahribatsız (non-destructive) düzenleme yaklaşımı kullanılır.
 """
 
+import functools
+import os
+import threading
+import weakref
+
 import cv2
 import numpy as np
-from typing import Optional
+from typing import Callable, Optional
 
 from app.core.filter_engine import FilterEngine
 from app.core.noise_engine import NoiseEngine
 from app.core.transform_engine import TransformEngine
 from app.core.history_manager import HistoryManager
-from app.utils.constants import PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT
-from app.utils.image_utils import create_preview
+from app.utils.constants import (
+    ADJUSTMENT_DEFAULTS, PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT,
+)
+from app.utils.image_utils import create_preview, clear_preview_cache
+
+
+# ─── Nokta Tabanlı (Pointwise) Ayarlama Tabloları ─────────────────────
+# Kanal başına yalnızca piksel değerine bağlı ayarlamalar 256 girişlik
+# arama tablolarında birleştirilir; böylece birden fazla tam görüntü geçişi
+# tek bir cv2.LUT çağrısına iner.
+
+_IDENTITY_LUT = np.arange(256, dtype=np.uint8)
+
+# Küçültülmüş yükleme faktörü → imread bayrağı
+_IMREAD_REDUCED = {
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _tone_lut(brightness: float, contrast: float,
+              exposure: float, gamma: float) -> Optional[np.ndarray]:
+    """
+    Parlaklık/kontrast → pozlama → gama zincirini tek tabloda birleştirir.
+    Her adım, eski ayrı geçişlerle aynı yuvarlama/kırpma davranışını korur.
+    Tüm ayarlar varsayılansa None döner. Sonuç önbellekten paylaşıldığı
+    için salt-okunurdur; slider sürüklenirken tablo yeniden hesaplanmaz.
+    """
+    x = np.arange(256, dtype=np.float64)
+    changed = False
+
+    if brightness != 0 or contrast != 0:
+        # Tablo da convertScaleAbs ile üretilir (aynı yuvarlama davranışı)
+        alpha = 1.0 + contrast / 100.0
+        beta = brightness * 2.55
+        x = cv2.convertScaleAbs(_IDENTITY_LUT, alpha=alpha, beta=beta).ravel().astype(np.float64)
+        changed = True
+
+    if exposure != 0:
+        # EV (Exposure Value) cinsinden: 2^EV çarpanı
+        x = np.floor(np.clip(x.astype(np.float32) * np.float32(pow(2, exposure)), 0, 255))
+        changed = True
+
+    if abs(gamma - 1.0) > 0.01:
+        x = np.floor(((x / 255.0) ** (1.0 / gamma)) * 255)
+        changed = True
+
+    if not changed:
+        return None
+    lut = x.astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+@functools.lru_cache(maxsize=64)
+def _color_shift_lut(temperature: float, tint: float) -> Optional[np.ndarray]:
+    """
+    Sıcaklık (Mavi-Kırmızı) ve renk tonu (Yeşil-Magenta) kaydırmalarını
+    3 kanallı (256, 1, 3) tek bir tabloda toplar. Ayar yoksa None döner.
+    Önbellekten paylaşılan tablo salt-okunurdur.
+    """
+    if temperature == 0 and tint == 0:
+        return None
+    base = np.arange(256, dtype=np.float32)
+    lut = np.empty((256, 1, 3), dtype=np.uint8)
+    temp_shift = np.float32(temperature * 0.3)
+    tint_shift = np.float32(tint * 0.3)
+    lut[:, 0, 0] = np.clip(base - temp_shift, 0, 255)  # Mavi
+    lut[:, 0, 1] = np.clip(base + tint_shift, 0, 255)  # Yeşil
+    lut[:, 0, 2] = np.clip(base + temp_shift, 0, 255)  # Kırmızı
+    lut.flags.writeable = False
+    return lut
+
+
+def _color_shift_scalar(temperature: float, tint: float) -> Optional[tuple]:
+    """
+    Sıcaklık/renk tonu kaydırmasını cv2.add için (B, G, R, 0) skaleri olarak
+    döndürür. Ayar yoksa None döner.
+    """
+    if temperature == 0 and tint == 0:
+        return None
+    temp_shift = temperature * 0.3
+    return (-temp_shift, tint * 0.3, temp_shift, 0.0)
+
+
+@functools.lru_cache(maxsize=64)
+def _combined_lut(brightness: float, contrast: float, exposure: float,
+                  gamma: float, temperature: float, tint: float) -> Optional[np.ndarray]:
+    """
+    Arada HSV adımı olmadığında ton ve renk kaydırma tablolarını tek
+    3 kanallı tabloda birleştirir: tüm nokta tabanlı ayarlar tek geçiştir.
+    """
+    tone = _tone_lut(brightness, contrast, exposure, gamma)
+    color = _color_shift_lut(temperature, tint)
+    if tone is None or color is None:
+        return color if tone is None else tone
+    lut = color[tone]
+    lut.flags.writeable = False
+    return lut
+
+
+@functools.lru_cache(maxsize=64)
+def _hsv_lut(hue: float, saturation: float, vibrance: float) -> np.ndarray:
+    """
+    uint8 HSV görüntü için (256, 1, 3) tablo: H kanalında ton kaydırma,
+    S kanalında doygunluk + canlılık; V kanalı aynen kalır.
+    Adımlar eski float32 tam görüntü hesabıyla birebir aynıdır, ancak
+    yalnızca 256 değer için çalışır. Sonuç salt-okunurdur.
+    """
+    h = np.arange(256, dtype=np.float32)
+    s = np.arange(256, dtype=np.float32)
+
+    # Ton (Hue) kaydırma
+    if hue != 0:
+        h = np.remainder(h + np.float32(hue / 2), np.float32(180))
+
+    # Doygunluk ayarı
+    if saturation != 0:
+        s = np.clip(s * np.float32(1.0 + saturation / 100.0), 0, 255)
+
+    # Canlılık (düşük doygunluklu piksellere daha fazla etki)
+    if vibrance != 0:
+        boost = (np.float32(1.0) - s / np.float32(255.0)) * np.float32(vibrance / 100.0)
+        s = np.clip(s + boost * np.float32(50), 0, 255)
+
+    lut = np.empty((256, 1, 3), dtype=np.uint8)
+    lut[:, 0, 0] = np.clip(h, 0, 255)
+    lut[:, 0, 1] = s
+    lut[:, 0, 2] = _IDENTITY_LUT
+    lut.flags.writeable = False
+    return lut
+
+
+# Renk aşamasını etkileyen ayarlama parametreleri (aşama önbelleği anahtarı)
+_COLOR_STAGE_PARAMS = (
+    "brightness", "contrast", "exposure", "gamma",
+    "saturation", "hue", "vibrance", "temperature", "tint",
+)
+
+# Netlik bulanıklığı çeyrek çözünürlükte bu sigma ile yapılır; iki pyrDown/
+# pyrUp çiftinin kendi yumuşatmasıyla birlikte tam çözünürlükte sigma=10'a denk
+_CLARITY_PYR_SIGMA = 2.4
+# Bundan küçük görüntülerde piramit yerine doğrudan Gaussian kullanılır
+_CLARITY_PYR_MIN_SIZE = 16
+
+
+class PipelineCancelled(Exception):
+    """İptal denetimi True döndüğünde pipeline aşamalar arasında durdurulur."""
+
+
+def _never_cancelled() -> bool:
+    return False
 
 
 class ImageProcessor:
@@ -34,18 +191,31 @@ class ImageProcessor:
         self._processed: Optional[np.ndarray] = None
         # Geçmiş yöneticisi
         self._history = HistoryManager()
-        # Dosya yolu bilgisi
+        # Dosya yolu bilgisi (ad, yol atandığında bir kez hesaplanır)
         self._file_path: Optional[str] = None
+        self._file_basename: Optional[str] = None
+        # Yüklenen her belgede artar; worker'daki dönüşümler başladıkları
+        # belgeyi bununla tanır
+        self._document_id = 0
+        # Aşamalar arasında yeniden kullanılan float32 çalışma tamponları.
+        # Önizleme işçisi ve ana iş parçacığı aynı anda pipeline çalıştırabildiği
+        # için iş parçacığı başına tutulur.
+        self._scratch = threading.local()
+        # Son HSV dönüşümü: (anahtar, kaynağa zayıf referans, uint8 HSV).
+        # Doygunluk/ton/canlılık sürüklenirken HSV öncesi görüntü değişmez.
+        self._hsv_cache: Optional[tuple] = None
+        # Açık/koyu ton maskeleri: is_highlights → (anahtar, zayıf referans, maske)
+        self._tonal_cache: dict[bool, tuple] = {}
+        # Ayarlama aşaması başına son çıktı: (anahtar, zayıf referans, çıktı)
+        self._stage_cache: list[Optional[tuple]] = [None] * 4
+        # Önizleme işleme ölçeği (<1 → sürükleme sırasında küçültülmüş vekil)
+        self.preview_scale: float = 1.0
+        # Küçültülmüş önizleme vekili: (ölçek, kaynağa zayıf referans, vekil)
+        self._proxy_cache: Optional[tuple] = None
 
         # ─── Mevcut düzenleme parametreleri ────────────────────────
         # Ayarlamalar (adjustment) parametreleri
-        self._adjustments: dict[str, float] = {
-            "brightness": 0, "contrast": 0, "saturation": 0,
-            "hue": 0, "gamma": 100, "exposure": 0,
-            "temperature": 0, "tint": 0,
-            "highlights": 0, "shadows": 0,
-            "clarity": 0, "vibrance": 0, "sharpness": 0,
-        }
+        self._adjustments: dict[str, float] = dict(ADJUSTMENT_DEFAULTS)
 
         # Filtre parametreleri (her filtre için yoğunluk 0-100)
         self._filters: dict[str, int] = {}
@@ -65,38 +235,55 @@ class ImageProcessor:
         Dosyadan görüntü yükler.
         Başarılıysa True, değilse False döndürür.
         """
+        image = self.decode_image(file_path)
+        if image is None:
+            return False
+        self.set_loaded_image(file_path, image)
+        return True
+
+    @staticmethod
+    def decode_image(file_path: str, reduce: int = 1) -> Optional[np.ndarray]:
+        """
+        Dosyayı yalnızca çözer (BGR); işlemci durumuna dokunmaz.
+        Durumsuz olduğundan arka plan thread'inde güvenle çağrılabilir.
+        reduce (2, 4, 8) verilirse görüntü çözücü düzeyinde küçültülerek
+        okunur (JPEG'de tam çözme hiç yapılmaz). Okunamazsa None döndürür.
+        """
         try:
             # OpenCV ile oku (BGR formatında)
-            image = cv2.imread(file_path, cv2.IMREAD_COLOR)
-            if image is None:
-                return False
-
-            self._original = image
-            self._file_path = file_path
-            self._preview_original = create_preview(
-                image, PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT
-            )
-            self._processed = None
-
-            # Geçmişi sıfırla ve ilk durumu kaydet
-            self._history.clear()
-            self._history.push_state(image)
-
-            # Tüm parametreleri sıfırla
-            self._reset_all_params()
-            return True
-
+            return cv2.imread(file_path, _IMREAD_REDUCED.get(reduce, cv2.IMREAD_COLOR))
         except Exception:
-            return False
+            return None
+
+    def set_loaded_image(self, file_path: str, image: np.ndarray) -> None:
+        """Çözülmüş görüntüyü yeni belge olarak yükler; geçmiş ve parametreler sıfırlanır."""
+        self._original = image
+        self._document_id += 1
+        self._file_path = file_path
+        self._file_basename = os.path.basename(file_path) if file_path else None
+        self._processed = None
+
+        # Geçmişi sıfırla ve ilk durumu kaydet; önceki belgenin önizlemeleri
+        # artık kullanılmayacak
+        self._history.clear()
+        clear_preview_cache()
+        self._history.push_state(image)
+        self._refresh_preview()
+
+        # Tüm parametreleri sıfırla
+        self._reset_all_params()
 
-    def save_image(self, file_path: str, quality: int = 95) -> bool:
+    def save_image(self, file_path: str, quality: int = 95,
+                   snapshot: Optional[tuple] = None) -> bool:
         """
         İşlenmiş görüntüyü dosyaya kaydeder.
-        Tam çözünürlükte işleme yapılır.
+        Tam çözünürlükte işleme yapılır. Arka planda kaydederken snapshot
+        (bkz. snapshot()) verilmelidir; böylece kaydedilen, kaydetmenin
+        istendiği andaki görüntü ve parametrelerdir.
         """
         try:
             # Tam çözünürlükte pipeline'ı çalıştır
-            result = self.process_full_resolution()
+            result = self.process_full_resolution(snapshot)
             if result is None:
                 return False
 
@@ -115,6 +302,19 @@ class ImageProcessor:
         except Exception:
             return False
 
+    def _refresh_preview(self) -> None:
+        """
+        Orijinal değiştiğinde önizleme kopyasını yeniden oluşturur.
+        Önizleme salt-okunur işaretlenir; böylece filtre sonuç önbelleği
+        onu güvenle anahtar olarak kullanabilir. Eski görüntüye ait
+        önbellek kayıtları artık işe yaramayacağı için temizlenir.
+        """
+        FilterEngine.clear_cache()
+        self._preview_original = create_preview(
+            self._original, PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT
+        )
+        self._preview_original.flags.writeable = False
+
     # ─── Parametre Yönetimi ───────────────────────────────────────────
 
     def set_adjustment(self, key: str, value: float) -> None:
@@ -145,13 +345,7 @@ class ImageProcessor:
 
     def _reset_all_params(self) -> None:
         """Tüm düzenleme parametrelerini varsayılanlara sıfırlar."""
-        self._adjustments = {
-            "brightness": 0, "contrast": 0, "saturation": 0,
-            "hue": 0, "gamma": 100, "exposure": 0,
-            "temperature": 0, "tint": 0,
-            "highlights": 0, "shadows": 0,
-            "clarity": 0, "vibrance": 0, "sharpness": 0,
-        }
+        self._adjustments = dict(ADJUSTMENT_DEFAULTS)
         self._filters.clear()
         self._noise_params = {
             "type": "gaussian", "intensity": 0,
@@ -160,172 +354,377 @@ class ImageProcessor:
 
     # ─── İşleme Pipeline ─────────────────────────────────────────────
 
-    def process_preview(self) -> Optional[np.ndarray]:
+    def process_preview(self, cancelled: Optional[Callable[[], bool]] = None
+                        ) -> Optional[np.ndarray]:
         """
         Önizleme boyutunda görüntü işleme pipeline'ını çalıştırır.
         Gerçek zamanlı slider geri bildirimi için optimize edilmiştir.
+        cancelled verilirse aşamalar arasında sorulur; True dönerse
+        PipelineCancelled yükseltilir (kapanışta worker'ı beklememek için).
         """
         if self._preview_original is None:
             return None
-        return self._run_pipeline(self._preview_original)
+        scale = self.preview_scale
+        if scale >= 1.0:
+            return self._run_pipeline(self._preview_original, cancelled, use_cache=True)
+
+        # Etkileşim modu: pipeline küçük vekil üzerinde çalışır, sonuç tuvalin
+        # boyutu değişmesin diye önizleme boyutuna geri büyütülür
+        preview = self._preview_original
+        result = self._run_pipeline(
+            self._get_preview_proxy(preview, scale), cancelled, use_cache=True
+        )
+        h, w = preview.shape[:2]
+        return cv2.resize(result, (w, h), interpolation=cv2.INTER_LINEAR)
 
-    def process_full_resolution(self) -> Optional[np.ndarray]:
+    def _get_preview_proxy(self, preview: np.ndarray, scale: float) -> np.ndarray:
+        """
+        Önizlemenin küçültülmüş, salt-okunur kopyasını döndürür. Aynı
+        önizleme ve ölçek için tek kez üretilir; böylece sürükleme boyunca
+        aşama/filtre önbellekleri vekili kararlı bir anahtar olarak görür.
+        """
+        cached = self._proxy_cache
+        if cached is not None and cached[0] == scale and cached[1]() is preview:
+            return cached[2]
+        h, w = preview.shape[:2]
+        size = (max(1, round(w * scale)), max(1, round(h * scale)))
+        proxy = cv2.resize(preview, size, interpolation=cv2.INTER_AREA)
+        proxy.flags.writeable = False
+        self._proxy_cache = (scale, weakref.ref(preview), proxy)
+        return proxy
+
+    def process_full_resolution(self, snapshot: Optional[tuple] = None
+                                ) -> Optional[np.ndarray]:
         """
         Tam çözünürlükte görüntü işleme pipeline'ını çalıştırır.
-        Kaydetme ve 'Uygula' işlemleri için kullanılır.
+        Kaydetme ve 'Uygula' işlemleri için kullanılır. snapshot verilirse
+        güncel durum yerine onun görüntüsü ve parametreleri işlenir.
         """
+        if snapshot is not None:
+            source, *params = snapshot
+            return self._run_pipeline(source, params=tuple(params))
         if self._original is None:
             return None
         return self._run_pipeline(self._original)
 
-    def _run_pipeline(self, source: np.ndarray) -> np.ndarray:
+    def snapshot(self) -> Optional[tuple]:
+        """
+        Orijinal görüntü ve parametrelerin anlık kopyası:
+        (orijinal, ayarlamalar, filtreler, gürültü). Orijinal salt-okunur
+        geçmiş durumu olduğundan kopyalanmaz. Arka plan işleri (kaydetme)
+        sonradan gelen dönüşüm ve slider değişikliklerinden etkilenmesin
+        diye UI thread'inde alınır.
+        """
+        if self._original is None:
+            return None
+        return (
+            self._original, dict(self._adjustments),
+            dict(self._filters), dict(self._noise_params),
+        )
+
+    def _run_pipeline(self, source: np.ndarray,
+                      cancelled: Optional[Callable[[], bool]] = None,
+                      params: Optional[tuple] = None,
+                      use_cache: bool = False) -> np.ndarray:
         """
         Ana işleme pipeline'ı. Sırasıyla:
         1. Ayarlamaları uygula (parlaklık, kontrast, doygunluk, vb.)
         2. Aktif filtreleri uygula
         3. Gürültü efektini uygula (varsa)
+
+        Worker thread önizlemeyi işlerken UI thread slider değerlerini
+        değiştirebilir. Parametreler başta bir kez kopyalanır (GIL altında
+        atomik); pipeline tek ve tutarlı bir parametre kümesiyle çalışır,
+        filtre sözlüğü dolaşılırken değişmez. Kaynak dizi salt-okunur
+        olduğundan ayrıca kopyalanması gerekmez. params (ayarlamalar,
+        filtreler, gürültü) verilirse anlık kopya olarak işlenir ve sonuç
+        _processed'e yazılmaz. Ara sonuç önbellekleri yalnızca use_cache ile
+        (önizlemede) kullanılır; tam çözünürlüklü çıktılar bellekte tutulmaz.
         """
-        result = source.copy()
+        if params is None:
+            adjustments = dict(self._adjustments)
+            filters = dict(self._filters)
+            noise_params = dict(self._noise_params)
+        else:
+            adjustments, filters, noise_params = params
+
+        # Bekleyen düzenleme yoksa hiçbir aşamayı dolaşmadan kaynağı döndür
+        if not self._params_pending(adjustments, filters, noise_params):
+            if params is None:
+                self._processed = source
+            return source
+
+        # Aşamalar arası iptal denetimi (verilmediyse hiç iptal edilmez)
+        if cancelled is None:
+            cancelled = _never_cancelled
+
+        # Tüm adımlar yeni dizi üretir; kaynak yerinde değiştirilmez
+        result = source
 
         # ── Adım 1: Ayarlamalar ──
-        result = self._apply_adjustments(result)
+        result = self._apply_adjustments(result, adjustments, cancelled, use_cache)
 
         # ── Adım 2: Filtreler ──
-        result = self._apply_filters(result)
+        result = self._apply_filters(result, filters, cancelled, use_cache)
 
         # ── Adım 3: Gürültü ──
-        result = self._apply_noise(result)
+        if cancelled():
+            raise PipelineCancelled()
+        result = self._apply_noise(result, noise_params)
 
-        self._processed = result
+        if params is None:
+            self._processed = result
         return result
 
-    def _apply_adjustments(self, image: np.ndarray) -> np.ndarray:
+    def _apply_adjustments(self, image: np.ndarray, adjustments: dict,
+                           cancelled: Optional[Callable[[], bool]] = None,
+                           use_cache: bool = False) -> np.ndarray:
         """
         Tüm ayarlama parametrelerini sırayla uygular.
         Her ayarlama bağımsız olarak çalışır ve birbirini etkiler.
+        Hiçbir adım girdiyi yerinde değiştirmez; ayar yoksa girdi aynen döner.
+
+        Aşama önbelleği: use_cache ile (önizlemede) salt-okunur kaynaklarda
+        her aşamanın çıktısı, kaynak kimliği + o aşamaya kadarki tüm
+        parametrelerle anahtarlanıp saklanır. Tek bir slider sürüklenirken
+        ondan önceki aşamalar yeniden çalışmaz; değişen ilk aşamadan devam
+        edilir. Tam çözünürlüklü orijinal de salt-okunurdur, ancak çıktıları
+        önbellekte tutulmaz.
         """
-        result = image.copy()
-
-        # ── Parlaklık & Kontrast ──
-        brightness = self._adjustments["brightness"]
-        contrast = self._adjustments["contrast"]
-        if brightness != 0 or contrast != 0:
-            # Kontrast: alpha katsayısı (0.5 - 1.5 arası)
-            alpha = 1.0 + contrast / 100.0
-            # Parlaklık: beta değeri (-100 - 100 arası)
-            beta = brightness * 2.55  # 0-255 aralığına ölçekle
-            result = cv2.convertScaleAbs(result, alpha=alpha, beta=beta)
-
-        # ── Pozlama (Exposure) ──
-        exposure = self._adjustments["exposure"] / 100.0
-        if exposure != 0:
-            # EV (Exposure Value) cinsinden: 2^EV çarpanı
-            factor = pow(2, exposure)
-            result = np.clip(result.astype(np.float32) * factor, 0, 255).astype(np.uint8)
-
-        # ── Gama Düzeltme ──
-        gamma = self._adjustments["gamma"] / 100.0  # Slider 10-300, gerçek 0.1-3.0
-        if abs(gamma - 1.0) > 0.01:
-            inv_gamma = 1.0 / gamma
-            # Arama tablosu ile hızlı gama dönüşümü
-            table = np.array([
-                ((i / 255.0) ** inv_gamma) * 255
-                for i in range(256)
-            ], dtype=np.uint8)
-            result = cv2.LUT(result, table)
+        stages = (
+            (_COLOR_STAGE_PARAMS, self._apply_color_stage),
+            (("highlights", "shadows"), self._apply_tonal_stage),
+            (("clarity",), self._apply_clarity_stage),
+            (("sharpness",), self._apply_sharpness_stage),
+        )
+        cacheable = use_cache and not image.flags.writeable
+        key = (image.ctypes.data, image.shape)
+        result = image
+
+        for index, (params, stage) in enumerate(stages):
+            key += tuple(adjustments[name] for name in params)
+            cached = self._stage_cache[index]
+            if cacheable and cached is not None and cached[0] == key and cached[1]() is image:
+                result = cached[2]
+                continue
+
+            if cancelled is not None and cancelled():
+                raise PipelineCancelled()
+            output = stage(result, adjustments, cacheable)
+            if cacheable and output is not result:
+                # Önbellekteki çıktı sonraki aşamalarca değiştirilmemeli
+                output.flags.writeable = False
+                self._stage_cache[index] = (key, weakref.ref(image), output)
+            result = output
+
+        return result
+
+    def _apply_color_stage(self, image: np.ndarray, adjustments: dict,
+                           use_cache: bool = False) -> np.ndarray:
+        """
+        Nokta tabanlı ton/renk ayarları ve HSV tabanlı ayarlamalar
+        (parlaklık, kontrast, pozlama, gama, doygunluk, ton, canlılık,
+        sıcaklık, renk tonu).
+        """
+        result = image
+
+        saturation = adjustments["saturation"]
+        hue = adjustments["hue"]
+        vibrance = adjustments["vibrance"]
+        hsv_active = saturation != 0 or hue != 0 or vibrance != 0
+
+        # Gama slider'ı 10-300, gerçek değer 0.1-3.0
+        tone_params = (
+            adjustments["brightness"], adjustments["contrast"],
+            adjustments["exposure"] / 100.0, adjustments["gamma"] / 100.0,
+        )
+        color_params = (adjustments["temperature"], adjustments["tint"])
+        color_shift = None
+
+        if hsv_active or _tone_lut(*tone_params) is None:
+            # ── Parlaklık, Kontrast, Pozlama, Gama (tek tablo) ──
+            tone_lut = _tone_lut(*tone_params)
+            color_lut = None
+            # ── Sıcaklık & Renk Tonu (HSV'den sonra) ──
+            # Birleştirilecek tablo yoksa doygun uint8 skaler toplama
+            # (SIMD) 3 kanallı tablodan daha hızlıdır.
+            color_shift = _color_shift_scalar(*color_params)
+        else:
+            # Arada HSV adımı yoksa tüm nokta tabanlı ayarlar tek tablodadır
+            tone_lut = None
+            color_lut = _combined_lut(*tone_params, *color_params)
 
         # ── HSV Tabanlı Ayarlamalar (Doygunluk, Ton, Canlılık) ──
-        saturation = self._adjustments["saturation"]
-        hue = self._adjustments["hue"]
-        vibrance = self._adjustments["vibrance"]
-
-        if saturation != 0 or hue != 0 or vibrance != 0:
-            hsv = cv2.cvtColor(result, cv2.COLOR_BGR2HSV).astype(np.float32)
-
-            # Ton (Hue) kaydırma
-            if hue != 0:
-                hsv[:, :, 0] = (hsv[:, :, 0] + hue / 2) % 180
-
-            # Doygunluk ayarı
-            if saturation != 0:
-                factor = 1.0 + saturation / 100.0
-                hsv[:, :, 1] = np.clip(hsv[:, :, 1] * factor, 0, 255)
-
-            # Canlılık (düşük doygunluğu daha çok etkiler)
-            if vibrance != 0:
-                s = hsv[:, :, 1]
-                # Düşük doygunluklu piksellere daha fazla etki
-                low_sat_mask = 1.0 - (s / 255.0)
-                boost = (vibrance / 100.0) * low_sat_mask * 50
-                hsv[:, :, 1] = np.clip(s + boost, 0, 255)
-
-            hsv = np.clip(hsv, 0, 255).astype(np.uint8)
+        if hsv_active:
+            # Ton tablosu + BGR→HSV, sürükleme boyunca önbellekten gelir
+            hsv_u8 = self._get_pre_hsv(result, tone_params, tone_lut, use_cache)
+            # H ve S ayarları yalnızca kendi kanal değerlerine bağlıdır:
+            # tek 3 kanallı tabloyla (V değişmez) tek geçişte uygulanır
+            hsv = cv2.LUT(hsv_u8, _hsv_lut(hue, saturation, vibrance))
             result = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
 
-        # ── Sıcaklık (Temperature) ──
-        temperature = self._adjustments["temperature"]
-        if temperature != 0:
-            result = result.astype(np.float32)
-            # Sıcak: Kırmızı artır, Mavi azalt | Soğuk: tersi
-            shift = temperature * 0.3
-            result[:, :, 0] = np.clip(result[:, :, 0] - shift, 0, 255)  # Mavi
-            result[:, :, 2] = np.clip(result[:, :, 2] + shift, 0, 255)  # Kırmızı
-            result = result.astype(np.uint8)
-
-        # ── Renk Tonu (Tint) ──
-        tint = self._adjustments["tint"]
-        if tint != 0:
-            result = result.astype(np.float32)
-            # Yeşil-Magenta ekseni
-            shift = tint * 0.3
-            result[:, :, 1] = np.clip(result[:, :, 1] + shift, 0, 255)  # Yeşil
-            result = result.astype(np.uint8)
-
-        # ── Açık Tonlar (Highlights) ──
-        highlights = self._adjustments["highlights"]
-        if highlights != 0:
-            result = self._adjust_tonal_range(result, highlights, is_highlights=True)
-
-        # ── Koyu Tonlar (Shadows) ──
-        shadows = self._adjustments["shadows"]
-        if shadows != 0:
-            result = self._adjust_tonal_range(result, shadows, is_highlights=False)
-
-        # ── Netlik (Clarity) ──
-        clarity = self._adjustments["clarity"]
-        if clarity != 0:
-            result = self._apply_clarity(result, clarity)
-
-        # ── Keskinlik (Sharpness) ──
-        sharpness = self._adjustments["sharpness"]
-        if sharpness > 0:
-            amount = sharpness / 100.0
-            blurred = cv2.GaussianBlur(result, (0, 0), 2)
-            result = cv2.addWeighted(result, 1 + amount, blurred, -amount, 0)
-            result = np.clip(result, 0, 255).astype(np.uint8)
+        if color_lut is not None:
+            result = cv2.LUT(result, color_lut)
+        elif color_shift is not None:
+            result = cv2.add(result, color_shift)
 
         return result
 
-    @staticmethod
-    def _adjust_tonal_range(image: np.ndarray, value: float,
-                            is_highlights: bool) -> np.ndarray:
+    def _apply_tonal_stage(self, image: np.ndarray, adjustments: dict,
+                           use_cache: bool = False) -> np.ndarray:
+        """Açık Tonlar (Highlights) & Koyu Tonlar (Shadows)."""
+        highlights = adjustments["highlights"]
+        shadows = adjustments["shadows"]
+        if highlights == 0 and shadows == 0:
+            return image
+        return self._adjust_tonal_range(image, highlights, shadows, use_cache)
+
+    def _apply_clarity_stage(self, image: np.ndarray, adjustments: dict,
+                             use_cache: bool = False) -> np.ndarray:
+        """Netlik (Clarity)."""
+        clarity = adjustments["clarity"]
+        if clarity == 0:
+            return image
+        return self._apply_clarity(image, clarity)
+
+    def _apply_sharpness_stage(self, image: np.ndarray, adjustments: dict,
+                               use_cache: bool = False) -> np.ndarray:
+        """Keskinlik (Sharpness)."""
+        sharpness = adjustments["sharpness"]
+        if sharpness <= 0:
+            return image
+        amount = sharpness / 100.0
+        blurred = cv2.GaussianBlur(image, (0, 0), 2)
+        # addWeighted uint8 sonucu zaten doyurur (ek clip/cast gerekmez)
+        return cv2.addWeighted(image, 1 + amount, blurred, -amount, 0)
+
+    def _get_pre_hsv(self, image: np.ndarray, tone_params: tuple,
+                     tone_lut: Optional[np.ndarray],
+                     use_cache: bool = False) -> np.ndarray:
         """
-        Açık veya koyu ton aralığını seçici olarak ayarlar.
-        Parlaklık maskesi kullanarak yalnızca hedef aralığı etkiler.
+        Ton tablosu uygulanmış görüntünün uint8 HSV karşılığını döndürür.
+        use_cache ile yalnızca salt-okunur kaynaklar önbelleğe alınır
+        (içerikleri değişemez); anahtar veri adresi, boyut ve ton
+        parametreleridir.
+        """
+        if not use_cache:
+            pre_hsv = cv2.LUT(image, tone_lut) if tone_lut is not None else image
+            return cv2.cvtColor(pre_hsv, cv2.COLOR_BGR2HSV)
+
+        key = (image.ctypes.data, image.shape, tone_params)
+        cached = self._hsv_cache
+        if cached is not None and cached[0] == key and cached[1]() is image:
+            return cached[2]
+
+        pre_hsv = cv2.LUT(image, tone_lut) if tone_lut is not None else image
+        hsv = cv2.cvtColor(pre_hsv, cv2.COLOR_BGR2HSV)
+        if not image.flags.writeable:
+            hsv.flags.writeable = False
+            self._hsv_cache = (key, weakref.ref(image), hsv)
+        return hsv
+
+    def _get_scratch(self, shape: tuple, slot: int = 0,
+                     dtype=np.float32) -> np.ndarray:
         """
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY).astype(np.float32) / 255.0
+        Verilen boyutta, iş parçacığına özel kalıcı bir çalışma tamponu
+        (varsayılan float32) döndürür.
+        İçerik tanımsızdır; her aşama tamponu tamamen üzerine yazar.
+        Boyut değişince (yeni görüntü) eski tampon bırakılır.
+        """
+        buffers = getattr(self._scratch, "buffers", None)
+        if buffers is None:
+            buffers = self._scratch.buffers = {}
+        buf = buffers.get(slot)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = buffers[slot] = np.empty(shape, dtype=dtype)
+        return buf
+
+    @staticmethod
+    def _compute_tonal_mask(image: np.ndarray, is_highlights: bool,
+                            out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Parlaklığa göre 0-1 aralığında açık/koyu ton seçim maskesi üretir."""
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        mask = np.divide(gray, np.float32(255.0), out=out, dtype=np.float32)
 
         if is_highlights:
             # Parlak pikselleri seç (sigmoid tabanlı maske)
-            mask = np.clip((gray - 0.5) * 2, 0, 1)
+            np.subtract(mask, np.float32(0.5), out=mask)
         else:
             # Koyu pikselleri seç
-            mask = np.clip((0.5 - gray) * 2, 0, 1)
+            np.subtract(np.float32(0.5), mask, out=mask)
+        np.multiply(mask, np.float32(2), out=mask)
+        np.clip(mask, 0, 1, out=mask)
+        return mask
+
+    def _get_tonal_mask(self, image: np.ndarray, is_highlights: bool,
+                        use_cache: bool = False) -> np.ndarray:
+        """
+        Ton maskesini döndürür; use_cache ile salt-okunur girdiler için
+        sonucu önbelleğe alır. Açık/koyu ton slider'ı sürüklenirken girdi
+        aynı kaldığından gri dönüşüm ve maske hesabı atlanır.
+        """
+        if not use_cache:
+            return self._compute_tonal_mask(image, is_highlights)
+
+        key = (image.ctypes.data, image.shape, is_highlights)
+        cached = self._tonal_cache.get(is_highlights)
+        if cached is not None and cached[0] == key and cached[1]() is image:
+            return cached[2]
+
+        mask = self._compute_tonal_mask(image, is_highlights)
+        if not image.flags.writeable:
+            mask.flags.writeable = False
+            self._tonal_cache[is_highlights] = (key, weakref.ref(image), mask)
+        return mask
+
+    def _adjust_tonal_range(self, image: np.ndarray, highlights: float,
+                            shadows: float, use_cache: bool = False) -> np.ndarray:
+        """
+        Açık ve koyu ton aralıklarını seçici olarak ayarlar.
+        Parlaklık maskesi kullanarak yalnızca hedef aralığı etkiler.
+        İki adım da aynı kalıcı float32 tamponda yürür; ara sonuç uint8'e
+        dönüştürülmez ve sonuç yalnızca en sonda bir kez uint8'e çevrilir.
+        """
+        h, w = image.shape[:2]
+        mask = self._get_scratch((h, w), slot=0)
+        work = self._get_scratch(image.shape, slot=1)
+        np.copyto(work, image)
+        source = image
+
+        for value, is_highlights in ((highlights, True), (shadows, False)):
+            if value == 0:
+                continue
+
+            if source is image:
+                # İlk adım: girdi değişmedikçe birim maske önbellekten gelir
+                unit_mask = self._get_tonal_mask(image, is_highlights, use_cache)
+            else:
+                # İkinci adım float32 ara sonuç üzerinde çalışır
+                unit_mask = self._compute_tonal_mask(source, is_highlights, out=mask)
+
+            # 0-255 aralığına ölçekle; maske 3 kanala kopyalanmadan yayınlanır
+            np.multiply(unit_mask, np.float32(value * 2.55), out=mask)
+            np.add(work, mask[:, :, None], out=work)
+            np.clip(work, 0, 255, out=work)
+            source = work
+
+        return work.astype(np.uint8)
 
-        mask = np.dstack([mask] * 3)
-        adjustment = value * 2.55 * mask  # 0-255 aralığına ölçekle
-        result = image.astype(np.float32) + adjustment
-        return np.clip(result, 0, 255).astype(np.uint8)
+    @staticmethod
+    def _low_frequency(image: np.ndarray) -> np.ndarray:
+        """
+        Netlik için sigma=10 Gaussian bulanıklığın piramit yaklaşımı.
+        Çeyrek çözünürlükte küçük bir Gaussian (~61x61 yerine ~15x15 çekirdek,
+        1/16 piksel) uygulanıp iki pyrUp ile geri büyütülür; tam çözünürlükteki
+        bulanıklıktan ortalama ~0.2 seviye sapar.
+        """
+        h, w = image.shape[:2]
+        if min(h, w) < _CLARITY_PYR_MIN_SIZE:
+            return cv2.GaussianBlur(image, (0, 0), 10)
+        half_size = ((w + 1) // 2, (h + 1) // 2)
+        small = cv2.pyrDown(cv2.pyrDown(image))
+        small = cv2.GaussianBlur(small, (0, 0), _CLARITY_PYR_SIGMA, dst=small)
+        return cv2.pyrUp(cv2.pyrUp(small, dstsize=half_size), dstsize=(w, h))
 
     @staticmethod
     def _apply_clarity(image: np.ndarray, value: float) -> np.ndarray:
@@ -334,88 +733,96 @@ class ImageProcessor:
         Lokal kontrast manipülasyonu ile detay vurgusu sağlar.
         """
         # Büyük çekirdekli bulanıklık ile düşük frekans bileşeni
-        blurred = cv2.GaussianBlur(image, (0, 0), 10)
-        # Detay katmanı = orijinal - bulanık
-        detail = cv2.subtract(image, blurred)
-        # Detayı güçlendir/zayıflat
+        blurred = ImageProcessor._low_frequency(image)
+        # Detayı güçlendir/zayıflat:
+        #   image + (image - blurred) * factor = image*(1+factor) - blurred*factor
+        # Detay ayrı bir uint8 katmanda tutulmaz; bu sayede negatif detay
+        # (image < blurred) sıfıra kırpılıp kaybolmaz. addWeighted doyurur.
         factor = value / 50.0
-        enhanced = cv2.addWeighted(image, 1.0, detail, factor, 0)
-        return np.clip(enhanced, 0, 255).astype(np.uint8)
+        return cv2.addWeighted(image, 1.0 + factor, blurred, -factor, 0)
 
-    def _apply_filters(self, image: np.ndarray) -> np.ndarray:
+    def _apply_filters(self, image: np.ndarray, filters: dict,
+                       cancelled: Optional[Callable[[], bool]] = None,
+                       use_cache: bool = False) -> np.ndarray:
         """Tüm aktif filtreleri sırayla uygular."""
         result = image
-        for filter_name, intensity in self._filters.items():
+        for filter_name, intensity in filters.items():
             if intensity > 0:
+                if cancelled is not None and cancelled():
+                    raise PipelineCancelled()
                 normalized_intensity = intensity / 100.0
-                result = FilterEngine.apply_filter(result, filter_name, normalized_intensity)
+                result = FilterEngine.apply_filter(
+                    result, filter_name, normalized_intensity, cache=use_cache
+                )
         return result
 
-    def _apply_noise(self, image: np.ndarray) -> np.ndarray:
+    def _apply_noise(self, image: np.ndarray, noise_params: dict) -> np.ndarray:
         """Gürültü efektini uygular (yoğunluk > 0 ise)."""
-        intensity = self._noise_params.get("intensity", 0)
+        intensity = noise_params.get("intensity", 0)
         if intensity <= 0:
             return image
 
         return NoiseEngine.apply_noise(
             image=image,
-            noise_type=self._noise_params["type"],
+            noise_type=noise_params["type"],
             intensity=intensity / 100.0,
-            monochrome=self._noise_params.get("monochrome", True),
-            scale=self._noise_params.get("scale", 1.0),
+            monochrome=noise_params.get("monochrome", True),
+            scale=noise_params.get("scale", 1.0),
         )
 
     # ─── Dönüşüm İşlemleri ───────────────────────────────────────────
 
     def apply_resize(self, width: int, height: int, method: str = "lanczos") -> None:
         """Görüntüyü yeniden boyutlandırır ve geçmişe kaydeder."""
-        if self._original is None:
+        source = self._original
+        if source is None:
             return
 
-        self._original = TransformEngine.resize(self._original, width, height, method)
-        self._preview_original = create_preview(
-            self._original, PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT
-        )
-        self._history.push_state(self._original)
-        self._reset_all_params()
+        if self._commit_transform(
+                source, TransformEngine.resize(source, width, height, method)):
+            self._reset_all_params()
 
     def apply_rotation(self, angle: float) -> None:
         """Görüntüyü döndürür ve geçmişe kaydeder."""
-        if self._original is None:
+        source = self._original
+        if source is None:
             return
 
-        self._original = TransformEngine.rotate(self._original, angle)
-        self._preview_original = create_preview(
-            self._original, PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT
-        )
-        self._history.push_state(self._original)
+        self._commit_transform(source, TransformEngine.rotate(source, angle))
 
     def apply_flip(self, horizontal: bool = True) -> None:
         """Görüntüyü çevirir ve geçmişe kaydeder."""
-        if self._original is None:
+        source = self._original
+        if source is None:
             return
 
         if horizontal:
-            self._original = TransformEngine.flip_horizontal(self._original)
+            result = TransformEngine.flip_horizontal(source)
         else:
-            self._original = TransformEngine.flip_vertical(self._original)
+            result = TransformEngine.flip_vertical(source)
+        self._commit_transform(source, result)
 
-        self._preview_original = create_preview(
-            self._original, PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT
-        )
-        self._history.push_state(self._original)
+    def _commit_transform(self, source: np.ndarray, result: np.ndarray) -> bool:
+        """
+        Dönüşüm sonucunu yeni orijinal yapar ve geçmişe kaydeder.
+        Dönüşüm worker'da sürerken orijinal değiştiyse (başka belge, geri
+        alma) sonuç artık o görüntüye ait değildir; atılır ve False döner.
+        """
+        if self._original is not source:
+            return False
+        self._original = result
+        self._history.push_state(result)
+        self._refresh_preview()
+        return True
 
     def apply_crop(self, x: int, y: int, w: int, h: int) -> None:
         """Görüntüyü kırpar ve geçmişe kaydeder."""
-        if self._original is None:
+        source = self._original
+        if source is None:
             return
 
-        self._original = TransformEngine.crop(self._original, x, y, w, h)
-        self._preview_original = create_preview(
-            self._original, PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT
-        )
-        self._history.push_state(self._original)
-        self._reset_all_params()
+        if self._commit_transform(source, TransformEngine.crop(source, x, y, w, h)):
+            self._reset_all_params()
 
     # ─── Değişiklikleri Uygulama ──────────────────────────────────────
 
@@ -432,10 +839,8 @@ class ImageProcessor:
         processed = self.process_full_resolution()
         if processed is not None:
             self._original = processed
-            self._preview_original = create_preview(
-                self._original, PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT
-            )
             self._history.push_state(self._original)
+            self._refresh_preview()
             self._reset_all_params()
 
     # ─── Geçmiş (Undo/Redo) ──────────────────────────────────────────
@@ -445,9 +850,7 @@ class ImageProcessor:
         state = self._history.undo()
         if state is not None:
             self._original = state
-            self._preview_original = create_preview(
-                self._original, PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT
-            )
+            self._refresh_preview()
             self._reset_all_params()
             return True
         return False
@@ -457,9 +860,7 @@ class ImageProcessor:
         state = self._history.redo()
         if state is not None:
             self._original = state
-            self._preview_original = create_preview(
-                self._original, PREVIEW_MAX_WIDTH, PREVIEW_MAX_HEIGHT
-            )
+            self._refresh_preview()
             self._reset_all_params()
             return True
         return False
@@ -484,10 +885,20 @@ class ImageProcessor:
     def processed(self) -> Optional[np.ndarray]:
         return self._processed
 
+    @property
+    def document_id(self) -> int:
+        """Yüklü belgenin kimliği (her yüklemede değişir)."""
+        return self._document_id
+
     @property
     def file_path(self) -> Optional[str]:
         return self._file_path
 
+    @property
+    def file_basename(self) -> Optional[str]:
+        """Dosya yolunun son bileşeni (yol yoksa None)."""
+        return self._file_basename
+
     @property
     def has_image(self) -> bool:
         return self._original is not None
@@ -502,11 +913,17 @@ class ImageProcessor:
 
     def has_pending_changes(self) -> bool:
         """Uygulanmamış değişiklik var mı kontrolü."""
-        for v in self._adjustments.values():
-            if v != 0 and v != 100:  # gamma varsayılanı 100
+        return self._params_pending(self._adjustments, self._filters, self._noise_params)
+
+    @staticmethod
+    def _params_pending(adjustments: dict, filters: dict, noise_params: dict) -> bool:
+        """Verilen parametre kümesi görüntüyü değiştiriyor mu kontrolü."""
+        for key, value in adjustments.items():
+            # Her parametre kendi varsayılanıyla karşılaştırılır (gamma = 100)
+            if value != ADJUSTMENT_DEFAULTS[key]:
                 return True
-        if self._filters:
+        if filters:
             return True
-        if self._noise_params.get("intensity", 0) > 0:
+        if noise_params.get("intensity", 0) > 0:
             return True
         return False
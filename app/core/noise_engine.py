@@ -4,9 +4,101 @@ Farklı gürültü türleri, yoğunluk kontrolü, monokrom/renkli seçenekleri
 ve ölçek parametresi ile profesyonel gürültü ekleme imkanı sağlar.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
 
+# İsteğe bağlı GPU desteği: CuPy kurulu ve CUDA aygıtı varsa büyük
+# görüntülerde gürültü GPU'da üretilip eklenir; yoksa NumPy yolu kullanılır.
+try:
+    import cupy as cp
+    _GPU_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    cp = None
+    _GPU_AVAILABLE = False
+
+# Bu ortalamanın altında Poisson'un normal yaklaşımı zayıflar; tam örnekleme yapılır
+_POISSON_EXACT_BELOW = 10.0
+
+# Aktarım maliyetini karşılamak için GPU yolu bu piksel sayısından itibaren kullanılır
+_GPU_MIN_PIXELS = 1_000_000
+
+
+# Modern PCG64 üreteci; eski np.random.* global durumundan daha hızlıdır
+_rng = np.random.default_rng()
+
+# ─── Paralel Rastgele Üretim ──────────────────────────────────────────
+# Büyük gürültü katmanları satır bantlarına bölünür ve her bant kendi
+# bağımsız akışına (SeedSequence.spawn) sahip üreteçle ayrı bir thread'de
+# doldurulur. NumPy doldurma döngülerinde GIL'i bıraktığından bantlar
+# gerçekten paralel çalışır. Thread sayısı OpenCV yapılandırmasıyla aynıdır.
+_NOISE_THREADS = max(1, (os.cpu_count() or 1) // 2)
+# Bu eleman sayısının altında thread'e dağıtma maliyeti kazancı aşar
+_PARALLEL_MIN_ELEMENTS = 1 << 20
+_band_rngs = [np.random.default_rng(s)
+              for s in np.random.SeedSequence().spawn(_NOISE_THREADS)]
+_band_pool = (ThreadPoolExecutor(_NOISE_THREADS, thread_name_prefix="noise")
+              if _NOISE_THREADS > 1 else None)
+
+
+def _fill(kind: str, shape: tuple) -> np.ndarray:
+    """
+    float32 rastgele dizi üretir (kind: "standard_normal" veya "random").
+    Küçük dizilerde tek üreteç, büyüklerde satır bantları paralel doldurulur.
+    """
+    out = np.empty(shape, dtype=np.float32)
+    if _band_pool is None or out.size < _PARALLEL_MIN_ELEMENTS:
+        getattr(_rng, kind)(dtype=np.float32, out=out)
+        return out
+    step = -(-shape[0] // _NOISE_THREADS)
+    futures = [
+        _band_pool.submit(getattr(rng, kind), dtype=np.float32,
+                          out=out[i * step:(i + 1) * step])
+        for i, rng in enumerate(_band_rngs) if i * step < shape[0]
+    ]
+    for future in futures:
+        future.result()
+    return out
+
+
+def _standard_normal(shape: tuple) -> np.ndarray:
+    """N(0, 1) float32 gürültü."""
+    return _fill("standard_normal", shape)
+
+
+# Renkli tuz-biberde her pikselin hangi kanalları etkileyeceğini seçen bit maskeleri
+_CHANNEL_BITS = np.array([1, 2, 4], dtype=np.uint8)
+
+
+def _uniform_noise(amplitude: float, shape: tuple) -> np.ndarray:
+    """[-amplitude, amplitude) aralığında doğrudan float32 düzgün gürültü üretir."""
+    noise = _fill("random", shape)
+    noise *= np.float32(2.0 * amplitude)
+    noise -= np.float32(amplitude)
+    return noise
+
+
+def _use_gpu(image: np.ndarray, scale: float) -> bool:
+    """Gürültünün GPU'da üretilip üretilmeyeceğine karar verir."""
+    return (_GPU_AVAILABLE and scale <= 1.0
+            and image.shape[0] * image.shape[1] >= _GPU_MIN_PIXELS)
+
+
+def _gpu_add_gaussian(image: np.ndarray, sigma: float, monochrome: bool) -> np.ndarray:
+    """
+    image + N(0, 1) * sigma işlemini tamamen GPU'da yapar.
+    Yalnızca uint8 girdi yüklenir ve uint8 sonuç indirilir.
+    """
+    h, w = image.shape[:2]
+    shape = (h, w, 1) if monochrome else (h, w, 3)
+    gpu_image = cp.asarray(image)
+    noise = cp.random.standard_normal(shape, dtype=cp.float32)
+    noise *= cp.float32(sigma)
+    noisy = gpu_image.astype(cp.float32) + noise
+    return cp.asnumpy(cp.clip(noisy, 0, 255).astype(cp.uint8))
+
 
 class NoiseEngine:
     """
@@ -18,11 +110,15 @@ class NoiseEngine:
         - scale: Gürültü ölçeği (1.0 = piksel bazlı, >1 = büyük tanecikli)
     """
 
+    # Gürültü türü → metot tablosu (sınıf tanımının sonunda doldurulur)
+    _NOISE_MAP: dict = {}
+
     @staticmethod
     def _generate_noise_layer(shape: tuple, monochrome: bool, scale: float) -> np.ndarray:
         """
         Temel gürültü katmanı oluşturur.
-        Monokrom modda tek kanallı, renkli modda 3 kanallı gürültü üretir.
+        Monokrom modda tek kanallı (h, w, 1), renkli modda 3 kanallı gürültü
+        üretir; tek kanallı katman görüntüyle işlemde kopyasız yayınlanır.
         Ölçek parametresi ile gürültü tanecik boyutu kontrol edilir.
         """
         h, w = shape[:2]
@@ -32,18 +128,18 @@ class NoiseEngine:
             small_h = max(1, int(h / scale))
             small_w = max(1, int(w / scale))
             if monochrome:
-                noise_small = np.random.randn(small_h, small_w).astype(np.float32)
+                noise_small = _standard_normal((small_h, small_w))
                 noise = cv2.resize(noise_small, (w, h), interpolation=cv2.INTER_LINEAR)
-                noise = np.dstack([noise] * 3)
+                noise = noise[:, :, None]
             else:
-                noise_small = np.random.randn(small_h, small_w, 3).astype(np.float32)
+                noise_small = _standard_normal((small_h, small_w, 3))
                 noise = cv2.resize(noise_small, (w, h), interpolation=cv2.INTER_LINEAR)
         else:
             if monochrome:
-                noise = np.random.randn(h, w).astype(np.float32)
-                noise = np.dstack([noise] * 3)
+                noise = _standard_normal((h, w))
+                noise = noise[:, :, None]
             else:
-                noise = np.random.randn(h, w, 3).astype(np.float32)
+                noise = _standard_normal((h, w, 3))
 
         return noise
 
@@ -60,6 +156,8 @@ class NoiseEngine:
 
         # Standart sapma yoğunluğa göre ayarlanır (0-80 arası)
         sigma = intensity * 80.0
+        if _use_gpu(image, scale):
+            return _gpu_add_gaussian(image, sigma, monochrome)
         noise = NoiseEngine._generate_noise_layer(image.shape, monochrome, scale)
 
         # Gürültüyü görüntüye ekle
@@ -82,33 +180,44 @@ class NoiseEngine:
         # Etkilenecek piksel oranı (yoğunluğa göre 0-%20)
         prob = intensity * 0.20
 
+        # Float maske yerine etkilenecek pikseller doğrudan indeksle örneklenir.
+        # Poisson sayıda (iadeli) çekim, beklenen olarak piksellerin tam prob
+        # oranını kapsar; her çekim %50 tuz / %50 biber etiketlenir.
+        grid_h, grid_w = h, w
         if scale > 1.0:
-            # Büyük tanecikli tuz-biber
-            small_h = max(1, int(h / scale))
-            small_w = max(1, int(w / scale))
-            mask_small = np.random.random((small_h, small_w))
-            mask = cv2.resize(mask_small, (w, h), interpolation=cv2.INTER_NEAREST)
-        else:
-            mask = np.random.random((h, w))
-
-        # Tuz (beyaz piksel) ekleme
-        salt_mask = mask < (prob / 2)
-        if monochrome:
-            result[salt_mask] = 255
-        else:
-            # Renkli modda rastgele kanalları etkile
-            for c in range(3):
-                channel_mask = salt_mask & (np.random.random((h, w)) > 0.5)
-                result[:, :, c][channel_mask] = 255
+            # Büyük tanecikli tuz-biber: küçük ızgarada seç, en yakın komşuyla büyüt
+            grid_h = max(1, int(h / scale))
+            grid_w = max(1, int(w / scale))
+        n = grid_h * grid_w
+        count = _rng.poisson(-n * np.log1p(-prob))
+        idx = _rng.integers(0, n, size=count)
+        # 1 = tuz, 2 = biber
+        codes = _rng.integers(1, 3, size=count, dtype=np.uint8)
 
-        # Biber (siyah piksel) ekleme
-        pepper_mask = mask > (1 - prob / 2)
+        if scale > 1.0:
+            category = np.zeros(n, dtype=np.uint8)
+            category[idx] = codes
+            category = cv2.resize(category.reshape(grid_h, grid_w), (w, h),
+                                  interpolation=cv2.INTER_NEAREST).ravel()
+            idx = np.flatnonzero(category)
+            codes = category[idx]
+
+        # Tuz (beyaz piksel) = 255, biber (siyah piksel) = 0
+        values = np.where(codes == 1, 255, 0).astype(np.uint8)
+
+        # Piksel başına bir satır (h*w, 3) görünümü; result yeni bir kopyadır.
+        # Aynı piksele birden çok çekim düşerse rastgele sıradaki sonuncusu kalır.
+        pixels = result.reshape(-1, 3)
         if monochrome:
-            result[pepper_mask] = 0
+            pixels[idx] = values[:, None]
         else:
-            for c in range(3):
-                channel_mask = pepper_mask & (np.random.random((h, w)) > 0.5)
-                result[:, :, c][channel_mask] = 0
+            # Renkli modda rastgele kanalları etkile: seçilen her piksel için
+            # 3 bit çekilir, her bit bir kanalı %50 olasılıkla seçer
+            bits = _rng.integers(0, 8, size=idx.size, dtype=np.uint8)
+            selected = (bits[:, None] & _CHANNEL_BITS) != 0
+            rows = pixels[idx]
+            rows[selected] = np.broadcast_to(values[:, None], rows.shape)[selected]
+            pixels[idx] = rows
 
         return result
 
@@ -126,8 +235,24 @@ class NoiseEngine:
         # Lambda parametresini yoğunluğa göre ayarla
         lam = max(1.0, 256.0 / (1.0 + intensity * 50))
 
-        noisy = np.random.poisson(image.astype(np.float32) / lam) * lam
-        noisy = np.clip(noisy, 0, 255).astype(np.uint8)
+        means = image.astype(np.float32)
+        means *= np.float32(1.0 / lam)
+
+        if lam * _POISSON_EXACT_BELOW > 255:
+            # Tüm ortalamalar küçük: yaklaşım geçersiz, tam Poisson örnekle
+            noisy = _rng.poisson(means).astype(np.float32)
+        else:
+            # Büyük ortalamalarda Poisson(m) ≈ N(m, √m): reddetmeli örnekleme
+            # yerine float32 normal dağılım, yalnızca küçük ortalamalı
+            # (koyu) pikseller tam Poisson ile örneklenir
+            noisy = _standard_normal(image.shape)
+            noisy *= np.sqrt(means)
+            noisy += means
+            exact = means < _POISSON_EXACT_BELOW
+            noisy[exact] = _rng.poisson(means[exact])
+
+        noisy *= np.float32(lam)
+        noisy = np.clip(noisy, 0, 255, out=noisy).astype(np.uint8)
 
         # Yoğunluk ile orijinali karıştır
         return cv2.addWeighted(image, 1.0 - intensity, noisy, intensity, 0)
@@ -167,18 +292,18 @@ class NoiseEngine:
             small_h = max(1, int(h / scale))
             small_w = max(1, int(w / scale))
             if monochrome:
-                noise_small = np.random.uniform(-amplitude, amplitude, (small_h, small_w)).astype(np.float32)
+                noise_small = _uniform_noise(amplitude, (small_h, small_w))
                 noise = cv2.resize(noise_small, (w, h), interpolation=cv2.INTER_LINEAR)
-                noise = np.dstack([noise] * 3)
+                noise = noise[:, :, None]
             else:
-                noise_small = np.random.uniform(-amplitude, amplitude, (small_h, small_w, 3)).astype(np.float32)
+                noise_small = _uniform_noise(amplitude, (small_h, small_w, 3))
                 noise = cv2.resize(noise_small, (w, h), interpolation=cv2.INTER_LINEAR)
         else:
             if monochrome:
-                noise = np.random.uniform(-amplitude, amplitude, (h, w)).astype(np.float32)
-                noise = np.dstack([noise] * 3)
+                noise = _uniform_noise(amplitude, (h, w))
+                noise = noise[:, :, None]
             else:
-                noise = np.random.uniform(-amplitude, amplitude, (h, w, 3)).astype(np.float32)
+                noise = _uniform_noise(amplitude, (h, w, 3))
 
         noisy = image.astype(np.float32) + noise
         return np.clip(noisy, 0, 255).astype(np.uint8)
@@ -194,20 +319,23 @@ class NoiseEngine:
         if intensity <= 0:
             return image.copy()
 
-        h, w = image.shape[:2]
         grain = NoiseEngine._generate_noise_layer(image.shape, monochrome, scale)
+        sigma = intensity * 60.0
 
-        # Parlaklık haritası oluştur (koyu alanlar daha fazla gürültü alır)
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY).astype(np.float32) / 255.0
-        # Koyu alanlarda daha güçlü, parlak alanlarda daha zayıf
-        luminance_mask = 1.0 - gray * 0.6
-        luminance_mask = np.dstack([luminance_mask] * 3)
+        # Parlaklık ağırlığı: sigma * (1 - 0.6 * gri/255). Koyu alanlarda daha
+        # güçlü, parlak alanlarda daha zayıf; sigma ağırlığa katlanarak tek
+        # float32 haritada, ara diziler olmadan yerinde hesaplanır.
+        weight = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY).astype(np.float32)
+        weight *= np.float32(-0.6 * sigma / 255.0)
+        weight += np.float32(sigma)
 
-        sigma = intensity * 60.0
-        grain_weighted = grain * sigma * luminance_mask
+        # Taze üretilen gürültü katmanı yerinde ağırlıklandırılır
+        grain *= weight[:, :, None]
 
-        noisy = image.astype(np.float32) + grain_weighted
-        return np.clip(noisy, 0, 255).astype(np.uint8)
+        noisy = image.astype(np.float32)
+        noisy += grain
+        np.clip(noisy, 0, 255, out=noisy)
+        return noisy.astype(np.uint8)
 
     @staticmethod
     def color_noise(image: np.ndarray, intensity: float,
@@ -222,6 +350,8 @@ class NoiseEngine:
 
         h, w = image.shape[:2]
         sigma = intensity * 50.0
+        if _use_gpu(image, scale):
+            return _gpu_add_gaussian(image, sigma, monochrome=False)
 
         # Her kanal için farklı gürültü üret (renk gürültüsünün doğası)
         if scale > 1.0:
@@ -229,10 +359,10 @@ class NoiseEngine:
             small_w = max(1, int(w / scale))
             noise = np.zeros((h, w, 3), dtype=np.float32)
             for c in range(3):
-                n = np.random.randn(small_h, small_w).astype(np.float32)
+                n = _standard_normal((small_h, small_w))
                 noise[:, :, c] = cv2.resize(n, (w, h), interpolation=cv2.INTER_LINEAR)
         else:
-            noise = np.random.randn(h, w, 3).astype(np.float32)
+            noise = _standard_normal((h, w, 3))
 
         noisy = image.astype(np.float32) + noise * sigma
         return np.clip(noisy, 0, 255).astype(np.uint8)
@@ -245,18 +375,21 @@ class NoiseEngine:
         Gürültü türüne göre ilgili metodu çağıran fabrika metodu.
         Tek giriş noktası olarak dışarıdan kullanılır.
         """
-        noise_map = {
-            "gaussian":    cls.gaussian,
-            "salt_pepper": cls.salt_pepper,
-            "poisson":     cls.poisson,
-            "speckle":     cls.speckle,
-            "uniform":     cls.uniform,
-            "film_grain":  cls.film_grain,
-            "color_noise": cls.color_noise,
-        }
-
-        method = noise_map.get(noise_type)
+        method = cls._NOISE_MAP.get(noise_type)
         if method is None:
             return image.copy()
 
         return method(image, intensity, monochrome, scale)
+
+
+# Gürültü türü → metot eşleştirmesi; her çağrıda yeniden kurulmaması için
+# sınıf tanımından sonra bir kez oluşturulur.
+NoiseEngine._NOISE_MAP = {
+    "gaussian":    NoiseEngine.gaussian,
+    "salt_pepper": NoiseEngine.salt_pepper,
+    "poisson":     NoiseEngine.poisson,
+    "speckle":     NoiseEngine.speckle,
+    "uniform":     NoiseEngine.uniform,
+    "film_grain":  NoiseEngine.film_grain,
+    "color_noise": NoiseEngine.color_noise,
+}
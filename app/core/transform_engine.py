@@ -3,8 +3,118 @@ Dönüşüm Motoru - Görüntü boyutlandırma, döndürme, çevirme ve kırpma
 Farklı interpolasyon yöntemleri desteklenir.
 """
 
+import logging
+import os
+import threading
+from contextlib import contextmanager
+
 import cv2
 import numpy as np
+from typing import Iterable, Iterator, Optional
+
+_log = logging.getLogger(__name__)
+
+
+def _init_opencv_runtime() -> None:
+    """
+    OpenCV'nin SIMD dağıtıcısını açar ve iş parçacığı sayısını çekirdek
+    sayısının yarısına ayarlar (diğer yarı UI ve işleme worker'ına kalır).
+    Bazı derlemelerde bu ayarlar varsayılan olarak kapalı/tek iş parçacıklıdır.
+    """
+    try:
+        cv2.setUseOptimized(True)
+        cv2.setNumThreads(max(1, (os.cpu_count() or 1) // 2))
+    except AttributeError:
+        return
+    _log.debug("OpenCV optimized=%s threads=%d",
+               cv2.useOptimized(), cv2.getNumThreads())
+
+
+_init_opencv_runtime()
+
+# İsteğe bağlı Pillow-SIMD arka ucu: AVX2 evrişimli yeniden örnekleyicisi
+# bilinear/bicubic/lanczos boyutlandırmada OpenCV'den hızlıdır. Pillow-SIMD
+# sürümleri ".postN" ekiyle yayımlanır; stok Pillow'un yeniden örnekleyicisi
+# OpenCV'den yavaş olduğundan yalnızca SIMD yapısı kullanılır. Sürüm paket
+# kökünden okunur; ağır PIL.Image modülü ilk boyutlandırmada yüklenir, açılış
+# süresine eklenmez.
+try:
+    import PIL
+    _PIL_SIMD = ".post" in PIL.__version__
+except ImportError:
+    _PIL_SIMD = False
+
+# Yöntem → Pillow yeniden örnekleme süzgecinin adı
+_PIL_FILTERS = {
+    "bilinear": "BILINEAR",
+    "bicubic":  "BICUBIC",
+    "lanczos":  "LANCZOS",
+} if _PIL_SIMD else {}
+
+
+def _area_prefilter_factor(shape: tuple, width: int, height: int) -> int:
+    """
+    İki aşamalı Lanczos küçültme için INTER_AREA ön indirme katsayısını seçer.
+    Ara boyut hedefin en az 2 katı kalır; katsayı her iki kenarı tam
+    bölmelidir, çünkü OpenCV'nin hızlı alan ortalaması yalnızca tam sayı
+    oranlarda çalışır (kesirli oranda ön indirme tek aşamadan yavaştır).
+    Uygun katsayı yoksa 1 döner.
+    """
+    h, w = shape[:2]
+    factor = min(w // (2 * width), h // (2 * height))
+    while factor > 1 and (w % factor or h % factor):
+        factor -= 1
+    return factor
+
+
+# Açının dik açı sayılması için tolerans (derece)
+_RIGHT_ANGLE_TOLERANCE = 1e-6
+
+
+def _right_angle_quarter(angle: float) -> Optional[int]:
+    """Açı 90°'nin katıysa çeyrek sayısını (0-3), değilse None döndürür."""
+    quarter = round(angle / 90.0)
+    if abs(angle - quarter * 90.0) > _RIGHT_ANGLE_TOLERANCE:
+        return None
+    return quarter % 4
+
+
+# Ödünç verilebilir hedef tamponları: (boyut, dtype) → boş tampon listesi
+_DST_POOL_PER_SHAPE = 2
+_dst_pool: dict[tuple, list[np.ndarray]] = {}
+_dst_pool_lock = threading.Lock()
+
+
+def _borrow(shape: tuple, dtype) -> np.ndarray:
+    """Havuzdan verilen boyutta bir tampon alır; yoksa yenisini ayırır."""
+    key = (shape, np.dtype(dtype))
+    with _dst_pool_lock:
+        free = _dst_pool.get(key)
+        if free:
+            return free.pop()
+    return np.empty(shape, dtype=dtype)
+
+
+def _return(buf: np.ndarray) -> None:
+    """Tamponu havuza geri bırakır (boyut başına sınırlı sayıda tutulur)."""
+    key = (buf.shape, buf.dtype)
+    with _dst_pool_lock:
+        free = _dst_pool.setdefault(key, [])
+        if len(free) < _DST_POOL_PER_SHAPE:
+            free.append(buf)
+
+
+def _resize_pil(image: np.ndarray, width: int, height: int,
+                method: str) -> np.ndarray:
+    """
+    Pillow-SIMD ile yeniden boyutlandırır. Süzgeç her kanala aynı
+    uygulandığından BGR kanalları dönüştürülmeden opak bayt olarak geçer.
+    """
+    from PIL import Image
+    resampling = getattr(Image, "Resampling", Image)
+    resample = getattr(resampling, _PIL_FILTERS[method])
+    resized = Image.fromarray(image).resize((width, height), resample)
+    return np.array(resized)
 
 
 class TransformEngine:
@@ -22,9 +132,19 @@ class TransformEngine:
         "area":     cv2.INTER_AREA,
     }
 
+    @classmethod
+    def configure_threads(cls, count: int) -> None:
+        """
+        OpenCV iş parçacığı sayısını ayarlar. Etkileşimli önizlemede UI'ya
+        çekirdek bırakmak için düşürülebilir, toplu dışa aktarımda artırılabilir.
+        0 veya negatif değer OpenCV'nin kendi varsayılanına döner.
+        """
+        cv2.setNumThreads(count if count > 0 else -1)
+
     @classmethod
     def resize(cls, image: np.ndarray, width: int, height: int,
-               method: str = "lanczos") -> np.ndarray:
+               method: str = "lanczos",
+               dst: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Görüntüyü belirtilen boyutlara yeniden ölçeklendirir.
         Seçilen interpolasyon yöntemi ile kalite kontrolü sağlanır.
@@ -33,12 +153,81 @@ class TransformEngine:
             width: Hedef genişlik (piksel)
             height: Hedef yükseklik (piksel)
             method: İnterpolasyon yöntemi (nearest, bilinear, bicubic, lanczos, area)
+            dst: Verilirse sonuç bu (height, width, kanal) tampona yazılır
         """
         if image is None or width <= 0 or height <= 0:
             return image
 
+        # Pillow-SIMD yalnızca 8 bit gri/3 kanallı görüntülerde kullanılır
+        # (RGBA'da Pillow alfa ile ön çarpım yapar); area/nearest OpenCV'de kalır
+        if (method in _PIL_FILTERS and image.dtype == np.uint8
+                and (image.ndim == 2 or image.shape[2] == 3)):
+            resized = _resize_pil(image, width, height, method)
+            if dst is None:
+                return resized
+            np.copyto(dst, resized)
+            return dst
+
+        interp = cls.INTERPOLATION_MAP.get(method, cv2.INTER_LANCZOS4)
+
+        # Büyük Lanczos küçültmelerinde önce INTER_AREA ile tam sayı katına
+        # indirilir: alan ortalaması örtüşmeyi (aliasing) azaltır ve 8x8
+        # dokunuşlu Lanczos çok daha az kaynak piksel üzerinde çalışır.
+        # (4x4 bicubic küçültme zaten ön indirmeden ucuzdur.)
+        if interp == cv2.INTER_LANCZOS4:
+            factor = _area_prefilter_factor(image.shape, width, height)
+            if factor > 1:
+                h, w = image.shape[:2]
+                image = cv2.resize(image, (w // factor, h // factor),
+                                   interpolation=cv2.INTER_AREA)
+
+        return cv2.resize(image, (width, height), dst=dst, interpolation=interp)
+
+    @classmethod
+    @contextmanager
+    def borrow_resized(cls, image: np.ndarray, width: int, height: int,
+                       method: str = "lanczos") -> Iterator[np.ndarray]:
+        """
+        Sonucu havuzdan ödünç alınan bir tampona yazan resize.
+        Blok bitince tampon havuza döner; sonuç blok dışında tutulmamalıdır
+        (gerekirse kopyalanmalıdır). Aynı boyutta sık tekrarlanan, sonucu
+        hemen tüketilen ölçeklemelerde bellek ayırma/sayfa hatası yükünü kaldırır.
+
+            with TransformEngine.borrow_resized(img, 640, 480) as small:
+                ...
+        """
+        buf = _borrow((height, width) + image.shape[2:], image.dtype)
+        try:
+            yield cls.resize(image, width, height, method, dst=buf)
+        finally:
+            _return(buf)
+
+    @classmethod
+    def resize_batch(cls, images: Iterable[np.ndarray], width: int, height: int,
+                     method: str = "lanczos") -> Iterator[np.ndarray]:
+        """
+        Bir dizi görüntüyü (kırpımlar, kareler) aynı boyuta ölçekler.
+        Her kare resize ile aynı sonucu verir; aynı boyutlu ardışık karelerde
+        Lanczos ön indirmesinin ara tamponu yeniden kullanılır.
+        """
         interp = cls.INTERPOLATION_MAP.get(method, cv2.INTER_LANCZOS4)
-        return cv2.resize(image, (width, height), interpolation=interp)
+        scratch = None
+        for image in images:
+            if (image is None or width <= 0 or height <= 0
+                    or method in _PIL_FILTERS or interp != cv2.INTER_LANCZOS4):
+                yield cls.resize(image, width, height, method)
+                continue
+
+            factor = _area_prefilter_factor(image.shape, width, height)
+            if factor > 1:
+                h, w = image.shape[:2]
+                shape = (h // factor, w // factor) + image.shape[2:]
+                if scratch is None or scratch.shape != shape or scratch.dtype != image.dtype:
+                    scratch = np.empty(shape, dtype=image.dtype)
+                cv2.resize(image, (w // factor, h // factor), dst=scratch,
+                           interpolation=cv2.INTER_AREA)
+                image = scratch
+            yield cv2.resize(image, (width, height), interpolation=interp)
 
     @staticmethod
     def resize_by_percentage(image: np.ndarray, percentage: float,
@@ -84,6 +273,19 @@ class TransformEngine:
         if image is None:
             return image
 
+        # Dik açılar yeniden örnekleme gerektirmez: kayıpsız eksen
+        # değiştirme/çevirme ile (warpAffine'in piksel başına toplamı yerine)
+        # yapılır. Pozitif açı saat yönünün tersidir (getRotationMatrix2D gibi).
+        quarter = _right_angle_quarter(angle)
+        if quarter == 0:
+            return image.copy()
+        if quarter == 2:
+            return cv2.rotate(image, cv2.ROTATE_180)
+        if quarter is not None and expand:
+            # Genişlemeyen tuvalde 90°/270° kırpma içerir; warpAffine'de kalır
+            code = cv2.ROTATE_90_COUNTERCLOCKWISE if quarter == 1 else cv2.ROTATE_90_CLOCKWISE
+            return cv2.rotate(image, code)
+
         h, w = image.shape[:2]
         center = (w // 2, h // 2)
 
@@ -118,12 +320,39 @@ class TransformEngine:
             return image
         return cv2.flip(image, 0)
 
+    @staticmethod
+    def flip_horizontal_view(image: np.ndarray, copy: bool = False) -> np.ndarray:
+        """
+        Yatay çevrilmiş görüntüyü kopyasız dilim görünümü olarak döndürür.
+        Sonucu hemen tüketip bırakan çağıranlar (ör. önizleme) içindir;
+        görünüm kaynağın belleğini paylaşır ve bitişik değildir.
+        copy=True ise bitişik bağımsız bir dizi döndürülür.
+        """
+        if image is None:
+            return image
+        view = image[:, ::-1]
+        return np.ascontiguousarray(view) if copy else view
+
+    @staticmethod
+    def flip_vertical_view(image: np.ndarray, copy: bool = False) -> np.ndarray:
+        """
+        Dikey çevrilmiş görüntüyü kopyasız dilim görünümü olarak döndürür.
+        Bkz. flip_horizontal_view.
+        """
+        if image is None:
+            return image
+        view = image[::-1]
+        return np.ascontiguousarray(view) if copy else view
+
     @staticmethod
     def crop(image: np.ndarray, x: int, y: int,
-             width: int, height: int) -> np.ndarray:
+             width: int, height: int, copy: bool = True) -> np.ndarray:
         """
         Görüntünün belirtilen bölgesini kırpar.
         Koordinatlar sınır kontrolünden geçirilir.
+        copy=False ise bölge kopyalanmadan görünüm olarak döner; sonucu hemen
+        tüketen ara adımlar (ör. ardından resize) içindir. Geçmişe girecek
+        sonuçlar için varsayılan kopya kullanılmalıdır.
         """
         if image is None:
             return image
@@ -138,24 +367,31 @@ class TransformEngine:
         if x2 <= x or y2 <= y:
             return image.copy()
 
-        return image[y:y2, x:x2].copy()
+        region = image[y:y2, x:x2]
+        return region.copy() if copy else region
 
     @staticmethod
-    def auto_crop(image: np.ndarray, threshold: int = 10) -> np.ndarray:
+    def auto_crop(image: np.ndarray, threshold: int = 10,
+                  copy: bool = True) -> np.ndarray:
         """
         Boş (tek renkli) kenarları otomatik kırpar.
         Eşik değeri ile hangi piksellerin 'boş' sayılacağı belirlenir.
+        copy=False ise kırpılan bölge görünüm olarak döner (bkz. crop).
         """
         if image is None:
             return image
 
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        # İkili (binary) görüntüye dönüştür
-        _, thresh = cv2.threshold(gray, threshold, 255, cv2.THRESH_BINARY)
-        # Beyaz piksellerin sınırlayıcı kutusunu bul
-        coords = cv2.findNonZero(thresh)
-        if coords is None:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        # İkili maske ve koordinat listesi yerine satır/sütun maksimumları:
+        # eşiği aşan bir piksel içeren satır ve sütunlar dolu sayılır
+        rows = cv2.reduce(gray, 1, cv2.REDUCE_MAX).ravel() > threshold
+        if not rows.any():
             return image.copy()
+        cols = cv2.reduce(gray, 0, cv2.REDUCE_MAX).ravel() > threshold
 
-        x, y, w, h = cv2.boundingRect(coords)
-        return image[y:y + h, x:x + w].copy()
+        y0 = int(np.argmax(rows))
+        y1 = rows.size - int(np.argmax(rows[::-1]))
+        x0 = int(np.argmax(cols))
+        x1 = cols.size - int(np.argmax(cols[::-1]))
+        region = image[y0:y1, x0:x1]
+        return region.copy() if copy else region
@@ -4,12 +4,15 @@ Yakınlaştırma (zoom), kaydırma (pan) ve sığdırma (fit) desteklenir.
 Mouse tekerleği ile zoom, sürükleme ile pan yapılır.
 """
 
+import weakref
+
 import numpy as np
+from typing import Optional
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy
-from PySide6.QtCore import Qt, QPoint, Signal, QSize
+from PySide6.QtCore import Qt, QPoint, QRect, Signal, QSize
 from PySide6.QtGui import QPixmap, QPainter, QWheelEvent, QMouseEvent, QPaintEvent, QColor
 
-from app.utils.image_utils import numpy_to_qpixmap
+from app.utils.image_utils import numpy_to_qimage
 
 
 class CanvasWidget(QWidget):
@@ -31,6 +34,8 @@ class CanvasWidget(QWidget):
     # Yakınlaştırma sınırları
     MIN_ZOOM = 0.05
     MAX_ZOOM = 20.0
+    # Vekil (proxy) pixmap'in uzun kenarı
+    PROXY_SIZE = 1024
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -39,12 +44,25 @@ class CanvasWidget(QWidget):
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        # paintEvent tüm alanı kendisi doldurur; Qt'nin arka plan silmesi gereksiz
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
 
         # Görüntü verisi
         self._pixmap: QPixmap = QPixmap()
+        # _pixmap'in üretildiği salt-okunur diziye zayıf referans; aynı dizi
+        # yeniden verilirse içerik değişmemiş demektir, dönüşüm atlanır
+        self._image_ref: Optional[weakref.ref] = None
         self._zoom: float = 1.0
         self._offset = QPoint(0, 0)
 
+        # Küçültülmüş görüntü önbelleği: (zoom, pixmap anahtarı) değişmedikçe
+        # her çizimde tüm kaynak yeniden örneklenmez
+        self._pixmap_scaled: QPixmap = QPixmap()
+        self._scaled_key: tuple = ()
+        # Uzaklaştırılmış görünümde zoom değişiklikleri için vekil pixmap
+        self._proxy_pixmap: QPixmap = QPixmap()
+        self._proxy_key: int = 0
+
         # Sürükleme durumu
         self._dragging = False
         self._drag_start = QPoint()
@@ -57,72 +75,119 @@ class CanvasWidget(QWidget):
         )
 
     def set_image(self, image: np.ndarray) -> None:
-        """Görüntülenen görüntüyü günceller (NumPy dizisinden)."""
+        """
+        Görüntülenen görüntüyü günceller (NumPy dizisinden).
+        Son gösterilen salt-okunur dizinin aynısı gelirse (ör. bekleyen
+        düzenleme yokken önizleme kaynağı aynen döner) pixmap yeniden
+        üretilmez; yalnızca yeniden çizim istenir.
+        """
+        if (image is not None and not image.flags.writeable
+                and self._image_ref is not None and self._image_ref() is image):
+            self.update()
+            return
+        self._image_ref = None
         if image is None:
             self._pixmap = QPixmap()
+            self._pixmap_scaled = QPixmap()
+            self._scaled_key = ()
+            self._proxy_pixmap = QPixmap()
+            self._proxy_key = 0
             self._empty_label.setVisible(True)
         else:
-            self._pixmap = numpy_to_qpixmap(image)
+            # BGR verisi kopyasız QImage olarak sarılır ve tek adımda pixmap'e
+            # aktarılır; aktarım veriyi kopyaladığından dizinin yalnızca bu
+            # çağrı süresince yaşaması yeterlidir. Önizleme kareleri aynı
+            # boyutta geldiğinden mevcut pixmap'in arabelleği yeniden kullanılır
+            # (cacheKey yine değişir, ölçek önbellekleri geçersizleşir).
+            qimg = numpy_to_qimage(image)
+            if self._pixmap.isNull() or self._pixmap.size() != qimg.size():
+                self._pixmap = QPixmap.fromImage(qimg)
+            else:
+                self._pixmap.convertFromImage(qimg)
+            if not image.flags.writeable:
+                self._image_ref = weakref.ref(image)
             self._empty_label.setVisible(False)
         self.update()
 
+    def _get_proxy_pixmap(self) -> QPixmap:
+        """
+        Uzun kenarı PROXY_SIZE olan düşük çözünürlüklü vekil pixmap'i
+        döndürür. Her önizleme karesinde fazladan ölçekleme yapılmaması için
+        tembel üretilir ve yalnızca pixmap değişince yenilenir.
+        """
+        if max(self._pixmap.width(), self._pixmap.height()) <= self.PROXY_SIZE:
+            return self._pixmap
+        if self._proxy_key != self._pixmap.cacheKey():
+            self._proxy_pixmap = self._pixmap.scaled(
+                self.PROXY_SIZE, self.PROXY_SIZE,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            self._proxy_key = self._pixmap.cacheKey()
+        return self._proxy_pixmap
+
     def set_pixmap(self, pixmap: QPixmap) -> None:
         """Doğrudan QPixmap ile görüntü ayarlar."""
         self._pixmap = pixmap
+        self._image_ref = None
         self._empty_label.setVisible(pixmap.isNull())
         self.update()
 
     def fit_to_window(self) -> None:
-        """Görüntüyü pencereye sığdırır."""
-        if self._pixmap.isNull():
-            return
-
-        # Kullanılabilir alan
-        canvas_w = self.width() - 40  # Kenar boşlukları
-        canvas_h = self.height() - 40
-        img_w = self._pixmap.width()
-        img_h = self._pixmap.height()
-
-        if img_w <= 0 or img_h <= 0:
-            return
-
-        # Ölçek faktörü (en-boy oranını koru)
-        scale_x = canvas_w / img_w
-        scale_y = canvas_h / img_h
-        self._zoom = min(scale_x, scale_y, 1.0)  # En fazla %100
-
-        # Merkeze hizala
-        self._center_image()
-        self.zoom_changed.emit(self._zoom)
-        self.update()
+        """Görüntüyü pencereye sığdırır (en fazla %100)."""
+        scale = self._fit_scale()
+        if scale is not None:
+            self._apply_zoom(min(scale, 1.0))
 
     def zoom_to_fit(self) -> None:
         """Pencereye sığdır (1:1'den büyük de olabilir)."""
+        scale = self._fit_scale()
+        if scale is not None:
+            self._apply_zoom(scale)
+
+    def zoom_actual(self) -> None:
+        """Gerçek boyut (1:1 zoom)."""
+        self._apply_zoom(1.0)
+
+    def _fit_scale(self) -> Optional[float]:
+        """Görüntüyü kenar boşluklarıyla tuvale sığdıran ölçek (en-boy korunur)."""
         if self._pixmap.isNull():
-            return
+            return None
 
+        # Kullanılabilir alan (kenar boşlukları düşülür)
         canvas_w = self.width() - 40
         canvas_h = self.height() - 40
         img_w = self._pixmap.width()
         img_h = self._pixmap.height()
 
         if img_w <= 0 or img_h <= 0:
-            return
-
-        scale_x = canvas_w / img_w
-        scale_y = canvas_h / img_h
-        self._zoom = min(scale_x, scale_y)
+            return None
+        return min(canvas_w / img_w, canvas_h / img_h)
+
+    def _apply_zoom(self, zoom: float, anchor: Optional[QPoint] = None) -> None:
+        """
+        Yakınlaştırmayı uygular: anchor yoksa görüntü ortalanır, varsa o
+        nokta (ör. fare konumu) ekranda sabit kalacak şekilde kaydırılır.
+        Tüm zoom yolları bu tek noktadan sinyal yayınlar ve yeniden çizer.
+        """
+        if anchor is None:
+            self._zoom = zoom
+            self._center_image()
+        else:
+            scale_change = zoom / self._zoom
+            self._zoom = zoom
+            new_offset_x = anchor.x() - (anchor.x() - self._offset.x()) * scale_change
+            new_offset_y = anchor.y() - (anchor.y() - self._offset.y()) * scale_change
+            self._offset = QPoint(int(new_offset_x), int(new_offset_y))
 
-        self._center_image()
         self.zoom_changed.emit(self._zoom)
         self.update()
 
-    def zoom_actual(self) -> None:
-        """Gerçek boyut (1:1 zoom)."""
-        self._zoom = 1.0
-        self._center_image()
-        self.zoom_changed.emit(self._zoom)
-        self.update()
+    def _image_rect(self) -> QRect:
+        """Görüntünün tuvaldeki mevcut (zoom uygulanmış) dikdörtgeni."""
+        img_w = int(self._pixmap.width() * self._zoom)
+        img_h = int(self._pixmap.height() * self._zoom)
+        return QRect(self._offset, QSize(img_w, img_h))
 
     def _center_image(self) -> None:
         """Görüntüyü tuvalin ortasına hizalar."""
@@ -141,7 +206,6 @@ class CanvasWidget(QWidget):
     def paintEvent(self, event: QPaintEvent) -> None:
         """Tuval çizim olayı. Arka plan ve görüntüyü çizer."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
         # Arka plan
         painter.fillRect(self.rect(), QColor("#010409"))
@@ -155,15 +219,40 @@ class CanvasWidget(QWidget):
         self._empty_label.setVisible(False)
 
         # Görüntüyü çiz
-        img_w = int(self._pixmap.width() * self._zoom)
-        img_h = int(self._pixmap.height() * self._zoom)
-
-        target_rect = self._pixmap.rect()
-        target_rect.setWidth(img_w)
-        target_rect.setHeight(img_h)
-        target_rect.moveTopLeft(self._offset)
-
-        painter.drawPixmap(target_rect, self._pixmap)
+        target_rect = self._image_rect()
+        img_w = target_rect.width()
+        img_h = target_rect.height()
+
+        if self._zoom < 1.0:
+            # Küçültmede yumuşak ölçekleme tüm kaynağı okur: sonuç zoom ve
+            # pixmap değişene kadar saklanır, kaydırma basit bir kopyaya iner.
+            # Kopya cihaz pikselinde üretilir; yüksek DPI ekranda painter
+            # onu yeniden büyütmez.
+            dpr = self.devicePixelRatioF()
+            key = (self._zoom, self._pixmap.cacheKey(), dpr)
+            if key != self._scaled_key:
+                source = self._pixmap
+                if (self._scaled_key and self._scaled_key[1] == key[1]
+                        and max(img_w, img_h) * dpr <= self.PROXY_SIZE):
+                    # Aynı görüntüde yalnızca zoom değişti: cihaz pikselinde
+                    # vekilden küçük kalan boyutlar tam çözünürlük yerine
+                    # vekil pixmap'ten üretilir (vekil hiç büyütülmez)
+                    source = self._get_proxy_pixmap()
+                self._pixmap_scaled = source.scaled(
+                    round(img_w * dpr), round(img_h * dpr),
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+                self._pixmap_scaled.setDevicePixelRatio(dpr)
+                self._scaled_key = key
+            painter.drawPixmap(self._offset, self._pixmap_scaled)
+        else:
+            # Büyütmede yalnızca görünen bölge örneklenir (önbellek gereksiz,
+            # yüksek zoom'da bellek açısından da pahalı olurdu). Sürükleme
+            # sırasında hızlı örnekleme, bırakınca yumuşak çizim yapılır.
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform,
+                                  not self._dragging)
+            painter.drawPixmap(target_rect, self._pixmap)
 
         # Görüntü kenarlığı (ince)
         painter.setPen(QColor("#30363d"))
@@ -197,17 +286,7 @@ class CanvasWidget(QWidget):
             return
 
         # Fare noktasını merkez alarak zoom (pürüzsüz yakınlaştırma)
-        old_zoom = self._zoom
-        self._zoom = new_zoom
-
-        # Offset'i fare konumuna göre ayarla
-        scale_change = new_zoom / old_zoom
-        new_offset_x = mouse_pos.x() - (mouse_pos.x() - self._offset.x()) * scale_change
-        new_offset_y = mouse_pos.y() - (mouse_pos.y() - self._offset.y()) * scale_change
-        self._offset = QPoint(int(new_offset_x), int(new_offset_y))
-
-        self.zoom_changed.emit(self._zoom)
-        self.update()
+        self._apply_zoom(new_zoom, anchor=mouse_pos)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """Fare butonu basıldığında sürükleme başlatır."""
@@ -220,15 +299,20 @@ class CanvasWidget(QWidget):
         """Fare hareket ettirildiğinde görüntüyü kaydırır."""
         if self._dragging:
             delta = event.pos() - self._drag_start
+            old_rect = self._image_rect()
             self._offset += delta
             self._drag_start = event.pos()
-            self.update()
+            # Yalnızca görüntünün eski ve yeni konumunu kapsayan bölge
+            # (kenarlık payıyla) yeniden çizilir; Qt ardışık istekleri birleştirir
+            self.update(old_rect.united(self._image_rect()).adjusted(-2, -2, 2, 2))
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         """Fare butonu bırakıldığında sürüklemeyi sonlandırır."""
         if event.button() in (Qt.MouseButton.LeftButton, Qt.MouseButton.MiddleButton):
             self._dragging = False
             self.setCursor(Qt.CursorShape.ArrowCursor)
+            # Sürükleme boyunca hızlı örneklenen görüntüyü yumuşak yeniden çiz
+            self.update()
 
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         """Çift tıklamada pencereye sığdır."""
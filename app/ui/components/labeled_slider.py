@@ -7,7 +7,10 @@ Sıfırlama butonu ile hızlı varsayılan değere dönüş sağlanır.
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QSlider, QLabel, QPushButton
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
+
+# Sürükleme sırasında value_changed yayınlarını birleştirme süresi (ms)
+DEFAULT_DEBOUNCE_MS = 30
 
 
 class LabeledSlider(QWidget):
@@ -16,9 +19,13 @@ class LabeledSlider(QWidget):
     
     Sinyaller:
         value_changed(int): Slider değeri değiştiğinde tetiklenir
+        interaction_started: Kullanıcı slider'ı tutmaya başladığında
+        interaction_finished: Slider bırakıldığında (son değer yayınlandıktan sonra)
     """
 
     value_changed = Signal(int)
+    interaction_started = Signal()
+    interaction_finished = Signal()
 
     def __init__(
         self,
@@ -28,6 +35,7 @@ class LabeledSlider(QWidget):
         default_val: int = 0,
         suffix: str = "",
         display_scale: float = 1.0,
+        debounce: bool = False,
         parent=None
     ):
         """
@@ -38,6 +46,8 @@ class LabeledSlider(QWidget):
             default_val: Varsayılan (başlangıç) değer
             suffix: Değer sonrasına eklenecek metin (ör. '%', '°')
             display_scale: Gösterim için çarpan (ör. gamma 100→1.0)
+            debounce: True ise sürükleme sırasındaki değer değişiklikleri
+                DEFAULT_DEBOUNCE_MS içinde birleştirilip tek sinyal olarak yayınlanır
         """
         super().__init__(parent)
         self._default_val = default_val
@@ -45,6 +55,19 @@ class LabeledSlider(QWidget):
         self._display_scale = display_scale
         self._key = ""  # Parametre anahtarı (opsiyonel)
 
+        # Gösterim biçimi kurulumda bir kez seçilir (her adımda dal yok)
+        if display_scale != 1.0:
+            self._fmt = lambda v: f"{v * display_scale:.2f}{suffix}"
+        else:
+            self._fmt = lambda v: f"{v}{suffix}"
+
+        # Sürükleme patlamalarını birleştiren tek atımlık zamanlayıcı
+        self._pending_value = default_val
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(DEFAULT_DEBOUNCE_MS if debounce else 0)
+        self._emit_timer.timeout.connect(self._emit_pending)
+
         self._setup_ui(label, min_val, max_val, default_val)
 
     def _setup_ui(self, label: str, min_val: int, max_val: int, default_val: int):
@@ -59,7 +82,7 @@ class LabeledSlider(QWidget):
 
         # Parametre etiketi
         self._label = QLabel(label)
-        self._label.setStyleSheet("font-size: 12px; color: #c9d1d9;")
+        self._label.setObjectName("sliderLabel")
         top_row.addWidget(self._label)
 
         top_row.addStretch()
@@ -92,6 +115,11 @@ class LabeledSlider(QWidget):
 
         # Slider değeri değiştiğinde güncelle
         self._slider.valueChanged.connect(self._on_value_changed)
+        # Bırakıldığında bekleyen son değer hemen gönderilir
+        self._slider.sliderReleased.connect(self._flush_pending)
+        # Sürükleme başlangıç/bitişi dışarıya iletilir (bitiş, flush'tan sonra)
+        self._slider.sliderPressed.connect(self.interaction_started)
+        self._slider.sliderReleased.connect(self.interaction_finished)
 
         layout.addWidget(self._slider)
 
@@ -100,15 +128,29 @@ class LabeledSlider(QWidget):
         self._value_label.setText(self._format_value(value))
         # Sıfırla butonunu göster/gizle
         self._reset_btn.setVisible(value != self._default_val)
+        # Yalnızca kullanıcı sürüklerken birleştir; programatik değişiklikler,
+        # tıklama ve klavye adımları anında yayınlanır
+        self._pending_value = value
+        if self._emit_timer.interval() > 0 and self._slider.isSliderDown():
+            self._emit_timer.start()
+            return
+        self._emit_timer.stop()
         # Dışarıya sinyal gönder
         self.value_changed.emit(value)
 
+    def _emit_pending(self):
+        """Birleştirilmiş son değeri yayınlar."""
+        self.value_changed.emit(self._pending_value)
+
+    def _flush_pending(self):
+        """Bekleyen (henüz yayınlanmamış) değer varsa hemen yayınlar."""
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self._emit_pending()
+
     def _format_value(self, value: int) -> str:
         """Değeri gösterim formatına dönüştürür."""
-        if self._display_scale != 1.0:
-            display = value * self._display_scale
-            return f"{display:.2f}{self._suffix}"
-        return f"{value}{self._suffix}"
+        return self._fmt(value)
 
     def reset_value(self):
         """Slider'ı varsayılan değere sıfırlar."""
@@ -124,6 +166,11 @@ class LabeledSlider(QWidget):
         """Slider değerini programatik olarak ayarlar."""
         self._slider.setValue(value)
 
+    def set_debounce_ms(self, ms: int):
+        """Sürükleme birleştirme süresini ayarlar (0 = her adımda yayınla)."""
+        self._flush_pending()
+        self._emit_timer.setInterval(max(0, ms))
+
     def set_key(self, key: str):
         """Parametre anahtarını ayarlar (processor ile eşleştirme için)."""
         self._key = key
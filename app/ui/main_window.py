@@ -5,17 +5,20 @@ oluşturulur ve bağlanır.
 """
 
 import os
+import re
+from typing import Iterator, Optional
 import numpy as np
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QTabWidget,
     QToolBar, QStatusBar, QFileDialog, QMessageBox, QSplitter,
     QLabel, QApplication, QSizePolicy
 )
-from PySide6.QtCore import Qt, QTimer, QSize, Slot
-from PySide6.QtGui import QAction, QKeySequence, QIcon
+from PySide6.QtCore import Qt, QTimer, QSize, QSignalBlocker, Slot
+from PySide6.QtGui import QAction, QKeySequence, QIcon, QImageReader
 
 from app.core.image_processor import ImageProcessor
 from app.workers.processing_worker import ProcessingThread
+from app.workers.io_worker import FileIoWorker
 from app.ui.canvas_widget import CanvasWidget
 from app.ui.panels.adjustment_panel import AdjustmentPanel
 from app.ui.panels.filter_panel import FilterPanel
@@ -24,11 +27,57 @@ from app.ui.panels.transform_panel import TransformPanel
 from app.ui.dialogs.resize_dialog import ExportDialog
 from app.utils.constants import (
     APP_NAME, APP_VERSION, SUPPORTED_IMAGE_FORMATS,
-    SAVE_IMAGE_FORMATS, SLIDER_DEBOUNCE_MS
+    SAVE_IMAGE_FORMATS, SLIDER_DEBOUNCE_MS, PROCESSING_DEBOUNCE_MS,
+    INTERACTIVE_PREVIEW_SCALE, MAX_IMAGE_MEGAPIXELS, ADJUSTMENT_DEFAULTS,
 )
 from app.utils.image_utils import get_image_info
 
 
+def _extract_exts(name_filter: str) -> tuple[str, ...]:
+    """Qt dosya filtresindeki '*.uzantı' kalıplarını sıralı ve tekil döndürür."""
+    exts = re.findall(r"\*(\.[a-z0-9]+)", name_filter.lower())
+    return tuple(dict.fromkeys(exts))
+
+
+# Sürükle-bırak ile kabul edilen uzantılar; açma diyalogu filtresinden bir
+# kez türetilir, böylece iki liste birbirinden kopamaz
+_ACCEPTED_EXTS = _extract_exts(SUPPORTED_IMAGE_FORMATS)
+
+
+def _iter_accepted_paths(event) -> Iterator[str]:
+    """Bırakılan/sürüklenen URL'lerden desteklenen yerel dosya yollarını üretir."""
+    for url in event.mimeData().urls():
+        file_path = url.toLocalFile()
+        if file_path.lower().endswith(_ACCEPTED_EXTS):
+            yield file_path
+
+
+def _is_oversized(size: QSize) -> bool:
+    """
+    Başlıktan okunan boyut MAX_IMAGE_MEGAPIXELS'i aşıyor mu?
+    Boyut okunamıyorsa (ör. Qt eklentisi olmayan biçim) False.
+    """
+    if not size.isValid():
+        return False
+    return size.width() * size.height() / 1_000_000 > MAX_IMAGE_MEGAPIXELS
+
+
+def _decoded_size(file_path: str) -> int:
+    """
+    Dosya başlığındaki boyuttan çözülmüş BGR görüntünün bayt sayısını
+    tahmin eder; boyut okunamazsa 0.
+    """
+    size = QImageReader(file_path).size()
+    if not size.isValid():
+        return 0
+    return size.width() * size.height() * 3
+
+
+def _first_accepted_path(event) -> Optional[str]:
+    """İlk desteklenen dosya yolunu döndürür; ilk eşleşmede durur."""
+    return next(_iter_accepted_paths(event), None)
+
+
 class MainWindow(QMainWindow):
     """
     PixelForge ana penceresi.
@@ -53,10 +102,44 @@ class MainWindow(QMainWindow):
         self._debounce_timer = QTimer()
         self._debounce_timer.setSingleShot(True)
         self._debounce_timer.setInterval(SLIDER_DEBOUNCE_MS)
-        self._debounce_timer.timeout.connect(self._request_processing)
+        self._debounce_timer.timeout.connect(self._on_debounce_timeout)
+        # Pencere içinde ilk talepten sonra değişiklik geldi mi (son kenar)
+        self._trailing_pending = False
+        # Maliyet sınıfı → debounce süresi (ms)
+        self._debounce_ms = dict(PROCESSING_DEBOUNCE_MS)
 
         # İşleme durum takibi
         self._is_processing = False
+        # İşleme sürerken gelen talep (derinliği 1 olan posta kutusu)
+        self._pending_request = False
+        # Worker meşgulken gelen değişiklik: (kirli mi, maliyet sınıfı)
+        self._dirty = False
+        self._dirty_cost: Optional[str] = None
+        # Önizleme talep nesli; eskimiş worker kareleri bununla atılır
+        self._req_gen = 0
+        # Worker'da bekleyen/çalışan dönüşüm sayısı
+        self._pending_transforms = 0
+        # Dönüşümler sürerken biten yükleme: (dosya_yolu, görüntü)
+        self._deferred_load: Optional[tuple] = None
+        # Kullanıcı bir slider'ı sürüklüyor mu (düşük çözünürlüklü önizleme)
+        self._interactive = False
+        # Bu sürüklemede parametre değişti mi (bırakınca tam kalite gerekir)
+        self._drag_changed = False
+
+        # Dosya yükleme/kaydetme arka planda (thread havuzu) çalışır
+        self._io = FileIoWorker(parent=self)
+        self._io.loaded.connect(self._on_image_loaded)
+        self._io.saved.connect(self._on_image_saved)
+        # En son istenen yükleme; daha eski yüklemelerin sonucu yok sayılır
+        self._loading_path: Optional[str] = None
+        # Süren kaydetmeler: yol → (başarı mesajı, hata mesajı, pencere başlığı)
+        self._pending_saves: dict[str, tuple] = {}
+        # Son uygulanan eylem durumu (değişmediyse setEnabled çağrılmaz)
+        self._last_ui_state: Optional[tuple] = None
+        # Zoom etiketinde son gösterilen yüzde
+        self._last_zoom_pct: Optional[int] = None
+        # Boyut etiketi önbelleği: ((şekil, dtype), metin)
+        self._info_cache: Optional[tuple] = None
 
         self._setup_window()
         self._create_actions()
@@ -140,15 +223,12 @@ class MainWindow(QMainWindow):
         # ── Görünüm Eylemleri ──
         self._fit_action = QAction("Pencereye Sığdır", self)
         self._fit_action.setShortcut(QKeySequence("Ctrl+0"))
-        self._fit_action.triggered.connect(self._on_fit_to_window)
 
         self._zoom_fit_action = QAction("Sığdır (Büyüt)", self)
         self._zoom_fit_action.setShortcut(QKeySequence("Ctrl+9"))
-        self._zoom_fit_action.triggered.connect(self._on_zoom_fit)
 
         self._actual_size_action = QAction("Gerçek Boyut (1:1)", self)
         self._actual_size_action.setShortcut(QKeySequence("Ctrl+1"))
-        self._actual_size_action.triggered.connect(self._on_actual_size)
 
     def _create_menus(self):
         """Menü çubuğunu oluşturur."""
@@ -292,6 +372,12 @@ class MainWindow(QMainWindow):
     def _connect_signals(self):
         """Tüm sinyal-slot bağlantılarını kurar."""
 
+        # ── Görünüm eylemleri doğrudan tuval metotlarına bağlanır ──
+        # (eylemler tuvalden önce oluşturulduğu için bağlantı burada kurulur)
+        self._fit_action.triggered.connect(self._canvas.fit_to_window)
+        self._zoom_fit_action.triggered.connect(self._canvas.zoom_to_fit)
+        self._actual_size_action.triggered.connect(self._canvas.zoom_actual)
+
         # ── Ayarlama paneli sinyalleri ──
         self._adjustment_panel.adjustment_changed.connect(self._on_adjustment_changed)
         self._adjustment_panel.reset_all_requested.connect(self._on_reset_adjustments)
@@ -304,6 +390,11 @@ class MainWindow(QMainWindow):
         self._noise_panel.noise_changed.connect(self._on_noise_changed)
         self._noise_panel.reset_requested.connect(self._on_reset_noise)
 
+        # ── Sürükleme (etkileşim) modu ──
+        for panel in (self._adjustment_panel, self._filter_panel, self._noise_panel):
+            panel.interaction_started.connect(self._on_interaction_started)
+            panel.interaction_finished.connect(self._on_interaction_finished)
+
         # ── Dönüşüm paneli sinyalleri ──
         self._transform_panel.resize_requested.connect(self._on_resize)
         self._transform_panel.rotate_requested.connect(self._on_rotate)
@@ -313,6 +404,7 @@ class MainWindow(QMainWindow):
         self._processing_thread.worker.processing_started.connect(self._on_processing_started)
         self._processing_thread.worker.processing_finished.connect(self._on_processing_finished)
         self._processing_thread.worker.error_occurred.connect(self._on_processing_error)
+        self._processing_thread.worker.transform_finished.connect(self._on_transform_finished)
 
         # ── Tuval sinyalleri ──
         self._canvas.zoom_changed.connect(self._on_zoom_changed)
@@ -324,60 +416,140 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_open(self):
         """Dosya aç diyalogu ile görüntü yükler."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Görüntü Aç", "", SUPPORTED_IMAGE_FORMATS
+        self._show_file_dialog(
+            "Görüntü Aç", SUPPORTED_IMAGE_FORMATS, self._load_file
         )
-        if not file_path:
-            return
 
-        if self._processor.load_image(file_path):
-            # Başarılı yükleme
-            self._update_canvas_from_original()
-            self._update_ui_state()
-            self._update_status_bar()
-            self._canvas.fit_to_window()
+    def _show_file_dialog(self, caption: str, name_filter: str, on_selected,
+                          *, save: bool = False, default_name: str = ""):
+        """
+        Pencere-modal dosya diyalogunu open() ile açar; seçim fileSelected
+        sinyaliyle on_selected'a iletilir. Statik getOpenFileName/
+        getSaveFileName'in aksine çağıran yığında beklenmez, yavaş ağ
+        sürücülerinde de olay döngüsü (çizim, zamanlayıcılar, worker
+        sonuçları) işlemeye devam eder.
+        """
+        dialog = QFileDialog(self, caption, "", name_filter)
+        if save:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        else:
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        if default_name:
+            dialog.selectFile(default_name)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(on_selected)
+        dialog.open()
 
-            # Dönüşüm panelini güncelle
-            w, h = self._processor.image_size
-            self._transform_panel.update_image_size(w, h)
+    @Slot(str)
+    def _load_file(self, file_path: str):
+        """
+        Dosyayı thread havuzunda çözer; UI beklemeden yanıt vermeye devam
+        eder. İşlemci durumu, sonuç geldiğinde ana thread'de güncellenir.
+        """
+        reduce = self._probe_reduce_factor(file_path)
+        if reduce is None:
+            return
+        self._loading_path = file_path
+        self._processing_label.setText("Yükleniyor...")
+        self._io.load(file_path, ImageProcessor.decode_image, reduce)
 
-            # Panelleri sıfırla
-            self._adjustment_panel.reset_all()
-            self._filter_panel.reset_all()
-            self._noise_panel.reset_all()
+    def _probe_reduce_factor(self, file_path: str) -> Optional[int]:
+        """
+        Çözmeden önce yalnızca dosya başlığından boyutu okur. Görüntü
+        MAX_IMAGE_MEGAPIXELS'i aşıyorsa küçültülmüş yükleme önerilir.
+        Döndürür: küçültme faktörü (1 = tam boyut) veya iptal için None.
+        Boyut okunamazsa (ör. Qt eklentisi olmayan biçim) tam yükleme yapılır.
+        """
+        size = QImageReader(file_path).size()
+        if not _is_oversized(size):
+            return 1
+        w, h = size.width(), size.height()
+        megapixels = w * h / 1_000_000
+
+        factor = next(
+            (f for f in (2, 4) if megapixels / (f * f) <= MAX_IMAGE_MEGAPIXELS), 8
+        )
+        reply = QMessageBox.question(
+            self, "Çok Büyük Görüntü",
+            f"{os.path.basename(file_path)}: {w}×{h} ({megapixels:.0f} MP)\n"
+            f"Görüntü 1/{factor} ölçekte ({w // factor}×{h // factor}) "
+            f"yüklensin mi?\n\nHayır: tam boyutta yükle",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            | QMessageBox.StandardButton.Cancel,
+            QMessageBox.StandardButton.Yes,
+        )
+        if reply == QMessageBox.StandardButton.Cancel:
+            return None
+        return factor if reply == QMessageBox.StandardButton.Yes else 1
+
+    @Slot(str, object)
+    def _on_image_loaded(self, file_path: str, image):
+        """Arka planda çözülen görüntüyü yeni belge olarak yükler."""
+        if file_path != self._loading_path:
+            return  # Bu arada başka bir dosya istendi
+        if self._pending_transforms:
+            # Worker'daki dönüşümler eski belgenin geçmişine yazar; yeni
+            # belge onlar bitince yüklenir (_on_transform_finished)
+            self._deferred_load = (file_path, image)
+            return
+        self._loading_path = None
+        self._processing_label.setText("")
 
-            file_name = os.path.basename(file_path)
-            self.setWindowTitle(f"{APP_NAME} - {file_name}")
-            self._status_bar.showMessage(f"Yüklendi: {file_name}", 3000)
-        else:
+        if image is None:
             QMessageBox.warning(
                 self, "Hata",
                 f"Görüntü yüklenemedi:\n{file_path}"
             )
+            return
+
+        self._processor.set_loaded_image(file_path, image)
+        self._invalidate_preview()
+
+        # Başarılı yükleme
+        self._update_canvas_from_original()
+        self._update_ui_state()
+        self._update_status_bar()
+        self._canvas.fit_to_window()
+
+        # Dönüşüm panelini güncelle
+        w, h = self._processor.image_size
+        self._transform_panel.update_image_size(w, h)
+
+        # Panelleri sıfırla (işlemci parametreleri zaten varsayılanda)
+        self._reset_all_panels_silently()
+
+        file_name = self._processor.file_basename
+        self.setWindowTitle(f"{APP_NAME} - {file_name}")
+        self._status_bar.showMessage(f"Yüklendi: {file_name}", 3000)
 
     @Slot()
     def _on_save(self):
         """Mevcut dosya yoluna kaydeder."""
         if self._processor.file_path:
-            if self._processor.save_image(self._processor.file_path):
-                self._status_bar.showMessage("Kaydedildi.", 3000)
-            else:
-                QMessageBox.warning(self, "Hata", "Dosya kaydedilemedi!")
+            self._save_file(
+                self._processor.file_path,
+                ok_message="Kaydedildi.",
+                fail_message="Dosya kaydedilemedi!",
+            )
         else:
             self._on_save_as()
 
     @Slot()
     def _on_save_as(self):
         """Farklı kaydet diyalogu."""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Farklı Kaydet", "", SAVE_IMAGE_FORMATS
+        def on_selected(file_path: str):
+            if file_path:
+                self._save_file(
+                    file_path,
+                    ok_message=f"Kaydedildi: {file_path}",
+                    fail_message="Dosya kaydedilemedi!",
+                    title=f"{APP_NAME} - {os.path.basename(file_path)}",
+                )
+
+        self._show_file_dialog(
+            "Farklı Kaydet", SAVE_IMAGE_FORMATS, on_selected, save=True
         )
-        if file_path:
-            if self._processor.save_image(file_path):
-                self.setWindowTitle(f"{APP_NAME} - {os.path.basename(file_path)}")
-                self._status_bar.showMessage(f"Kaydedildi: {file_path}", 3000)
-            else:
-                QMessageBox.warning(self, "Hata", "Dosya kaydedilemedi!")
 
     @Slot()
     def _on_export(self):
@@ -387,17 +559,54 @@ class MainWindow(QMainWindow):
             ext = dialog.format_extension
             quality = dialog.quality
 
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, "Dışa Aktar", f"export.{ext}",
-                f"{ext.upper()} (*.{ext})"
-            )
-            if file_path:
-                if self._processor.save_image(file_path, quality):
-                    self._status_bar.showMessage(
-                        f"Dışa aktarıldı: {file_path} (Kalite: {quality}%)", 3000
+            def on_selected(file_path: str):
+                if file_path:
+                    self._save_file(
+                        file_path, quality,
+                        ok_message=f"Dışa aktarıldı: {file_path} (Kalite: {quality}%)",
+                        fail_message="Dışa aktarma başarısız!",
                     )
-                else:
-                    QMessageBox.warning(self, "Hata", "Dışa aktarma başarısız!")
+
+            self._show_file_dialog(
+                "Dışa Aktar", f"{ext.upper()} (*.{ext})", on_selected,
+                save=True, default_name=f"export.{ext}",
+            )
+
+    def _save_file(self, file_path: str, quality: int = 95, *,
+                   ok_message: str, fail_message: str,
+                   title: Optional[str] = None):
+        """
+        Tam çözünürlüklü işleme ve kodlamayı thread havuzunda çalıştırır.
+        Görüntü ve parametreler burada (UI thread'inde) anlık olarak alınır;
+        iş sırası geldiğinde sonraki düzenlemeler kaydı etkilemez.
+        Sonuç mesajları, kaydetme bitince _on_image_saved içinde gösterilir.
+        """
+        if self._pending_transforms:
+            return  # Dönüşüm bitmeden kaydedilen görüntü eski olurdu
+        snapshot = self._processor.snapshot()
+        if snapshot is None:
+            return
+        self._pending_saves[file_path] = (ok_message, fail_message, title)
+        self._processing_label.setText("Kaydediliyor...")
+        self._io.save(
+            file_path,
+            lambda: self._processor.save_image(file_path, quality, snapshot),
+        )
+
+    @Slot(str, bool)
+    def _on_image_saved(self, file_path: str, ok: bool):
+        """Arka plandaki kaydetme bittiğinde kullanıcıyı bilgilendirir."""
+        ok_message, fail_message, title = self._pending_saves.pop(
+            file_path, ("Kaydedildi.", "Dosya kaydedilemedi!", None)
+        )
+        if not self._pending_saves and self._loading_path is None:
+            self._processing_label.setText("")
+        if ok:
+            if title:
+                self.setWindowTitle(title)
+            self._status_bar.showMessage(ok_message, 3000)
+        else:
+            QMessageBox.warning(self, "Hata", fail_message)
 
     # ═══════════════════════════════════════════════════════════════
     # ── DÜZENLEME İŞLEMLERİ ──
@@ -407,24 +616,23 @@ class MainWindow(QMainWindow):
     def _on_adjustment_changed(self, key: str, value: int):
         """Ayarlama slider'ı değiştiğinde çağrılır."""
         self._processor.set_adjustment(key, value)
-        self._schedule_processing()
+        self._schedule_processing(cost="fast")
 
     @Slot(str, int)
     def _on_filter_changed(self, filter_name: str, intensity: int):
         """Filtre slider'ı değiştiğinde çağrılır."""
         self._processor.set_filter(filter_name, intensity)
-        self._schedule_processing()
+        self._schedule_processing(cost="medium")
 
     @Slot(dict)
     def _on_noise_changed(self, params: dict):
         """Gürültü parametreleri değiştiğinde çağrılır."""
         self._processor.set_noise_params(**params)
-        self._schedule_processing()
+        self._schedule_processing(cost="slow")
 
     def _on_reset_adjustments(self):
         """Ayarlamaları sıfırla."""
-        for key in self._processor._adjustments:
-            default = 100 if key == "gamma" else 0
+        for key, default in ADJUSTMENT_DEFAULTS.items():
             self._processor.set_adjustment(key, default)
         self._schedule_processing()
 
@@ -443,16 +651,15 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_apply_changes(self):
         """Mevcut değişiklikleri kalıcı olarak uygular."""
-        if not self._processor.has_image:
+        if self._pending_transforms or not self._processor.has_image:
             return
 
         self._processor.apply_current_changes()
+        self._invalidate_preview()
         self._update_canvas_from_original()
 
-        # Tüm panelleri sıfırla
-        self._adjustment_panel.reset_all()
-        self._filter_panel.reset_all()
-        self._noise_panel.reset_all()
+        # Tüm panelleri sıfırla (işlemci parametreleri zaten varsayılanda)
+        self._reset_all_panels_silently()
 
         self._update_ui_state()
         self._update_status_bar()
@@ -461,24 +668,37 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_reset_all(self):
         """Tüm düzenlemeleri sıfırlar (orijinal görüntüye dön)."""
-        self._adjustment_panel.reset_all()
-        self._filter_panel.reset_all()
-        self._noise_panel.reset_all()
+        self._reset_all_panels_silently()
 
+        # İşlemci parametrelerini sıfırla (talepler debounce ile birleşir)
         self._on_reset_adjustments()
         self._on_reset_filters()
         self._on_reset_noise()
 
+    def _reset_all_panels_silently(self):
+        """
+        Üç düzenleme panelini sinyalleri engellenmiş olarak sıfırlar; her
+        slider sıfırlaması ayrı bir işleme talebi tetiklemez. Çağıran taraf
+        işlemci parametrelerini ve yeniden işlemeyi kendisi yönetir.
+        """
+        with QSignalBlocker(self._adjustment_panel), \
+                QSignalBlocker(self._filter_panel), \
+                QSignalBlocker(self._noise_panel):
+            self._adjustment_panel.reset_all()
+            self._filter_panel.reset_all()
+            self._noise_panel.reset_all()
+
     # ── Geri Al / Yeniden Yap ──
 
     @Slot()
     def _on_undo(self):
         """Geri al."""
+        if self._pending_transforms:
+            return
         if self._processor.undo():
+            self._invalidate_preview()
             self._update_canvas_from_original()
-            self._adjustment_panel.reset_all()
-            self._filter_panel.reset_all()
-            self._noise_panel.reset_all()
+            self._reset_all_panels_silently()
             self._update_ui_state()
             self._update_status_bar()
             self._status_bar.showMessage("Geri alındı.", 1500)
@@ -486,11 +706,12 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_redo(self):
         """Yeniden yap."""
+        if self._pending_transforms:
+            return
         if self._processor.redo():
+            self._invalidate_preview()
             self._update_canvas_from_original()
-            self._adjustment_panel.reset_all()
-            self._filter_panel.reset_all()
-            self._noise_panel.reset_all()
+            self._reset_all_panels_silently()
             self._update_ui_state()
             self._update_status_bar()
             self._status_bar.showMessage("Yeniden yapıldı.", 1500)
@@ -502,84 +723,221 @@ class MainWindow(QMainWindow):
     @Slot(int, int, str)
     def _on_resize(self, width: int, height: int, method: str):
         """Görüntüyü yeniden boyutlandırır."""
-        if not self._processor.has_image:
-            return
-
-        self._processor.apply_resize(width, height, method)
-        self._update_canvas_from_original()
-        self._canvas.fit_to_window()
-
-        w, h = self._processor.image_size
-        self._transform_panel.update_image_size(w, h)
-        self._update_ui_state()
-        self._update_status_bar()
-        self._status_bar.showMessage(f"Boyutlandırıldı: {w}×{h}", 2000)
+        self._run_transform(
+            lambda: self._processor.apply_resize(width, height, method),
+            "Boyutlandırıldı", fit=True, show_size=True,
+        )
 
     @Slot(float)
     def _on_rotate(self, angle: float):
         """Görüntüyü döndürür."""
-        if not self._processor.has_image:
-            return
-
-        self._processor.apply_rotation(angle)
-        self._update_canvas_from_original()
-        self._canvas.fit_to_window()
-
-        w, h = self._processor.image_size
-        self._transform_panel.update_image_size(w, h)
-        self._update_ui_state()
-        self._update_status_bar()
-        self._status_bar.showMessage(f"Döndürüldü: {angle}°", 2000)
+        self._run_transform(
+            lambda: self._processor.apply_rotation(angle),
+            f"Döndürüldü: {angle}°", fit=True,
+        )
 
     @Slot(bool)
     def _on_flip(self, horizontal: bool):
         """Görüntüyü çevirir."""
+        direction = "Yatay" if horizontal else "Dikey"
+        self._run_transform(
+            lambda: self._processor.apply_flip(horizontal),
+            f"{direction} çevrildi.", fit=False,
+        )
+
+    def _run_transform(self, job, message: str, fit: bool,
+                       show_size: bool = False):
+        """
+        Tam çözünürlüklü dönüşümü worker thread'inde çalıştırır; büyük
+        görüntülerde UI donmaz. İşler sırayla uygulanır. Bitene kadar geri
+        alma/yineleme/uygula kapatılır (geçmiş aynı anda iki thread'den
+        değiştirilmesin diye).
+        """
         if not self._processor.has_image:
             return
+        # İş başladığı belgeye bağlıdır; sırası gelene kadar başka belge
+        # yüklendiyse çalıştırılmaz
+        document = self._processor.document_id
+
+        def run():
+            if self._processor.document_id == document:
+                job()
+
+        self._pending_transforms += 1
+        self._invalidate_preview()
+        self._processing_label.setText("İşleniyor...")
+        self._update_ui_state()
+        self._processing_thread.request_transform(run, (message, fit, show_size))
+
+    @Slot(object)
+    def _on_transform_finished(self, tag):
+        """Worker'daki dönüşüm tamamlandığında UI'yı günceller."""
+        message, fit, show_size = tag
+        self._pending_transforms -= 1
+        if self._pending_transforms == 0 and self._deferred_load is not None:
+            # Dönüşümler sürerken biten yükleme artık güvenle uygulanabilir
+            deferred, self._deferred_load = self._deferred_load, None
+            self._on_image_loaded(*deferred)
+            return
+        if self._pending_transforms == 0 and not self._is_processing:
+            self._processing_label.setText("")
 
-        self._processor.apply_flip(horizontal)
         self._update_canvas_from_original()
-        direction = "Yatay" if horizontal else "Dikey"
-        self._status_bar.showMessage(f"{direction} çevrildi.", 2000)
+        if fit:
+            self._canvas.fit_to_window()
+
+        w, h = self._processor.image_size
+        self._transform_panel.update_image_size(w, h)
         self._update_ui_state()
+        self._update_status_bar()
+        if show_size:
+            message = f"{message}: {w}×{h}"
+        self._status_bar.showMessage(message, 2000)
 
     # ═══════════════════════════════════════════════════════════════
     # ── GÖRÜNÜM İŞLEMLERİ ──
     # ═══════════════════════════════════════════════════════════════
 
-    @Slot()
-    def _on_fit_to_window(self):
-        self._canvas.fit_to_window()
-
-    @Slot()
-    def _on_zoom_fit(self):
-        self._canvas.zoom_to_fit()
-
-    @Slot()
-    def _on_actual_size(self):
-        self._canvas.zoom_actual()
-
     @Slot(float)
     def _on_zoom_changed(self, zoom: float):
-        self._zoom_label.setText(f"{zoom * 100:.0f}%")
+        # Etiket tam yüzde gösterir; görünen değer değişmediyse dokunma
+        pct = round(zoom * 100)
+        if pct == self._last_zoom_pct:
+            return
+        self._last_zoom_pct = pct
+        self._zoom_label.setText(f"{pct}%")
 
     # ═══════════════════════════════════════════════════════════════
     # ── İŞLEME YÖNETİMİ ──
     # ═══════════════════════════════════════════════════════════════
 
-    def _schedule_processing(self):
+    def _schedule_processing(self, cost: Optional[str] = None):
         """
         Debounce mekanizması ile işleme talebini zamanlar.
-        Her slider değişikliğinde zamanlayıcı sıfırlanır,
-        böylece yalnızca son değişiklik işlenir.
+        Sessiz bir dönemden sonraki ilk değişiklik hemen işlenir (ön kenar);
+        pencere içinde gelen sonrakiler zamanlayıcıyı sıfırlar ve yalnızca
+        son değer pencere kapanınca işlenir (son kenar).
+
+        Args:
+            cost: İşlem maliyet sınıfı ("fast", "medium", "slow").
+                  Süre PROCESSING_DEBOUNCE_MS tablosundan seçilir; 0 ise
+                  talep beklemeden gönderilir. None → SLIDER_DEBOUNCE_MS.
         """
         if not self._processor.has_image:
             return
+        if self._interactive:
+            self._drag_changed = True
+        # Worker meşgulken zamanlayıcı kurulmaz; yalnızca kirli işaretlenir,
+        # kare bitince _rearm_if_dirty zamanlamayı yeniden başlatır
+        if self._is_processing:
+            self._dirty = True
+            self._dirty_cost = cost
+            return
+        # Sürüklerken vekil önizleme ucuz; worker zaten "en son kazanır"
+        if self._interactive:
+            self._debounce_timer.stop()
+            self._request_processing()
+            return
+        interval = self._debounce_interval(cost)
+        if interval == 0:
+            self._debounce_timer.stop()
+            self._trailing_pending = False
+            self._request_processing()
+            return
+        if self._debounce_timer.isActive():
+            self._trailing_pending = True
+        else:
+            self._trailing_pending = False
+            self._request_processing()
+        self._debounce_timer.setInterval(interval)
+        self._debounce_timer.start()
+
+    def _debounce_interval(self, cost: Optional[str]) -> int:
+        """Maliyet sınıfına karşılık gelen debounce süresi (ms)."""
+        if cost is None:
+            return SLIDER_DEBOUNCE_MS
+        return self._debounce_ms.get(cost, SLIDER_DEBOUNCE_MS)
+
+    def _rearm_if_dirty(self):
+        """
+        Worker meşgulken parametre değiştiyse, boşa çıktığında zamanlamayı
+        yeniden kurar. Ertelenen talep zaten gönderildiyse (en güncel
+        parametrelerle) ayrıca bir şey yapılmaz.
+        """
+        if not self._dirty:
+            return
+        self._dirty = False
+        interval = self._debounce_interval(self._dirty_cost)
+        if self._interactive or interval == 0:
+            self._request_processing()
+            return
+        self._trailing_pending = True
+        self._debounce_timer.setInterval(interval)
         self._debounce_timer.start()
 
+    def _on_debounce_timeout(self):
+        """Debounce penceresi kapandı: ön kenardan sonra değişiklik varsa işle."""
+        if self._trailing_pending:
+            self._trailing_pending = False
+            self._request_processing()
+
+    @Slot()
+    def _on_interaction_started(self):
+        """Slider sürüklenmeye başladı: önizlemeyi yarı çözünürlükte üret."""
+        self._interactive = True
+        self._drag_changed = False
+        self._processor.preview_scale = INTERACTIVE_PREVIEW_SCALE
+
+    @Slot()
+    def _on_interaction_finished(self):
+        """
+        Slider bırakıldı: tam önizleme çözünürlüğüne dön. Sürükleme sırasında
+        değer değiştiyse (vekil kare üretildiyse) son kare tam kalitede
+        yeniden işlenir; değişmeden bırakılan tıklamalar iş üretmez.
+        """
+        self._interactive = False
+        self._processor.preview_scale = 1.0
+        if self._drag_changed and self._processor.has_image:
+            self._drag_changed = False
+            self._debounce_timer.stop()
+            self._trailing_pending = False
+            self._request_processing()
+
     def _request_processing(self):
-        """Debounce süresi dolduktan sonra işleme talebini worker'a gönderir."""
-        self._processing_thread.request_processing()
+        """
+        Debounce süresi dolduktan sonra işleme talebini worker'a gönderir.
+        Worker meşgulse talep yalnızca işaretlenir; önceki kare bitince en
+        güncel parametrelerle tek bir talep gönderilir, talepler birikmez.
+        """
+        if self._is_processing:
+            self._pending_request = True
+            return
+        self._send_request()
+
+    def _send_request(self):
+        """Yeni nesil numarasıyla worker'a önizleme talebi gönderir."""
+        self._req_gen += 1
+        self._processing_thread.request_processing(self._req_gen)
+
+    def _invalidate_preview(self):
+        """
+        Süren/bekleyen önizleme karelerini geçersiz kılar. Görüntü değişince
+        (uygula, geri al, dönüşüm, yükleme) eski parametrelerle üretilmiş bir
+        karenin tuvali ezmesi böylece engellenir.
+        """
+        self._req_gen += 1
+
+    def _flush_pending_request(self):
+        """
+        İşleme sürerken ertelenen talep varsa şimdi gönderir; yoksa meşgulken
+        biriken değişiklik için debounce'u yeniden kurar.
+        """
+        if self._pending_request:
+            self._pending_request = False
+            self._dirty = False
+            self._send_request()
+            return
+        self._rearm_if_dirty()
 
     @Slot()
     def _on_processing_started(self):
@@ -587,13 +945,20 @@ class MainWindow(QMainWindow):
         self._is_processing = True
         self._processing_label.setText("İşleniyor...")
 
-    @Slot(np.ndarray)
-    def _on_processing_finished(self, result: np.ndarray):
-        """İşleme tamamlandığında sonucu tuvale yansıtır."""
+    @Slot(object, int)
+    def _on_processing_finished(self, result: np.ndarray, generation: int):
+        """
+        İşleme tamamlandığında sonucu tuvale yansıtır. Talepten sonra görüntü
+        değiştiyse ya da daha yeni bir talep gönderildiyse kare atılır.
+        """
         self._is_processing = False
         self._processing_label.setText("")
+        if generation != self._req_gen:
+            self._flush_pending_request()
+            return
         self._canvas.set_image(result)
         self._update_ui_state()
+        self._flush_pending_request()
 
     @Slot(str)
     def _on_processing_error(self, error: str):
@@ -601,6 +966,7 @@ class MainWindow(QMainWindow):
         self._is_processing = False
         self._processing_label.setText("")
         self._status_bar.showMessage(f"Hata: {error}", 5000)
+        self._flush_pending_request()
 
     # ═══════════════════════════════════════════════════════════════
     # ── YARDIMCI METOTLAR ──
@@ -613,37 +979,60 @@ class MainWindow(QMainWindow):
             self._canvas.set_image(preview)
 
     def _update_ui_state(self):
-        """Buton ve menü durumlarını günceller."""
+        """
+        Buton ve menü durumlarını günceller. Durum son çağrıdakiyle aynıysa
+        (ör. sürükleme sırasındaki her önizleme karesi) eylemlere dokunulmaz.
+        """
         has_image = self._processor.has_image
+        # Worker'da dönüşüm sürerken geçmişi değiştiren ve (eski görüntüyü
+        # yazacak) kaydetme eylemleri kapalıdır
+        idle = self._pending_transforms == 0
+        state = (
+            has_image,
+            has_image and idle,
+            idle and self._processor.can_undo(),
+            idle and self._processor.can_redo(),
+        )
+        if state == self._last_ui_state:
+            return
+        self._last_ui_state = state
+        _, can_apply, can_undo, can_redo = state
 
-        self._save_action.setEnabled(has_image)
-        self._save_as_action.setEnabled(has_image)
-        self._export_action.setEnabled(has_image)
-        self._apply_action.setEnabled(has_image)
+        self._save_action.setEnabled(can_apply)
+        self._save_as_action.setEnabled(can_apply)
+        self._export_action.setEnabled(can_apply)
+        self._apply_action.setEnabled(can_apply)
         self._reset_action.setEnabled(has_image)
-        self._undo_action.setEnabled(self._processor.can_undo())
-        self._redo_action.setEnabled(self._processor.can_redo())
+        self._undo_action.setEnabled(can_undo)
+        self._redo_action.setEnabled(can_redo)
 
     def _update_status_bar(self):
         """Durum çubuğu bilgilerini günceller."""
         if not self._processor.has_image:
             self._file_label.setText("Dosya yüklenmedi")
             self._size_label.setText("")
+            self._info_cache = None
             return
 
         # Dosya adı
         if self._processor.file_path:
-            name = os.path.basename(self._processor.file_path)
-            self._file_label.setText(name)
+            self._file_label.setText(self._processor.file_basename)
         else:
             self._file_label.setText("Kaydedilmemiş")
 
-        # Boyut bilgisi
-        info = get_image_info(self._processor.original)
-        self._size_label.setText(
+        # Boyut bilgisi yalnızca şekil ve dtype'a bağlıdır; değişmediyse
+        # metin yeniden üretilmez ve etiket yeniden çizdirilmez
+        original = self._processor.original
+        key = (original.shape, original.dtype)
+        if self._info_cache is not None and self._info_cache[0] == key:
+            return
+        info = get_image_info(original)
+        text = (
             f"{info.get('width', 0)}×{info.get('height', 0)} | "
             f"{info.get('megapixels', '')} | {info.get('size', '')}"
         )
+        self._info_cache = (key, text)
+        self._size_label.setText(text)
 
     # ═══════════════════════════════════════════════════════════════
     # ── PENCERE OLAYLARI ──
@@ -663,40 +1052,32 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
 
-        # Worker thread'i temizle
+        # Süren kaydetmelerin bitmesini bekle, worker thread'i temizle
+        self._io.wait_for_done()
         self._processing_thread.stop()
         event.accept()
 
     def dragEnterEvent(self, event):
         """Sürükle-bırak: dosya türü kontrolü."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith(
-                    ('.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif', '.webp')
-                ):
-                    event.acceptProposedAction()
-                    return
+        if event.mimeData().hasUrls() and _first_accepted_path(event):
+            event.acceptProposedAction()
 
     def dropEvent(self, event):
-        """Sürükle-bırak: dosyayı yükle."""
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if file_path.lower().endswith(
-                ('.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.tif', '.webp')
-            ):
-                if self._processor.load_image(file_path):
-                    self._update_canvas_from_original()
-                    self._update_ui_state()
-                    self._update_status_bar()
-                    self._canvas.fit_to_window()
-
-                    w, h = self._processor.image_size
-                    self._transform_panel.update_image_size(w, h)
-                    self._adjustment_panel.reset_all()
-                    self._filter_panel.reset_all()
-                    self._noise_panel.reset_all()
-
-                    self.setWindowTitle(
-                        f"{APP_NAME} - {os.path.basename(file_path)}"
-                    )
-                break
+        """
+        Sürükle-bırak: ilk dosyayı yükle. Birden fazla dosya bırakıldıysa
+        sıradaki birkaçı arka planda önceden çözülür; sonradan açılmaları
+        anında olur. Küçültülmüş yükleme önerilecek kadar büyük dosyalar
+        önceden çözülmez (tam boyutta çözmek tam da önlenmek istenen
+        maliyettir); toplam boyut FileIoWorker sınırlarıyla kısıtlanır.
+        """
+        paths = list(_iter_accepted_paths(event))
+        if not paths:
+            return
+        # Önce ilk dosya (gerekirse küçültme sorusuyla) yüklenir
+        self._load_file(paths[0])
+        if len(paths) > 1:
+            self._io.prefetch(
+                [p for p in paths[1:] if not _is_oversized(QImageReader(p).size())],
+                ImageProcessor.decode_image,
+                _decoded_size,
+            )
@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QPushButton, QLabel,
     QFrame, QHBoxLayout
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot, QSignalBlocker
 
 from app.ui.components.labeled_slider import LabeledSlider
 from app.utils.constants import ADJUSTMENT_RANGES, ADJUSTMENT_LABELS
@@ -26,16 +26,37 @@ class AdjustmentPanel(QWidget):
     Sinyaller:
         adjustment_changed(str, int): (parametre_adı, değer) değiştiğinde
         reset_all_requested: Tümünü sıfırla istendiğinde
+        interaction_started / interaction_finished: Bir slider sürüklenmeye
+            başladığında / bırakıldığında
     """
 
     adjustment_changed = Signal(str, int)
     reset_all_requested = Signal()
+    interaction_started = Signal()
+    interaction_finished = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         # Slider referanslarını tutan sözlük
         self._sliders: dict[str, LabeledSlider] = {}
-        self._setup_ui()
+        # Son bilinen slider değerleri (değişiklik tespiti ve O(1) okuma)
+        self._values: dict[str, int] = {}
+        # Arayüz ilk gösterimde kurulur (bkz. _ensure_ui)
+        self._built = False
+
+    def showEvent(self, event):
+        """İlk gösterimde arayüzü kurar."""
+        self._ensure_ui()
+        super().showEvent(event)
+
+    def _ensure_ui(self):
+        """
+        Arayüz henüz kurulmadıysa kurar. Widget'lar panel ilk açılana kadar
+        oluşturulmaz; hiç açılmayan sekmeler başlangıç maliyeti getirmez.
+        """
+        if not self._built:
+            self._built = True
+            self._setup_ui()
 
     def _setup_ui(self):
         """Panel arayüzünü oluşturur."""
@@ -101,7 +122,7 @@ class AdjustmentPanel(QWidget):
         # İnce ayırıcı çizgi
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
-        line.setStyleSheet("background-color: #21262d; max-height: 1px;")
+        line.setObjectName("sectionDivider")
         self._content_layout.addWidget(line)
 
     def _add_slider(self, key: str, suffix: str = "", display_scale: float = 1.0):
@@ -112,46 +133,72 @@ class AdjustmentPanel(QWidget):
         if key not in ADJUSTMENT_RANGES:
             return
 
-        min_val, max_val, default_val, _ = ADJUSTMENT_RANGES[key]
+        spec = ADJUSTMENT_RANGES[key]
         label = ADJUSTMENT_LABELS.get(key, key)
 
         slider = LabeledSlider(
             label=label,
-            min_val=min_val,
-            max_val=max_val,
-            default_val=default_val,
+            min_val=spec.min,
+            max_val=spec.max,
+            default_val=spec.default,
             suffix=suffix,
             display_scale=display_scale,
+            debounce=True,
         )
         slider.set_key(key)
 
-        # Slider değiştiğinde ana pencereye bildir
-        slider.value_changed.connect(
-            lambda val, k=key: self.adjustment_changed.emit(k, val)
-        )
+        # Slider değiştiğinde ana pencereye bildir (tek ortak slot)
+        slider.value_changed.connect(self._on_slider_value)
+        slider.interaction_started.connect(self.interaction_started)
+        slider.interaction_finished.connect(self.interaction_finished)
 
         self._sliders[key] = slider
+        self._values[key] = slider.value()
         self._content_layout.addWidget(slider)
 
+    @Slot(int)
+    def _on_slider_value(self, value: int):
+        """
+        Değişen slider'ın anahtarıyla adjustment_changed yayınlar. Değer
+        son bilinenle aynıysa (birleştirilmiş sürükleme başladığı yerde
+        bittiyse) yayın atlanır.
+        """
+        key = self.sender().key()
+        if self._values.get(key) == value:
+            return
+        self._values[key] = value
+        self.adjustment_changed.emit(key, value)
+
     def _on_reset_all(self):
-        """Tüm slider'ları varsayılan değerlere sıfırlar."""
-        for key, slider in self._sliders.items():
-            slider.reset_value()
+        """
+        Tüm slider'ları varsayılan değerlere sıfırlar. Slider başına
+        adjustment_changed yayınlanmaz; alıcı tek reset_all_requested ile
+        tüm parametreleri bir kerede varsayılana döndürür.
+        """
+        self._reset_sliders_silently()
         self.reset_all_requested.emit()
 
+    def _reset_sliders_silently(self):
+        """Slider'ları sinyal yayınlamadan sıfırlar ve değer aynasını eşitler."""
+        for slider in self._sliders.values():
+            with QSignalBlocker(slider):
+                slider.reset_value()
+        self._values = {key: s.value() for key, s in self._sliders.items()}
+
     # ─── Public API ───────────────────────────────────────────────
 
     def get_all_values(self) -> dict[str, int]:
         """Tüm slider değerlerini sözlük olarak döndürür."""
-        return {key: slider.value() for key, slider in self._sliders.items()}
+        self._ensure_ui()
+        return dict(self._values)
 
     def set_all_values(self, values: dict[str, int]):
         """Tüm slider'ları verilen değerlere ayarlar."""
+        self._ensure_ui()
         for key, value in values.items():
             if key in self._sliders:
                 self._sliders[key].set_value(value)
 
     def reset_all(self):
-        """Tüm slider'ları programatik olarak sıfırlar."""
-        for slider in self._sliders.values():
-            slider.reset_value()
+        """Tüm slider'ları programatik olarak (sinyalsiz) sıfırlar."""
+        self._reset_sliders_silently()
@@ -8,10 +8,12 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QPushButton,
     QLabel, QFrame, QHBoxLayout
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot, QSignalBlocker
 
 from app.ui.components.labeled_slider import LabeledSlider
-from app.utils.constants import FILTER_DEFINITIONS
+from app.utils.constants import (
+    FILTER_DEFS_BLUR, FILTER_DEFS_ARTISTIC, FILTER_DEFS_COLOR
+)
 
 
 class FilterPanel(QWidget):
@@ -23,15 +25,38 @@ class FilterPanel(QWidget):
     Sinyaller:
         filter_changed(str, int): (filtre_adı, yoğunluk) değiştiğinde
         reset_all_requested: Tümünü sıfırla istendiğinde
+        interaction_started / interaction_finished: Bir slider sürüklenmeye
+            başladığında / bırakıldığında
     """
 
     filter_changed = Signal(str, int)
     reset_all_requested = Signal()
+    interaction_started = Signal()
+    interaction_finished = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._sliders: dict[str, LabeledSlider] = {}
-        self._setup_ui()
+        # Slider değerlerinin aynası: okumalar Qt'ye gitmeden O(1) yapılır
+        self._values: dict[str, int] = {}
+        # Yalnızca aktif (>0) filtreler
+        self._active: dict[str, int] = {}
+        # Arayüz ilk gösterimde kurulur (bkz. _ensure_ui)
+        self._built = False
+
+    def showEvent(self, event):
+        """İlk gösterimde arayüzü kurar."""
+        self._ensure_ui()
+        super().showEvent(event)
+
+    def _ensure_ui(self):
+        """
+        Arayüz henüz kurulmadıysa kurar. Widget'lar panel ilk açılana kadar
+        oluşturulmaz; hiç açılmayan sekmeler başlangıç maliyeti getirmez.
+        """
+        if not self._built:
+            self._built = True
+            self._setup_ui()
 
     def _setup_ui(self):
         """Panel arayüzünü oluşturur."""
@@ -51,17 +76,17 @@ class FilterPanel(QWidget):
 
         # ── Bulanıklık ve Keskinleştirme ──
         self._add_section_header(content_layout, "BULANIKLIK & KESKİNLEŞTİRME")
-        for key, label in FILTER_DEFINITIONS[:5]:
+        for key, label in FILTER_DEFS_BLUR:
             self._add_filter_slider(content_layout, key, label)
 
         # ── Sanatsal Filtreler ──
         self._add_section_header(content_layout, "SANATSAL")
-        for key, label in FILTER_DEFINITIONS[5:13]:
+        for key, label in FILTER_DEFS_ARTISTIC:
             self._add_filter_slider(content_layout, key, label)
 
         # ── Renk ve Stil Filtreleri ──
         self._add_section_header(content_layout, "RENK & STİL")
-        for key, label in FILTER_DEFINITIONS[13:]:
+        for key, label in FILTER_DEFS_COLOR:
             self._add_filter_slider(content_layout, key, label)
 
         content_layout.addStretch()
@@ -88,7 +113,7 @@ class FilterPanel(QWidget):
 
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
-        line.setStyleSheet("background-color: #21262d; max-height: 1px;")
+        line.setObjectName("sectionDivider")
         layout.addWidget(line)
 
     def _add_filter_slider(self, layout: QVBoxLayout, key: str, label: str):
@@ -99,38 +124,65 @@ class FilterPanel(QWidget):
             max_val=100,
             default_val=0,
             suffix="%",
+            debounce=True,
         )
         slider.set_key(key)
 
-        # Slider değiştiğinde sinyal gönder
-        slider.value_changed.connect(
-            lambda val, k=key: self.filter_changed.emit(k, val)
-        )
+        # Slider değiştiğinde aynayı güncelle ve sinyal gönder; anahtar
+        # closure yerine slider'ın kendisinden okunur (tek ortak slot)
+        slider.value_changed.connect(self._on_slider_value)
+        slider.interaction_started.connect(self.interaction_started)
+        slider.interaction_finished.connect(self.interaction_finished)
 
         self._sliders[key] = slider
+        self._values[key] = slider.value()
         layout.addWidget(slider)
 
+    @Slot(int)
+    def _on_slider_value(self, value: int):
+        """
+        Değer aynasını günceller ve filter_changed yayınlar. Birleştirilmiş
+        sürükleme sonunda önceki değere dönülmüşse (ör. 0→3→0) değişiklik
+        yoktur; boşa filtre zinciri çalıştırılmaz.
+        """
+        key = self.sender().key()
+        if self._values.get(key) == value:
+            return
+        self._values[key] = value
+        if value > 0:
+            self._active[key] = value
+        else:
+            self._active.pop(key, None)
+        self.filter_changed.emit(key, value)
+
     def _on_reset_all(self):
-        """Tüm filtre slider'larını sıfırlar."""
-        for slider in self._sliders.values():
-            slider.reset_value()
+        """
+        Tüm filtre slider'larını sıfırlar. Filtre başına filter_changed
+        yayınlanmaz; alıcı tek reset_all_requested ile tüm filtreleri kapatır.
+        """
+        self._reset_sliders_silently()
         self.reset_all_requested.emit()
 
+    def _reset_sliders_silently(self):
+        """Slider'ları sinyal yayınlamadan sıfırlar ve değer aynasını eşitler."""
+        for slider in self._sliders.values():
+            with QSignalBlocker(slider):
+                slider.reset_value()
+        self._values = {key: s.value() for key, s in self._sliders.items()}
+        self._active.clear()
+
     # ─── Public API ───────────────────────────────────────────────
 
     def get_all_values(self) -> dict[str, int]:
-        """Tüm filtre yoğunluk değerlerini döndürür."""
-        return {key: slider.value() for key, slider in self._sliders.items()}
+        """Tüm filtre yoğunluk değerlerini döndürür (son yayınlanan değerler)."""
+        self._ensure_ui()
+        return dict(self._values)
 
     def get_active_filters(self) -> dict[str, int]:
         """Yalnızca aktif (>0) filtreleri döndürür."""
-        return {
-            key: slider.value()
-            for key, slider in self._sliders.items()
-            if slider.value() > 0
-        }
+        self._ensure_ui()
+        return dict(self._active)
 
     def reset_all(self):
-        """Tüm slider'ları programatik olarak sıfırlar."""
-        for slider in self._sliders.values():
-            slider.reset_value()
+        """Tüm slider'ları programatik olarak (sinyalsiz) sıfırlar."""
+        self._reset_sliders_silently()
@@ -4,11 +4,13 @@ Farklı gürültü türleri, yoğunluk, monokrom/renkli seçimi ve
 ölçek parametresi ile profesyonel gürültü ekleme imkanı sağlar.
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QPushButton, QLabel,
     QComboBox, QCheckBox, QFrame, QHBoxLayout
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QSignalBlocker
 
 from app.ui.components.labeled_slider import LabeledSlider
 from app.utils.constants import NOISE_TYPES
@@ -27,14 +29,35 @@ class NoisePanel(QWidget):
     Sinyaller:
         noise_changed(dict): Tüm gürültü parametreleri değiştiğinde
         reset_requested: Sıfırlama istendiğinde
+        interaction_started / interaction_finished: Bir slider sürüklenmeye
+            başladığında / bırakıldığında
     """
 
     noise_changed = Signal(dict)
     reset_requested = Signal()
+    interaction_started = Signal()
+    interaction_finished = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._setup_ui()
+        # Son yayınlanan parametreler; aynı sözlük tekrar yayınlanmaz
+        self._last_params: Optional[dict] = None
+        # Arayüz ilk gösterimde kurulur (bkz. _ensure_ui)
+        self._built = False
+
+    def showEvent(self, event):
+        """İlk gösterimde arayüzü kurar."""
+        self._ensure_ui()
+        super().showEvent(event)
+
+    def _ensure_ui(self):
+        """
+        Arayüz henüz kurulmadıysa kurar. Widget'lar panel ilk açılana kadar
+        oluşturulmaz; hiç açılmayan sekmeler başlangıç maliyeti getirmez.
+        """
+        if not self._built:
+            self._built = True
+            self._setup_ui()
 
     def _setup_ui(self):
         """Panel arayüzünü oluşturur."""
@@ -59,12 +82,12 @@ class NoisePanel(QWidget):
 
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
-        line.setStyleSheet("background-color: #21262d; max-height: 1px;")
+        line.setObjectName("sectionDivider")
         content_layout.addWidget(line)
 
         # ── Gürültü Türü Seçimi ──
         type_label = QLabel("Gürültü Türü")
-        type_label.setStyleSheet("font-size: 12px; color: #c9d1d9; padding-top: 4px;")
+        type_label.setObjectName("fieldLabel")
         content_layout.addWidget(type_label)
 
         self._type_combo = QComboBox()
@@ -80,8 +103,11 @@ class NoisePanel(QWidget):
             max_val=100,
             default_val=0,
             suffix="%",
+            debounce=True,
         )
         self._intensity_slider.value_changed.connect(self._on_param_changed)
+        self._intensity_slider.interaction_started.connect(self.interaction_started)
+        self._intensity_slider.interaction_finished.connect(self.interaction_finished)
         content_layout.addWidget(self._intensity_slider)
 
         # ── Ölçek Slider'ı ──
@@ -92,8 +118,11 @@ class NoisePanel(QWidget):
             default_val=10,
             suffix="",
             display_scale=0.1,
+            debounce=True,
         )
         self._scale_slider.value_changed.connect(self._on_param_changed)
+        self._scale_slider.interaction_started.connect(self.interaction_started)
+        self._scale_slider.interaction_finished.connect(self.interaction_finished)
         content_layout.addWidget(self._scale_slider)
 
         # ── Monokrom Seçeneği ──
@@ -104,14 +133,11 @@ class NoisePanel(QWidget):
 
         # ── Bilgi Metni ──
         info_frame = QFrame()
-        info_frame.setStyleSheet(
-            "background-color: #161b22; border: 1px solid #21262d; "
-            "border-radius: 6px; padding: 8px;"
-        )
+        info_frame.setObjectName("infoBox")
         info_layout = QVBoxLayout(info_frame)
 
         info_title = QLabel("Gürültü Türleri Hakkında")
-        info_title.setStyleSheet("font-weight: 600; font-size: 11px; color: #58a6ff;")
+        info_title.setObjectName("infoTitle")
         info_layout.addWidget(info_title)
 
         info_texts = [
@@ -125,7 +151,7 @@ class NoisePanel(QWidget):
         ]
         for text in info_texts:
             lbl = QLabel(text)
-            lbl.setStyleSheet("font-size: 11px; color: #8b949e; padding: 1px 0;")
+            lbl.setObjectName("infoText")
             lbl.setWordWrap(True)
             info_layout.addWidget(lbl)
 
@@ -148,22 +174,49 @@ class NoisePanel(QWidget):
         main_layout.addLayout(btn_layout)
 
     def _on_param_changed(self, *args):
-        """Herhangi bir parametre değiştiğinde sinyal gönderir."""
+        """
+        Herhangi bir parametre değiştiğinde sinyal gönderir. Slider'lar
+        sürükleme sırasında zaten birleştirilir; burada ayrıca önceki
+        yayınla aynı olan parametre kümesi (ör. başladığı değere dönen bir
+        sürükleme) atlanır ve gereksiz gürültü üretimi tetiklenmez.
+        """
+        # Sinyaller engelliyse (sessiz sıfırlama) yayın gerçekleşmez; alıcının
+        # durumu artık bilinmediğinden sonraki değişiklik mutlaka yayınlanır
+        if self.signalsBlocked():
+            self._last_params = None
+            return
         params = self.get_params()
+        if params == self._last_params:
+            return
+        self._last_params = params
         self.noise_changed.emit(params)
 
     def _on_reset(self):
-        """Tüm gürültü parametrelerini sıfırlar."""
-        self._type_combo.setCurrentIndex(0)
-        self._intensity_slider.reset_value()
-        self._scale_slider.reset_value()
-        self._mono_checkbox.setChecked(True)
+        """
+        Tüm gürültü parametrelerini sıfırlar. Widget başına noise_changed
+        yayınlanmaz; alıcı tek reset_requested ile varsayılanlara döner.
+        """
+        self._reset_widgets_silently()
+        # Alıcı artık varsayılan parametrelerle eşit
+        self._last_params = self.get_params()
         self.reset_requested.emit()
 
+    def _reset_widgets_silently(self):
+        """Kontrolleri sinyal yayınlamadan varsayılan değerlere döndürür."""
+        with QSignalBlocker(self._type_combo), \
+                QSignalBlocker(self._intensity_slider), \
+                QSignalBlocker(self._scale_slider), \
+                QSignalBlocker(self._mono_checkbox):
+            self._type_combo.setCurrentIndex(0)
+            self._intensity_slider.reset_value()
+            self._scale_slider.reset_value()
+            self._mono_checkbox.setChecked(True)
+
     # ─── Public API ───────────────────────────────────────────────
 
     def get_params(self) -> dict:
         """Mevcut tüm gürültü parametrelerini sözlük olarak döndürür."""
+        self._ensure_ui()
         return {
             "type": self._type_combo.currentData(),
             "intensity": self._intensity_slider.value(),
@@ -172,5 +225,8 @@ class NoisePanel(QWidget):
         }
 
     def reset_all(self):
-        """Programatik sıfırlama."""
-        self._on_reset()
+        """Programatik (sinyalsiz) sıfırlama."""
+        # Henüz kurulmamış panel zaten varsayılan değerlerle açılacak
+        self._last_params = None
+        if self._built:
+            self._reset_widgets_silently()
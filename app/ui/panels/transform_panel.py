@@ -8,9 +8,9 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QPushButton,
     QLabel, QSpinBox, QComboBox, QCheckBox, QFrame, QDoubleSpinBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QSignalBlocker
 
-from app.utils.constants import INTERPOLATION_METHODS
+from app.utils.constants import INTERPOLATION_METHODS, INTERPOLATION_INDEX
 
 
 class TransformPanel(QWidget):
@@ -64,13 +64,14 @@ class TransformPanel(QWidget):
 
         # Mevcut boyut göstergesi
         self._current_size_label = QLabel("Mevcut: - × -")
-        self._current_size_label.setStyleSheet("font-size: 11px; color: #8b949e;")
+        self._current_size_label.setObjectName("hintLabel")
         content_layout.addWidget(self._current_size_label)
 
         # Genişlik
         w_layout = QHBoxLayout()
         w_label = QLabel("Genişlik:")
-        w_label.setStyleSheet("font-size: 12px; min-width: 70px;")
+        w_label.setObjectName("formLabel")
+        w_label.setMinimumWidth(70)
         w_layout.addWidget(w_label)
 
         self._width_spin = QSpinBox()
@@ -94,7 +95,8 @@ class TransformPanel(QWidget):
         # Yükseklik
         h_layout = QHBoxLayout()
         h_label = QLabel("Yükseklik:")
-        h_label.setStyleSheet("font-size: 12px; min-width: 70px;")
+        h_label.setObjectName("formLabel")
+        h_label.setMinimumWidth(70)
         h_layout.addWidget(h_label)
 
         self._height_spin = QSpinBox()
@@ -107,13 +109,13 @@ class TransformPanel(QWidget):
 
         # İnterpolasyon yöntemi
         interp_label = QLabel("İnterpolasyon Yöntemi:")
-        interp_label.setStyleSheet("font-size: 12px; color: #c9d1d9; padding-top: 4px;")
+        interp_label.setObjectName("fieldLabel")
         content_layout.addWidget(interp_label)
 
         self._interp_combo = QComboBox()
         for key, label in INTERPOLATION_METHODS:
             self._interp_combo.addItem(label, key)
-        self._interp_combo.setCurrentIndex(3)  # Varsayılan: Lanczos
+        self._interp_combo.setCurrentIndex(INTERPOLATION_INDEX["lanczos"])
         content_layout.addWidget(self._interp_combo)
 
         # Boyutlandırma uygula butonu
@@ -156,7 +158,8 @@ class TransformPanel(QWidget):
         # Serbest açı döndürme
         angle_layout = QHBoxLayout()
         angle_label = QLabel("Açı:")
-        angle_label.setStyleSheet("font-size: 12px; min-width: 50px;")
+        angle_label.setObjectName("formLabel")
+        angle_label.setMinimumWidth(50)
         angle_layout.addWidget(angle_label)
 
         self._angle_spin = QDoubleSpinBox()
@@ -206,7 +209,7 @@ class TransformPanel(QWidget):
 
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
-        line.setStyleSheet("background-color: #21262d; max-height: 1px;")
+        line.setObjectName("sectionDivider")
         layout.addWidget(line)
 
     # ─── Olay Yöneticileri ────────────────────────────────────────────
@@ -253,19 +256,22 @@ class TransformPanel(QWidget):
         new_w = max(1, int(current_w * percentage / 100))
         new_h = max(1, int(current_h * percentage / 100))
 
-        self._updating_size = True
-        self._width_spin.setValue(new_w)
-        self._height_spin.setValue(new_h)
-        self._updating_size = False
+        self._set_size_silently(new_w, new_h)
+
+    def _set_size_silently(self, width: int, height: int):
+        """
+        Spin kutularını valueChanged yayınlamadan günceller; en-boy eşlemesi
+        ve olası dış dinleyiciler ara boyutları görmez.
+        """
+        with QSignalBlocker(self._width_spin), QSignalBlocker(self._height_spin):
+            self._width_spin.setValue(width)
+            self._height_spin.setValue(height)
 
     # ─── Public API ───────────────────────────────────────────────
 
     def update_image_size(self, width: int, height: int):
         """Mevcut görüntü boyutunu günceller."""
-        self._updating_size = True
-        self._width_spin.setValue(width)
-        self._height_spin.setValue(height)
-        self._updating_size = False
+        self._set_size_silently(width, height)
 
         if height > 0:
             self._aspect_ratio = width / height
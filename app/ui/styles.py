@@ -3,6 +3,10 @@ Uygulama Tema ve Stil Tanımları - Dark Theme QSS (Qt Style Sheet).
 Modern, profesyonel ve göz yormayan koyu tema.
 """
 
+import re
+
+from PySide6.QtGui import QColor, QPalette
+
 DARK_THEME_QSS = """
 /* ─── Genel Uygulama Stili ──────────────────────────────────── */
 QMainWindow {
@@ -129,10 +133,6 @@ QScrollBar::handle:vertical {
     min-height: 30px;
 }
 
-QScrollBar::handle:vertical:hover {
-    background-color: #484f58;
-}
-
 QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
     height: 0;
 }
@@ -149,7 +149,7 @@ QScrollBar::handle:horizontal {
     min-width: 30px;
 }
 
-QScrollBar::handle:horizontal:hover {
+QScrollBar::handle:vertical:hover, QScrollBar::handle:horizontal:hover {
     background-color: #484f58;
 }
 
@@ -189,12 +189,6 @@ QSlider::sub-page:horizontal {
     border-radius: 2px;
 }
 
-/* ─── Etiket ────────────────────────────────────────────────── */
-QLabel {
-    color: #e6edf3;
-    background: transparent;
-}
-
 /* ─── Düğme ─────────────────────────────────────────────────── */
 QPushButton {
     background-color: #21262d;
@@ -257,10 +251,6 @@ QComboBox {
     min-width: 100px;
 }
 
-QComboBox:hover {
-    border-color: #484f58;
-}
-
 QComboBox::drop-down {
     border: none;
     width: 24px;
@@ -283,7 +273,7 @@ QSpinBox, QDoubleSpinBox {
     padding: 6px 8px;
 }
 
-QSpinBox:hover, QDoubleSpinBox:hover {
+QComboBox:hover, QSpinBox:hover, QDoubleSpinBox:hover {
     border-color: #484f58;
 }
 
@@ -406,6 +396,53 @@ QLabel#valueLabel {
     min-width: 40px;
 }
 
+/* ─── Panel İçi Etiketler ve Ayırıcılar ─────────────────────── */
+/* Panel widget'ları kendi setStyleSheet çağrılarını yapmaz; her çağrı
+   ayrı bir QSS ayrıştırma ve polish turu demektir. */
+QFrame#sectionDivider {
+    background-color: #21262d;
+    max-height: 1px;
+}
+
+QLabel#sliderLabel {
+    font-size: 12px;
+    color: #c9d1d9;
+}
+
+QLabel#fieldLabel {
+    font-size: 12px;
+    color: #c9d1d9;
+    padding-top: 4px;
+}
+
+QLabel#formLabel {
+    font-size: 12px;
+}
+
+QLabel#hintLabel {
+    font-size: 11px;
+    color: #8b949e;
+}
+
+QFrame#infoBox {
+    background-color: #161b22;
+    border: 1px solid #21262d;
+    border-radius: 6px;
+    padding: 8px;
+}
+
+QLabel#infoTitle {
+    font-weight: 600;
+    font-size: 11px;
+    color: #58a6ff;
+}
+
+QLabel#infoText {
+    font-size: 11px;
+    color: #8b949e;
+    padding: 1px 0;
+}
+
 /* ─── Sağ Panel Arka Plan ───────────────────────────────────── */
 QWidget#sidePanel {
     background-color: #0d1117;
@@ -416,3 +453,53 @@ QWidget#canvasContainer {
     background-color: #010409;
 }
 """
+
+
+def _minify_qss(qss: str) -> str:
+    """
+    Yorumları ve gereksiz boşlukları atar. Qt'nin CSS ayrıştırıcısı daha
+    kısa bir metni tarar; okunabilir kaynak yukarıda korunur.
+    """
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    qss = re.sub(r"\s+", " ", qss)
+    qss = re.sub(r"\s*([{};,])\s*", r"\1", qss)
+    qss = re.sub(r":\s+", ":", qss)
+    return qss.replace(";}", "}").strip()
+
+
+# Uygulamaya verilen sıkıştırılmış tema (modül yüklenirken bir kez üretilir)
+DARK_THEME_QSS_MIN = _minify_qss(DARK_THEME_QSS)
+
+
+def build_dark_palette() -> QPalette:
+    """
+    Temanın renklerini taşıyan uygulama paleti. Durum renkleri QSS'te
+    kalır; palet, stil kuralı olmayan yerlerde (iletişim kutuları, dosya
+    seçici, metin seçimi, devre dışı metin) tema renklerinin kullanılmasını
+    ve bu widget'lar için ek QSS kuralı gerekmemesini sağlar.
+    """
+    palette = QPalette()
+    role = QPalette.ColorRole
+    for r, color in (
+        (role.Window, "#0d1117"),
+        (role.WindowText, "#e6edf3"),
+        (role.Base, "#161b22"),
+        (role.AlternateBase, "#21262d"),
+        (role.Text, "#e6edf3"),
+        (role.PlaceholderText, "#8b949e"),
+        (role.Button, "#21262d"),
+        (role.ButtonText, "#e6edf3"),
+        (role.BrightText, "#ffffff"),
+        (role.Highlight, "#1f6feb"),
+        (role.HighlightedText, "#ffffff"),
+        (role.ToolTipBase, "#1c2128"),
+        (role.ToolTipText, "#e6edf3"),
+        (role.Link, "#58a6ff"),
+        (role.Mid, "#30363d"),
+        (role.Dark, "#010409"),
+    ):
+        palette.setColor(r, QColor(color))
+    disabled = QPalette.ColorGroup.Disabled
+    for r in (role.WindowText, role.Text, role.ButtonText):
+        palette.setColor(disabled, r, QColor("#484f58"))
+    return palette
@@ -3,6 +3,9 @@ Uygulama genelinde kullanılan sabitler ve yapılandırma değerleri.
 Tüm sabit değerler merkezi olarak burada tanımlanır.
 """
 
+from collections import namedtuple
+from types import MappingProxyType
+
 # ─── Uygulama Bilgileri ───────────────────────────────────────────────
 APP_NAME = "PixelForge"
 APP_VERSION = "1.0.0"
@@ -12,11 +15,25 @@ APP_AUTHOR = "PixelForge Studio"
 # Gerçek zamanlı düzenleme için maksimum önizleme çözünürlüğü
 PREVIEW_MAX_WIDTH = 1920
 PREVIEW_MAX_HEIGHT = 1080
+# Slider sürüklenirken önizlemenin işlendiği ölçek (0.5 → ~4 kat az piksel)
+INTERACTIVE_PREVIEW_SCALE = 0.5
+
+# ─── Yükleme Sınırı ───────────────────────────────────────────────────
+# Bu megapikselin üzerindeki dosyalar için küçültülmüş yükleme önerilir
+MAX_IMAGE_MEGAPIXELS = 200
 
 # ─── Debounce Süresi (ms) ─────────────────────────────────────────────
 # Slider değişikliklerinde işleme gecikmesi (performans için)
 SLIDER_DEBOUNCE_MS = 60
 
+# İşlem maliyetine göre debounce süreleri: ucuz ayarlar hemen işlenir,
+# pahalı gürültü/filtre hesapları daha uzun süre birleştirilir
+PROCESSING_DEBOUNCE_MS = {
+    "fast":   0,
+    "medium": 80,
+    "slow":   250,
+}
+
 # ─── Geçmiş (Undo/Redo) ───────────────────────────────────────────────
 MAX_HISTORY_STATES = 30
 
@@ -34,21 +51,28 @@ SAVE_IMAGE_FORMATS = (
 
 # ─── Ayar (Adjustment) Aralıkları ─────────────────────────────────────
 # Her ayar parametresi: (minimum, maksimum, varsayılan, adım)
-ADJUSTMENT_RANGES = {
-    "brightness":  (-100, 100, 0, 1),
-    "contrast":    (-100, 100, 0, 1),
-    "saturation":  (-100, 100, 0, 1),
-    "hue":         (-180, 180, 0, 1),
-    "gamma":       (10, 300, 100, 1),      # Gerçek değer = slider / 100
-    "exposure":    (-300, 300, 0, 1),       # Gerçek değer = slider / 100
-    "temperature": (-100, 100, 0, 1),
-    "tint":        (-100, 100, 0, 1),
-    "highlights":  (-100, 100, 0, 1),
-    "shadows":     (-100, 100, 0, 1),
-    "clarity":     (-100, 100, 0, 1),
-    "vibrance":    (-100, 100, 0, 1),
-    "sharpness":   (0, 100, 0, 1),
-}
+AdjustmentRange = namedtuple("AdjustmentRange", "min max default step")
+
+ADJUSTMENT_RANGES = MappingProxyType({
+    "brightness":  AdjustmentRange(-100, 100, 0, 1),
+    "contrast":    AdjustmentRange(-100, 100, 0, 1),
+    "saturation":  AdjustmentRange(-100, 100, 0, 1),
+    "hue":         AdjustmentRange(-180, 180, 0, 1),
+    "gamma":       AdjustmentRange(10, 300, 100, 1),      # Gerçek değer = slider / 100
+    "exposure":    AdjustmentRange(-300, 300, 0, 1),       # Gerçek değer = slider / 100
+    "temperature": AdjustmentRange(-100, 100, 0, 1),
+    "tint":        AdjustmentRange(-100, 100, 0, 1),
+    "highlights":  AdjustmentRange(-100, 100, 0, 1),
+    "shadows":     AdjustmentRange(-100, 100, 0, 1),
+    "clarity":     AdjustmentRange(-100, 100, 0, 1),
+    "vibrance":    AdjustmentRange(-100, 100, 0, 1),
+    "sharpness":   AdjustmentRange(0, 100, 0, 1),
+})
+
+# Parametre → varsayılan değer (sıfırlama ve "bekleyen değişiklik" kontrolü)
+ADJUSTMENT_DEFAULTS = MappingProxyType(
+    {key: spec.default for key, spec in ADJUSTMENT_RANGES.items()}
+)
 
 # Ayar parametrelerinin Türkçe etiketleri
 ADJUSTMENT_LABELS = {
@@ -69,12 +93,15 @@ ADJUSTMENT_LABELS = {
 
 # ─── Filtre Tanımları ─────────────────────────────────────────────────
 # Her filtre: (anahtar, Türkçe etiket)
-FILTER_DEFINITIONS = [
+# Panel bölümlerine göre gruplanmış filtreler
+FILTER_DEFS_BLUR = (
     ("gaussian_blur",   "Gaussian Bulanıklık"),
     ("box_blur",        "Kutu Bulanıklık"),
     ("median_blur",     "Medyan Bulanıklık"),
     ("sharpen",         "Keskinleştirme"),
     ("unsharp_mask",    "Unsharp Mask"),
+)
+FILTER_DEFS_ARTISTIC = (
     ("edge_detect",     "Kenar Algılama"),
     ("emboss",          "Kabartma (Emboss)"),
     ("sepia",           "Sepya"),
@@ -83,15 +110,18 @@ FILTER_DEFINITIONS = [
     ("hdr_effect",      "HDR Efekti"),
     ("pencil_sketch",   "Kalem Çizimi"),
     ("oil_painting",    "Yağlıboya"),
+)
+FILTER_DEFS_COLOR = (
     ("pixelate",        "Pikselleştirme"),
     ("posterize",       "Posterize"),
     ("warm_filter",     "Sıcak Filtre"),
     ("cool_filter",     "Soğuk Filtre"),
     ("dramatic",        "Dramatik"),
-]
+)
+FILTER_DEFINITIONS = FILTER_DEFS_BLUR + FILTER_DEFS_ARTISTIC + FILTER_DEFS_COLOR
 
 # ─── Gürültü (Noise) Tanımları ────────────────────────────────────────
-NOISE_TYPES = [
+NOISE_TYPES = (
     ("gaussian",      "Gaussian Gürültü"),
     ("salt_pepper",   "Tuz & Biber"),
     ("poisson",       "Poisson Gürültü"),
@@ -99,16 +129,21 @@ NOISE_TYPES = [
     ("uniform",       "Düzgün (Uniform)"),
     ("film_grain",    "Film Grain"),
     ("color_noise",   "Renk Gürültüsü"),
-]
+)
 
 # ─── Yeniden Boyutlandırma İnterpolasyon Yöntemleri ───────────────────
-INTERPOLATION_METHODS = [
+INTERPOLATION_METHODS = (
     ("nearest",  "En Yakın Komşu (Nearest)"),
     ("bilinear", "Bilinear"),
     ("bicubic",  "Bicubic"),
     ("lanczos",  "Lanczos"),
     ("area",     "Alan (Area)"),
-]
+)
+
+# Yöntem anahtarı → açılır listedeki sıra
+INTERPOLATION_INDEX = MappingProxyType(
+    {key: index for index, (key, _) in enumerate(INTERPOLATION_METHODS)}
+)
 
 # ─── Renk Sabitleri ───────────────────────────────────────────────────
 CANVAS_BACKGROUND = "#1a1a2e"
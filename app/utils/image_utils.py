@@ -3,70 +3,139 @@ Görüntü dönüştürme ve yardımcı fonksiyonlar.
 OpenCV (BGR) ↔ QImage/QPixmap dönüşümleri burada yapılır.
 """
 
+import sys
+import weakref
+from functools import lru_cache
+
 import cv2
 import numpy as np
 from PySide6.QtGui import QImage, QPixmap
 
 
+# OpenCV'nin BGRA bayt sırası, little-endian makinelerde Qt'nin ARGB32
+# düzeniyle aynıdır; big-endian'da renk kanalı takası gerekir.
+_BGRA_NATIVE = sys.byteorder == "little"
+
+# Son önizlemeler: (weakref(kaynak), max_w, max_h, önizleme). Geri al/yinele
+# aynı geçmiş durumları arasında gidip geldiğinden, salt-okunur kaynaklar
+# için küçük bir kimlik önbelleği aynı küçültmenin tekrarını önler.
+_PREVIEW_CACHE_SIZE = 2
+_preview_cache: list[tuple] = []
+
+
 def numpy_to_qimage(img: np.ndarray) -> QImage:
     """
     NumPy dizisini (BGR veya BGRA) QImage nesnesine dönüştürür.
-    OpenCV BGR formatından Qt RGB formatına çevirir.
+    OpenCV BGR (ve little-endian'da BGRA) verisi Qt tarafından doğrudan
+    okunur; renk takası ve kopya yapılmaz. Dönen görüntü dizinin belleğini
+    paylaşır: PySide6 arabelleğe referansı, görüntünün (ve paylaşımlı
+    kopyalarının) verisi serbest kalana dek tutar. Kaynak dizi sonradan
+    yerinde değiştirilecekse çağıran .copy() almalıdır.
     """
     if img is None:
         return QImage()
 
-    # Gri tonlamalı görüntü kontrolü
-    if len(img.shape) == 2:
-        height, width = img.shape
-        bytes_per_line = width
-        return QImage(img.data, width, height, bytes_per_line, QImage.Format.Format_Grayscale8).copy()
+    height, width = img.shape[:2]
+    channels = img.shape[2] if img.ndim == 3 else 1
+
+    if channels == 4 and not _BGRA_NATIVE:
+        # BGRA → RGBA dönüşümü (yeni, bitişik dizi)
+        img = cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
+        fmt = QImage.Format.Format_RGBA8888
+    elif channels == 4:
+        fmt = QImage.Format.Format_ARGB32
+    elif channels == 3:
+        fmt = QImage.Format.Format_BGR888
+    else:
+        # Gri tonlamalı görüntü
+        fmt = QImage.Format.Format_Grayscale8
 
-    height, width, channels = img.shape
+    buffer = _row_buffer(img, width * channels)
+    if buffer is None:
+        img = np.ascontiguousarray(img)
+        buffer = img.data
+    return QImage(buffer, width, height, img.strides[0], fmt)
 
-    if channels == 4:
-        # BGRA → RGBA dönüşümü
-        rgba = cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
-        bytes_per_line = 4 * width
-        return QImage(rgba.data, width, height, bytes_per_line, QImage.Format.Format_RGBA8888).copy()
-    else:
-        # BGR → RGB dönüşümü
-        rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        bytes_per_line = 3 * width
-        return QImage(rgb.data, width, height, bytes_per_line, QImage.Format.Format_RGB888).copy()
+
+def _row_buffer(img: np.ndarray, row_bytes: int):
+    """
+    Satırları kendi içinde bitişik (satır aralığı serbest) bir uint8 dizinin
+    ilk pikselden son piksele uzanan düz görünümünü döndürür. Kırpılmış
+    görünümler böylece kopyalanmadan, satır adımı bytesPerLine olarak
+    verilerek Qt'ye aktarılır. Uygun değilse None döner.
+    """
+    if img.dtype != np.uint8 or img.size == 0:
+        return None
+    if img.flags.c_contiguous:
+        return img.data
+    inner = (img.strides[2], img.strides[1]) if img.ndim == 3 else (img.strides[1],)
+    expected = (1, img.shape[2]) if img.ndim == 3 else (1,)
+    if inner != expected or img.strides[0] < row_bytes:
+        return None
+    span = (img.shape[0] - 1) * img.strides[0] + row_bytes
+    return np.lib.stride_tricks.as_strided(img, shape=(span,), strides=(1,)).data
 
 
 def numpy_to_qpixmap(img: np.ndarray) -> QPixmap:
-    """NumPy dizisini doğrudan QPixmap'e dönüştürür."""
+    """NumPy dizisini doğrudan QPixmap'e dönüştürür (fromImage tek kopya alır)."""
     return QPixmap.fromImage(numpy_to_qimage(img))
 
 
 def qimage_to_numpy(qimg: QImage) -> np.ndarray:
-    """QImage nesnesini NumPy dizisine (BGR) dönüştürür."""
-    qimg = qimg.convertToFormat(QImage.Format.Format_RGB888)
+    """
+    QImage nesnesini NumPy dizisine (BGR) dönüştürür. Qt doğrudan BGR888'e
+    çevirir; ayrıca kanal takası yapılmaz. Satır dolgusu atılıp tek kopya
+    alınır (dönen dizi QImage belleğine bağlı kalmaz).
+    """
+    qimg = qimg.convertToFormat(QImage.Format.Format_BGR888)
     width = qimg.width()
     height = qimg.height()
     bytes_per_line = qimg.bytesPerLine()
 
-    ptr = qimg.bits()
+    ptr = qimg.constBits()
     arr = np.frombuffer(ptr, dtype=np.uint8).reshape((height, bytes_per_line))
-    arr = arr[:, :width * 3].reshape((height, width, 3))
-    return cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+    return arr[:, :width * 3].reshape((height, width, 3)).copy()
 
 
 def create_preview(img: np.ndarray, max_width: int = 1920, max_height: int = 1080) -> np.ndarray:
     """
     Performans için büyük görüntülerin önizleme boyutunda kopyasını oluşturur.
     En-boy oranı korunarak küçültme yapılır.
+
+    Salt-okunur kaynaklarda sonuç kimlik + hedef boyutla önbelleğe alınır ve
+    salt-okunur döner; aynı kaynak için tekrar küçültme yapılmaz.
     """
     if img is None:
         return None
 
+    cacheable = not img.flags.writeable
+    if cacheable:
+        for ref, cached_w, cached_h, preview in _preview_cache:
+            if ref() is img and cached_w == max_width and cached_h == max_height:
+                return preview
+
+    preview = _downscale(img, max_width, max_height)
+    if cacheable:
+        preview.flags.writeable = False
+        _preview_cache.insert(0, (weakref.ref(img), max_width, max_height, preview))
+        del _preview_cache[_PREVIEW_CACHE_SIZE:]
+    return preview
+
+
+def clear_preview_cache() -> None:
+    """Önizleme önbelleğini boşaltır (yeni belge yüklenirken)."""
+    _preview_cache.clear()
+
+
+def _downscale(img: np.ndarray, max_width: int, max_height: int) -> np.ndarray:
+    """Görüntüyü en-boy oranını koruyarak sınırlar içine küçültür."""
     h, w = img.shape[:2]
 
-    # Zaten yeterince küçükse kopyala ve döndür
+    # Zaten yeterince küçükse kaynağın kendisi önizlemedir. Salt-okunur
+    # kaynak (geçmiş durumu) değişemeyeceği için kopyalanmaz; yazılabilir
+    # kaynak ise sonradan değiştirilebileceğinden kopyalanır.
     if w <= max_width and h <= max_height:
-        return img.copy()
+        return img if not img.flags.writeable else img.copy()
 
     # Ölçek faktörünü hesapla (en-boy oranını koru)
     scale = min(max_width / w, max_height / h)
@@ -77,16 +146,25 @@ def create_preview(img: np.ndarray, max_width: int = 1920, max_height: int = 108
 
 
 def get_image_info(img: np.ndarray) -> dict:
-    """Görüntü hakkında temel bilgileri döndürür."""
+    """
+    Görüntü hakkında temel bilgileri döndürür.
+    Bilgiler yalnızca şekil ve dtype'a bağlı olduğundan biçimlenmiş metinler
+    bu anahtarla önbelleklenir; çağıran dönen sözlüğü serbestçe değiştirebilir.
+    """
     if img is None:
         return {}
+    return dict(_image_info(img.shape, img.dtype.str))
 
-    h, w = img.shape[:2]
-    channels = img.shape[2] if len(img.shape) == 3 else 1
-    dtype = img.dtype
+
+@lru_cache(maxsize=8)
+def _image_info(shape: tuple, dtype: str) -> tuple:
+    """get_image_info'nun önbellekli çekirdeği: (anahtar, değer) çiftleri."""
+    h, w = shape[:2]
+    channels = shape[2] if len(shape) == 3 else 1
+    dtype = np.dtype(dtype)
 
     # Dosya boyutunu tahmin et (sıkıştırılmamış)
-    size_bytes = img.nbytes
+    size_bytes = int(np.prod(shape)) * dtype.itemsize
     if size_bytes > 1024 * 1024:
         size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
     elif size_bytes > 1024:
@@ -94,11 +172,11 @@ def get_image_info(img: np.ndarray) -> dict:
     else:
         size_str = f"{size_bytes} B"
 
-    return {
-        "width": w,
-        "height": h,
-        "channels": channels,
-        "dtype": str(dtype),
-        "size": size_str,
-        "megapixels": f"{(w * h) / 1_000_000:.1f} MP",
-    }
+    return (
+        ("width", w),
+        ("height", h),
+        ("channels", channels),
+        ("dtype", str(dtype)),
+        ("size", size_str),
+        ("megapixels", f"{(w * h) / 1_000_000:.1f} MP"),
+    )
@@ -0,0 +1,137 @@
+"""
+Dosya G/Ç Worker'ı - Yükleme ve kaydetmeyi UI thread'i dışında çalıştırır.
+Büyük TIFF/PNG dosyalarının çözülmesi/kodlanması sırasında arayüz donmaz.
+İşler QThreadPool'a QRunnable olarak gönderilir; sonuçlar QObject köprüsü
+üzerinden sinyal ile (kuyruklu bağlantı) ana thread'e iletilir.
+Birden fazla dosya bırakıldığında geri kalanlar önceden çözülüp saklanır.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class _IoTask(QRunnable):
+    """Havuzda tek bir G/Ç işini çalıştırıp sonucu geri çağrıya veren iş."""
+
+    def __init__(self, fn: Callable[[], object], done: Callable[[object], None]):
+        super().__init__()
+        self._fn = fn
+        self._done = done
+
+    def run(self) -> None:
+        try:
+            result = self._fn()
+        except Exception:
+            result = None
+        self._done(result)
+
+
+class FileIoWorker(QObject):
+    """
+    Dosya yükleme/kaydetme işlerini thread havuzunda çalıştırır.
+
+    Sinyaller:
+        loaded(str, object): (dosya_yolu, çözülmüş görüntü veya None)
+        saved(str, bool): (dosya_yolu, başarılı mı)
+    """
+
+    loaded = Signal(str, object)
+    saved = Signal(str, bool)
+
+    # Önceden çözme için eşzamanlı iş sayısı
+    PREFETCH_WORKERS = 4
+    # Bir bırakmada önceden çözülecek en fazla dosya ve toplam çözülmüş
+    # boyut; büyük fotoğraf klasörleri belleği doldurmasın diye
+    PREFETCH_MAX_FILES = 3
+    PREFETCH_MAX_BYTES = 512 * 1024 * 1024
+
+    def __init__(self, pool: QThreadPool = None, parent=None):
+        super().__init__(parent)
+        self._pool = pool or QThreadPool.globalInstance()
+        self._prefetcher = ThreadPoolExecutor(
+            max_workers=self.PREFETCH_WORKERS, thread_name_prefix="prefetch"
+        )
+        # Son bırakılan dosyaların çözümleri: yol → Future[görüntü]
+        self._preloaded: dict[str, Future] = {}
+
+    def load(self, file_path: str,
+             decode: Callable[[str, int], np.ndarray], reduce: int = 1) -> None:
+        """
+        Dosyayı decode(yol, küçültme) ile arka planda çözer; bitince loaded
+        yayınlanır. Dosya tam boyutta önceden çözülmüşse sonuç beklemeden
+        (aynı thread'de) yayınlanır; küçültülmüş yüklemede önceden çözülmüş
+        tam boyutlu sonuç kullanılmaz. Kullanılan kayıt saklanmaz; önceden
+        çözülmemiş bir dosya açılınca son bırakmanın kayıtları bırakılır.
+        """
+        future = self._preloaded.pop(file_path, None) if reduce == 1 else None
+        if future is None:
+            self._drop_preloaded()
+        elif not future.cancelled():
+            future.add_done_callback(
+                lambda f: self.loaded.emit(
+                    file_path, None if f.exception() else f.result()
+                )
+            )
+            return
+        self._pool.start(_IoTask(
+            lambda: decode(file_path, reduce),
+            lambda image: self.loaded.emit(file_path, image),
+        ))
+
+    def prefetch(self, paths: Iterable[str],
+                 decode: Callable[[str], np.ndarray],
+                 decoded_size: Optional[Callable[[str], int]] = None) -> None:
+        """
+        Dosyaları arka planda tam boyutta çözüp saklar; daha sonra load()
+        ile açılınca G/Ç ve çözme maliyeti ödenmez. Sıradaki en fazla
+        PREFETCH_MAX_FILES dosya alınır. decoded_size(yol) çözülmüş boyutu
+        (bayt) tahmin ediyorsa toplam PREFETCH_MAX_BYTES'ı aşan ya da boyutu
+        bilinmeyen (0) dosyalar atlanır. Önceki bırakmanın kayıtları bellek
+        şişmesin diye yenileriyle değiştirilir.
+        """
+        selected = []
+        budget = self.PREFETCH_MAX_BYTES
+        for path in paths:
+            if len(selected) >= self.PREFETCH_MAX_FILES:
+                break
+            if decoded_size is not None:
+                size = decoded_size(path)
+                if size <= 0 or size > budget:
+                    continue
+                budget -= size
+            selected.append(path)
+
+        old = self._preloaded
+        self._preloaded = {}
+        for path in selected:
+            future = old.pop(path, None)
+            self._preloaded[path] = future or self._prefetcher.submit(decode, path)
+        for future in old.values():
+            future.cancel()
+
+    def _drop_preloaded(self) -> None:
+        """Önceden çözülmüş kayıtları bırakır, bekleyenleri iptal eder."""
+        preloaded, self._preloaded = self._preloaded, {}
+        for future in preloaded.values():
+            future.cancel()
+
+    def save(self, file_path: str, save: Callable[[], bool]) -> None:
+        """Kaydetme işini arka planda çalıştırır; bitince saved yayınlanır."""
+        # Dosya değişeceği için önceden çözülmüş hali artık geçersiz
+        self._preloaded.pop(file_path, None)
+        self._pool.start(_IoTask(
+            save,
+            lambda ok: self.saved.emit(file_path, bool(ok)),
+        ))
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """
+        Bekleyen tüm G/Ç işlerinin bitmesini bekler (kapanışta). Önceden
+        çözme işleri beklenmez, iptal edilir.
+        """
+        self._prefetcher.shutdown(wait=False, cancel_futures=True)
+        self._preloaded.clear()
+        return self._pool.waitForDone(msecs)
@@ -1,12 +1,26 @@
 """
 Arka Plan İşleme Worker'ı - UI'yı bloke etmeden görüntü işleme.
-QThread tabanlı çalışarak ana thread'in donmasını önler.
-Debounce mekanizması ile gereksiz işleme tekrarları engellenir.
+İşler özel bir QThreadPool'a QRunnable olarak gönderilir; havuz boşta
+kaldığında thread'ini bırakır, sürekli bekleyen bir thread tutulmaz.
+Eskiyen önizleme talepleri çalıştırılmadan atlanır.
 """
 
-import numpy as np
-from typing import Optional
-from PySide6.QtCore import QObject, Signal, Slot, QThread, QMutex, QWaitCondition
+from typing import Callable
+
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal
+
+from app.core.image_processor import PipelineCancelled
+
+
+class _Task(QRunnable):
+    """Havuzda tek bir işi çalıştıran iş."""
+
+    def __init__(self, fn: Callable[[], None]):
+        super().__init__()
+        self._fn = fn
+
+    def run(self) -> None:
+        self._fn()
 
 
 class ProcessingWorker(QObject):
@@ -16,106 +30,137 @@ class ProcessingWorker(QObject):
 
     Sinyaller:
         processing_started: İşleme başladığında tetiklenir
-        processing_finished: İşleme tamamlandığında (sonuç ile) tetiklenir
+        processing_finished: İşleme tamamlandığında (sonuç ve talep nesli ile)
+            tetiklenir
         error_occurred: Hata durumunda tetiklenir
+        transform_finished: Sıraya alınan bir dönüşüm bittiğinde (etiketi ile)
+            tetiklenir
+
+    Havuz tek thread ile sınırlıdır: ImageProcessor önbellekleri eşzamanlı
+    pipeline'lara karşı korunmaz, işler sırayla çalışır. Önizleme talepleri
+    "en son kazanır" mantığıyla birleştirilir (sırası gelen eski talep
+    çalışmadan döner); dönüşüm işleri (döndürme, boyutlandırma, çevirme) ise
+    kalıcı olduğundan hiçbiri atılmadan, yüksek öncelikle önizlemeden önce
+    çalıştırılır.
     """
 
     # Sinyaller (thread-safe iletişim için)
     processing_started = Signal()
-    processing_finished = Signal(np.ndarray)
+    # Sonuç dizisi PyObject olarak referansla iletilir (kopya/dönüşüm yok)
+    processing_finished = Signal(object, int)
     error_occurred = Signal(str)
+    transform_finished = Signal(object)
+
+    # Havuz kuyruğunda dönüşümler önizlemelerin önüne geçer
+    _TRANSFORM_PRIORITY = 1
+    _PREVIEW_PRIORITY = 0
 
     def __init__(self):
         super().__init__()
-        self._mutex = QMutex()
-        self._condition = QWaitCondition()
         self._processor = None      # ImageProcessor referansı
-        self._should_stop = False    # Durma bayrağı
-        self._has_task = False       # Bekleyen görev var mı
-        self._running = True         # Worker çalışıyor mu
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(1)
+        # Yoğun UI olayları altında önizleme işi aç kalmasın
+        self._pool.setThreadPriority(QThread.Priority.HighPriority)
+        self._latest = 0             # Son önizleme talebinin sıra numarası
+        self._stopped = False        # Durma bayrağı
 
     def set_processor(self, processor) -> None:
         """ImageProcessor referansını ayarlar."""
         self._processor = processor
 
-    @Slot()
-    def process(self) -> None:
+    def request_processing(self, generation: int = 0) -> None:
+        """
+        Yeni bir işleme görevi talep eder.
+        Henüz başlamamış önceki talep, sırası geldiğinde çalışmadan atlanır.
+        Nesil değeri sonuçla birlikte geri yayınlanır; UI eskimiş kareleri
+        bununla ayıklar.
         """
-        Worker'ın ana döngüsü. Thread başlatıldığında çalışır.
-        Görev gelene kadar bekler, görev gelince işler.
+        self._latest += 1
+        ticket = self._latest
+        self._pool.start(
+            _Task(lambda: self._run_preview(ticket, generation)),
+            self._PREVIEW_PRIORITY,
+        )
+
+    def request_transform(self, job: Callable[[], None], tag: object) -> None:
         """
-        while self._running:
-            self._mutex.lock()
-            # Görev yoksa bekle
-            while not self._has_task and self._running:
-                self._condition.wait(self._mutex)
-
-            if not self._running:
-                self._mutex.unlock()
-                break
-
-            self._has_task = False
-            self._mutex.unlock()
-
-            # Görüntü işleme
-            if self._processor is not None:
-                try:
-                    self.processing_started.emit()
-                    result = self._processor.process_preview()
-                    if result is not None and not self._should_stop:
-                        self.processing_finished.emit(result)
-                except Exception as e:
-                    self.error_occurred.emit(str(e))
-
-    def request_processing(self) -> None:
+        Bir dönüşüm işini sıraya ekler. İş havuz thread'inde çalışır ve
+        bitince transform_finished(tag) yayınlanır.
         """
-        Yeni bir işleme görevi talep eder.
-        Önceki bekleyen görev varsa yerine yenisi geçer (debounce).
+        self._pool.start(
+            _Task(lambda: self._run_transform(job, tag)),
+            self._TRANSFORM_PRIORITY,
+        )
+
+    def _run_preview(self, ticket: int, generation: int) -> None:
+        """Talep hâlâ en güncelse önizlemeyi işler (havuz thread'inde)."""
+        if ticket != self._latest or self._stopped or self._processor is None:
+            return
+        try:
+            self.processing_started.emit()
+            result = self._processor.process_preview(self._is_stopped)
+            if result is not None and not self._stopped:
+                self.processing_finished.emit(result, generation)
+        except PipelineCancelled:
+            return
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def _is_stopped(self) -> bool:
+        """Pipeline'ın aşamalar arasında sorduğu iptal denetimi."""
+        return self._stopped
+
+    def _run_transform(self, job: Callable[[], None], tag: object) -> None:
+        """Dönüşüm işini çalıştırır (havuz thread'inde)."""
+        error = None
+        try:
+            job()
+        except Exception as e:
+            error = str(e)
+        # Hata olsa da UI bekleyen iş sayacını ve görüntüyü eşitler
+        self.transform_finished.emit(tag)
+        if error is not None:
+            self.error_occurred.emit(error)
+
+    def stop(self, msecs: int = -1) -> bool:
         """
-        self._mutex.lock()
-        self._has_task = True
-        self._should_stop = False
-        self._condition.wakeOne()
-        self._mutex.unlock()
-
-    def stop(self) -> None:
-        """Worker'ı güvenli bir şekilde durdurur."""
-        self._mutex.lock()
-        self._running = False
-        self._should_stop = True
-        self._condition.wakeOne()
-        self._mutex.unlock()
+        Worker'ı güvenli bir şekilde durdurur: başlamamış işler atılır,
+        süren önizleme bir sonraki aşama sınırında kesilir, süren dönüşüm
+        (kalıcı olduğundan) beklenir.
+        """
+        self._stopped = True
+        self._pool.clear()
+        return self._pool.waitForDone(msecs)
 
 
 class ProcessingThread:
     """
-    Worker ve QThread'i yöneten yüksek seviye sınıf.
-    Worker'ın yaşam döngüsünü (başlatma, durdurma) kapsüller.
+    Worker'ın yaşam döngüsünü (başlatma, durdurma) kapsülleyen yüksek
+    seviye sınıf.
     """
 
     def __init__(self):
-        self._thread = QThread()
         self._worker = ProcessingWorker()
-        # Worker'ı ayrı thread'e taşı
-        self._worker.moveToThread(self._thread)
-        # Thread başladığında worker'ın process metodunu çalıştır
-        self._thread.started.connect(self._worker.process)
 
     @property
     def worker(self) -> ProcessingWorker:
         return self._worker
 
     def start(self) -> None:
-        """Thread'i başlatır."""
-        if not self._thread.isRunning():
-            self._thread.start()
+        """
+        Worker'ı kullanıma hazırlar. Havuz thread'i ilk işle birlikte
+        oluşturulur; ayrıca başlatılacak bir döngü yoktur.
+        """
 
     def stop(self) -> None:
-        """Thread'i güvenli şekilde durdurur ve temizler."""
-        self._worker.stop()
-        self._thread.quit()
-        self._thread.wait(3000)  # Maksimum 3 saniye bekle
-
-    def request_processing(self) -> None:
-        """İşleme talebi gönderir."""
-        self._worker.request_processing()
+        """Worker'ı güvenli şekilde durdurur ve temizler."""
+        self._worker.stop(3000)  # Maksimum 3 saniye bekle
+
+    def request_processing(self, generation: int = 0) -> None:
+        """İşleme talebi gönderir (nesil, sonuçla geri döner)."""
+        self._worker.request_processing(generation)
+
+    def request_transform(self, job: Callable[[], None], tag: object) -> None:
+        """Dönüşüm işini worker sırasına ekler."""
+        self._worker.request_transform(job, tag)
@@ -19,23 +19,22 @@ import os
 # Modül yolunu ayarla (proje kök dizininden çalışması için)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Yüksek DPI ölçekleme desteği: Qt bu değişkeni platform eklentisi
+# yüklenirken okur, bu yüzden Qt içe aktarılmadan önce ayarlanır.
+# Kullanıcının kendi ortam ayarı korunur.
+os.environ.setdefault("QT_SCALE_FACTOR_ROUNDING_POLICY", "PassThrough")
+
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 from app.ui.main_window import MainWindow
-from app.ui.styles import DARK_THEME_QSS
+from app.ui.styles import DARK_THEME_QSS_MIN, build_dark_palette
 from app.utils.constants import APP_NAME, APP_VERSION
 
 
 def main():
     """Uygulamayı başlatır ve ana döngüyü çalıştırır."""
 
-    # Yüksek DPI ölçekleme desteği
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
-
     app = QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
     app.setApplicationVersion(APP_VERSION)
@@ -46,8 +45,9 @@ def main():
     font.setHintingPreference(QFont.HintingPreference.PreferNoHinting)
     app.setFont(font)
 
-    # Dark theme stil dosyasını uygula
-    app.setStyleSheet(DARK_THEME_QSS)
+    # Dark theme: renkler paletten, biçim ve durum kuralları QSS'ten gelir
+    app.setPalette(build_dark_palette())
+    app.setStyleSheet(DARK_THEME_QSS_MIN)
 
     # Ana pencereyi oluştur ve göster
     window = MainWindow()